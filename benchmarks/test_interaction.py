@@ -4,8 +4,9 @@
 
 The latency-sensitive paths a user actually feels: a keystroke reaching the
 focused component, arrow keys recomputing focus from live geometry, reactive
-hooks firing on a state transition, a form being filled and submitted, and a
-searchable list re-filtering on every character.
+hooks firing on a state transition, a form being filled and submitted, a
+searchable list re-filtering on every character, and the mouse hovering across
+a board of hit regions.
 
 Each measured callable resets the state it mutates, because CodSpeed calls it
 more than once per benchmark.
@@ -19,7 +20,7 @@ from xnano.components.button import Button
 from xnano.components.input import Input
 from xnano.components.options import Options
 from xnano.core import Runtime
-from xnano.events import Event, KeyboardEventData
+from xnano.events import Event, KeyboardEventData, MouseEventData
 from xnano.fields import Field
 from xnano.grids import BaseGrid
 from xnano.state import State
@@ -95,6 +96,32 @@ class Picker(BaseGrid):
     )
 
 
+class BoardRow(BaseGrid, direction="horizontal"):
+    """Eight focusable cells in one row."""
+
+    a: Input = Field(default_factory=Input, group="a")
+    b: Input = Field(default_factory=Input, group="b")
+    c: Input = Field(default_factory=Input, group="c")
+    d: Input = Field(default_factory=Input, group="d")
+    e: Input = Field(default_factory=Input, group="e")
+    f: Input = Field(default_factory=Input, group="f")
+    g: Input = Field(default_factory=Input, group="g")
+    h: Input = Field(default_factory=Input, group="h")
+
+
+class Board(BaseGrid, direction="vertical"):
+    """Eight rows of eight cells: 64 hit regions across nested grids."""
+
+    r1: BoardRow = Field(default_factory=BoardRow)
+    r2: BoardRow = Field(default_factory=BoardRow)
+    r3: BoardRow = Field(default_factory=BoardRow)
+    r4: BoardRow = Field(default_factory=BoardRow)
+    r5: BoardRow = Field(default_factory=BoardRow)
+    r6: BoardRow = Field(default_factory=BoardRow)
+    r7: BoardRow = Field(default_factory=BoardRow)
+    r8: BoardRow = Field(default_factory=BoardRow)
+
+
 def _keyboard_actions(text: str) -> list[Action]:
     """Build one keyboard action per character of ``text``."""
     return [
@@ -168,6 +195,12 @@ def _search(runtime: Runtime, picker: Picker, keys: list[Action]) -> object:
     return picker.picker.filtered
 
 
+def _hover(runtime: Runtime, moves: list[Event]) -> None:
+    """Sweep the pointer across the board."""
+    for event in moves:
+        runtime.dispatch(event)
+
+
 def test_typing_into_input(benchmark) -> None:
     """Per-keystroke dispatch down to the focused component."""
     editor = Editor()
@@ -239,3 +272,19 @@ def test_options_search(benchmark) -> None:
         assert 0 < len(matched) < len(_OPTION_ITEMS)
     finally:
         runtime.close()
+
+
+def test_hover_across_board(benchmark) -> None:
+    """Hit-testing every hover move against a board of nested hit regions."""
+    board = Board()
+    runtime = _offscreen(board, 120, 40)
+    moves = [
+        Event.from_data(MouseEventData(kind="move", x=x, y=y))
+        for y in range(0, 40, 3)
+        for x in range(0, 120, 7)
+    ]
+    try:
+        benchmark(_hover, runtime, moves)
+        assert runtime._field_hit_at(60, 20) is not None
+    finally:
+        runtime.close()
@@ -23,7 +23,7 @@ from xnano.components.table import Table
 from xnano.components.text import Text
 from xnano.core import Runtime
 from xnano.core.demo import Showcase
-from xnano.core.rendering import lower_content
+from xnano.core.rendering import lower_content, lowering_cache
 from xnano.fields import Field
 from xnano.grids import BaseGrid
 from xnano.markdown import render_markdown
@@ -33,6 +33,8 @@ from xnano.types import Area
 
 _REGIONS = ("us-east", "eu-west", "ap-south")
 
+_HEAT = ("#1d3557", "#457b9d", "#a8dadc", "#f1faee", "#e63946")
+
 _ROWS = [
     {
         "service": f"svc-{index}",
@@ -99,6 +101,15 @@ class Nested(BaseGrid, direction="vertical"):
     fourth: Row = Field(default_factory=Row)
 
 
+_LOG = "\n".join(f"{index:>6} GET /api/items 200" for index in range(100_000))
+
+
+class Log(BaseGrid):
+    """A 100k-line log in a scroll field."""
+
+    body: str = Field(default=_LOG, scroll=True)
+
+
 def _offscreen(root: object, width: int, height: int) -> Runtime:
     """Open an offscreen runtime with ``root`` mounted and first frame drawn."""
     runtime = Runtime.offscreen(width, height)
@@ -123,8 +134,36 @@ def _tick_and_render(runtime: Runtime) -> object:
     return runtime.render()
 
 
+def _paint_heatmap(runtime: Runtime) -> object:
+    """Paint every cell through the stage, then render one frame."""
+    width, height = runtime.size
+    stage = runtime.stage
+    for y in range(height):
+        for x in range(width):
+            stage.paint_cell(
+                x, y, " ", background=_HEAT[(x // 8 + y // 4) % len(_HEAT)]
+            )
+    return runtime.render()
+
+
+def _scroll_and_render(runtime: Runtime, log: Log) -> object:
+    """Move a large log's scroll window by one row, then render."""
+    log._grid_scroll_handle("body").scroll(1)
+    return runtime.render()
+
+
+def _tick_frames(runtime: Runtime, frames: int) -> float:
+    """Render ``frames`` animated frames; return the lowering hit rate."""
+    lowering_cache.clear()
+    for _ in range(frames):
+        runtime.perform(Action.tick(66))
+        runtime.render()
+    return lowering_cache.hits / (lowering_cache.hits + lowering_cache.misses)
+
+
 def _lower(node: object) -> object:
     """Lower a python content tree into the native render ir."""
+    lowering_cache.clear()
     return lower_content(node)
 
 
@@ -181,6 +220,33 @@ def test_lower_content_table(benchmark) -> None:
     assert lowered is not None
 
 
+def test_lower_content_table_cached(benchmark) -> None:
+    """The same table returned unchanged, replayed from the lowering cache."""
+    context = ComponentRenderContext(area=Area(x=0, y=0, width=80, height=24))
+    node = Table(data=_ROWS, selected=3).compose(context)
+    lower_content(node)
+    lowered = benchmark(lower_content, node)
+    assert lowered is not None
+
+
+def test_showcase_lowering_hit_rate(benchmark) -> None:
+    """Thirty animated demo frames against the default lowering cache.
+
+    Most content a frame lowers is equal to last frame's; the animated
+    gauges are not. Hits level off at about four lookups in five from 16
+    entries up, so the default ``capacity`` of 32 leaves headroom, and a
+    larger cache hits no more often and only keeps more values alive.
+    """
+    runtime = _offscreen(Showcase(), 120, 40)
+    try:
+        hit_rate = benchmark(_tick_frames, runtime, 30)
+        benchmark.extra_info["hit_rate"] = hit_rate
+        assert hit_rate > 0.75
+        assert len(lowering_cache) <= lowering_cache.capacity
+    finally:
+        runtime.close()
+
+
 def test_dashboard_frame(benchmark, dashboard_runtime) -> None:
     """The headline end-to-end frame: layout, paint and serialization."""
     frame = benchmark(_render_frame, dashboard_runtime)
@@ -192,6 +258,23 @@ def test_dashboard_paint(benchmark, dashboard_runtime) -> None:
     benchmark(_paint_frame, dashboard_runtime)
 
 
+def test_stage_heatmap_frame(benchmark, nested_runtime) -> None:
+    """Three thousand stage cell writes batched into overlay canvases."""
+    frame = benchmark(_paint_heatmap, nested_runtime)
+    assert frame.width == 100
+
+
+def test_scrolled_log_frame(benchmark) -> None:
+    """A frame of a 100k-line scroll field, windowed by its line index."""
+    log = Log()
+    runtime = _offscreen(log, 80, 24)
+    try:
+        frame = benchmark(_scroll_and_render, runtime, log)
+        assert "GET /api/items" in frame.text
+    finally:
+        runtime.close()
+
+
 def test_nested_grid_frame(benchmark, nested_runtime) -> None:
     """Recursive slot resolution without a heavy component payload."""
     frame = benchmark(_render_frame, nested_runtime)
@@ -0,0 +1,59 @@
+"""benchmarks.test_replay
+
+---
+
+Replay of a recorded session: a burst of typing, a focus move, and ticks
+captured once with ``Runtime.start_recording()`` and fed back through a
+fresh offscreen runtime, painting at every recorded frame. This is the
+end-to-end number a recording guards — dispatch, hooks, layout, lowering, and
+native render per frame — with frame digests checked so a regression that
+changes the screen fails rather than silently getting faster.
+"""
+
+from __future__ import annotations
+
+from xnano.actions import Action
+from xnano.components.input import Input
+from xnano.core import Runtime
+from xnano.core.recording import Recording, replay
+from xnano.fields import Field
+from xnano.grids import BaseGrid
+
+_TYPED = "replayed keystrokes"
+
+
+class Form(BaseGrid, direction="vertical"):
+    """Two stacked inputs, the first focused."""
+
+    name: Input = Field(
+        default_factory=Input, group="name", autofocus=True, height=1
+    )
+    email: Input = Field(default_factory=Input, group="email", height=1)
+
+
+def _record() -> Recording:
+    """Record typing into both inputs with a frame after every pump."""
+    runtime = Runtime.offscreen(60, 6)
+    recorder = runtime.start_recording()
+    try:
+        runtime.set_root(Form())
+        runtime.render()
+        for field in range(2):
+            for character in _TYPED:
+                runtime.perform(
+                    Action.keyboard("space" if character == " " else character)
+                )
+                runtime.pump()
+                runtime.render()
+            if not field:
+                runtime.perform(Action.keyboard("tab"))
+    finally:
+        runtime.close()
+    return recorder.recording
+
+
+def test_replay_recorded_session(benchmark) -> None:
+    """A full recorded session, frame digests checked."""
+    recording = _record()
+    report = benchmark(replay, recording, Form, check_frames=True)
+    assert report.frames == recording.frames
@@ -340,6 +340,33 @@ def test_terminal_aspect_mode_uses_source_width() -> None:
     assert canvas.width == 4
 
 
+def test_reused_canvas_hits_the_lowering_cache_without_hashing(
+    monkeypatch,
+) -> None:
+    from xnano.core import rendering
+
+    cache = rendering.LoweringCache()
+    monkeypatch.setattr(rendering, "lowering_cache", cache)
+    hashed: list[CellCanvas] = []
+    canvas_hash = CellCanvas.__hash__
+
+    def counting_hash(canvas: CellCanvas) -> int:
+        hashed.append(canvas)
+        return canvas_hash(canvas)
+
+    monkeypatch.setattr(CellCanvas, "__hash__", counting_hash)
+    image = Image(
+        source=ImageData(
+            width=2,
+            height=2,
+            frames=(ImageFrame(bytes((255, 0, 0) * 4), 40),),
+        )
+    )
+    for _ in range(3):
+        rendering.lower_content(image.compose(_ctx(2, 1)))
+    assert (cache.hits, cache.misses, len(hashed)) == (2, 1, 1)
+
+
 def test_runtime_offscreen_render_smoke() -> None:
     pixels = bytes([0, 255, 0] * 8)
     image = Image(
@@ -39,7 +39,7 @@ from xnano.core.content import (
     TableRow,
     TextBlock,
 )
-from xnano.core.rendering import lower_content
+from xnano.core.rendering import LoweringCache, lower_content
 from xnano.core.runtime import Runtime
 from xnano.fields import Field
 from xnano.grids import BaseGrid
@@ -257,3 +257,37 @@ def test_grid_mixes_fixed_percent_ratio_fit_and_flexible_fields() -> None:
         value in text
         for value in ("Overview", "No alerts", "Jobs", "Detail", "Ready")
     )
+
+
+def test_lowering_cache_replays_equal_content(monkeypatch) -> None:
+    from xnano.core import rendering
+
+    cache = LoweringCache(capacity=2)
+    monkeypatch.setattr(rendering, "lowering_cache", cache)
+    table = TableGrid(rows=(TableRow(cells=("a", "b")),))
+    lower_content(table)
+    lower_content(table)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+    lower_content(TableGrid(rows=(TableRow(cells=("a", "b")),)))
+    lower_content("plain")
+    lower_content("plain")
+    assert (cache.hits, cache.misses, len(cache)) == (3, 2, 2)
+
+    lower_content(Items(items=["unhashable"]))
+    assert (cache.hits, cache.misses, len(cache)) == (3, 3, 2)
+    gauge = Gauge(progress=0.5)
+    lower_content(gauge)
+    lower_content(gauge)
+    lower_content(TableGrid(rows=(TableRow(cells=("a", "c")),)))
+    assert (cache.hits, cache.misses, len(cache)) == (4, 5, 2)
+
+    cache.capacity = 0
+    lower_content(table)
+    assert len(cache) == 0
+    cache.clear()
+    assert (cache.hits, cache.misses) == (0, 0)
+
+    session = CoreSession.offscreen(10, 1)
+    session.render(lower_content(Items(items=["unhashable"])))
+    assert "unhashable" in session.buffer_snapshot().to_string_lines()[0]
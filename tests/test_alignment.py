@@ -205,6 +205,37 @@ def test_wrapped_text_measures_its_real_row_count() -> None:
     assert wrapped_line_count("anything", 0) == 1
 
 
+def test_wide_text_measures_display_cells() -> None:
+    """CJK and emoji take two cells each in every layout measurement."""
+    from xnano.core.controller import (
+        content_scroll_extent,
+        window_scroll_value,
+        wrapped_line_count,
+    )
+    from xnano.utils.measure import cell_width, graphemes, text_size
+
+    assert cell_width("日本語") == 6 and cell_width("👨‍👩‍👧") == 2
+    assert graphemes("a👍🏽🇯🇵") == ["a", "👍🏽", "🇯🇵"]
+    assert text_size("日本\nabc") == (4, 2)
+    assert wrapped_line_count("日本語 日本語 日本語", 8) == 3
+    assert wrapped_line_count("日本語日本語", 4) == 3
+    assert content_scroll_extent("日本語\nab", "x") == 6
+    assert window_scroll_value("日本語", 2, "x") == "本語"
+    assert window_scroll_value("日本語", 1, "x") == " 本語"
+
+    class App(BaseGrid, direction="horizontal"):
+        label: str = Field(default="日本語", width="fit")
+        rest: str = Field(default="|")
+
+    terminal = Terminal.offscreen(cols=12, rows=1)
+    try:
+        terminal.attach_grid(App())
+        # Frame text shows each wide glyph's trailing cell as a space.
+        assert terminal.render().text.rstrip() == "日 本 語 |"
+    finally:
+        terminal.close()
+
+
 def test_vertical_align_accounts_for_wrapping() -> None:
     text = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do"
 
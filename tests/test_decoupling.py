@@ -56,6 +56,7 @@ _ALLOWED_ROOTS = frozenset(
         "string",
         "struct",
         "hashlib",
+        "heapq",
         "base64",
         "colorsys",
         "unicodedata",
@@ -70,6 +71,7 @@ _ALLOWED_ROOTS = frozenset(
         "multiprocessing",
         "subprocess",
         "socket",
+        "select",
         "ssl",
         "email",
         "mimetypes",
@@ -10,6 +10,7 @@ from xnano.events import (
     MouseEventData,
     ResizeEventData,
     TickEventData,
+    binding_index_keys,
     normalize_keyboard_binding,
 )
 
@@ -68,3 +69,14 @@ def test_uniform_event_accessors_across_user_input_types() -> None:
     assert tick.tick_event.elapsed_ms == 16
     assert tick.keyboard_event is None
     assert tick.keyboard_modifiers == []
+
+
+def test_binding_index_keys_cover_synthetic_and_native_aliases() -> None:
+    assert binding_index_keys("ctrl+s") == {(frozenset({"ctrl"}), "s")}
+    assert binding_index_keys("Esc") == {(frozenset(), "escape")}
+    assert binding_index_keys("control+page_up") == {
+        (frozenset(), "page_up"),
+        (frozenset({"ctrl"}), "pageup"),
+    }
+    event = KeyboardEventData.from_binding("ctrl+S")
+    assert event._index_key() in binding_index_keys("ctrl+s")
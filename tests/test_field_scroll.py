@@ -93,3 +93,62 @@ def test_mouse_wheel_moves_scroll() -> None:
         assert "line9" in wheeled
     finally:
         runtime.close()
+
+
+def test_scroll_windows_large_text_through_a_cached_line_index() -> None:
+    from xnano.core import controller
+    from xnano.core.controller import (
+        content_scroll_extent,
+        window_scroll_value,
+    )
+
+    log = "\n".join(f"entry {i}" for i in range(100_000))
+    assert content_scroll_extent(log, "y") == 100_000
+    assert content_scroll_extent(log, "x") == len("entry 99999")
+    assert window_scroll_value(log, 500, "y", rows=3) == (
+        "entry 500\nentry 501\nentry 502"
+    )
+    assert window_scroll_value(log, 99_999, "y", rows=3) == "entry 99999"
+    assert window_scroll_value(log, 6, "x", rows=2) == "0\n1"
+    assert window_scroll_value("a\nb", 0, "y", rows=5) == "a\nb"
+    assert controller._line_index(log) is controller._line_index(log)
+
+    class App(BaseGrid):
+        body: str = Field(default=log, height=5, scroll=True)
+
+    runtime = Runtime.offscreen(20, 5)
+    try:
+        app = App()
+        runtime.set_root(app)
+        assert runtime.render().text.split()[:2] == ["entry", "0"]
+        app._grid_scroll_handle("body").scroll_to_end()
+        tail = runtime.render().text
+        assert "entry 99999" in tail and "entry 99994" not in tail
+    finally:
+        runtime.close()
+
+
+def test_an_appending_log_keeps_memory_flat() -> None:
+    import tracemalloc
+
+    class App(BaseGrid):
+        body: str = Field(default="", scroll=True)
+
+    lines = [f"{i:>6} GET /api/items 200" for i in range(20_000)]
+    runtime = Runtime.offscreen(40, 5)
+    tracemalloc.start()
+    try:
+        app = App()
+        runtime.set_root(app)
+        held = []
+        for step in range(30):
+            lines.append(f"{step:>6} POST /api/items 201")
+            app.body = "\n".join(lines)
+            runtime.render()
+            if step in (9, 29):
+                held.append(tracemalloc.get_traced_memory()[0])
+        # Twenty more ~0.6 MB copies would grow it by tens of megabytes.
+        assert held[1] - held[0] < 4_000_000
+    finally:
+        tracemalloc.stop()
+        runtime.close()
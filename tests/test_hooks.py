@@ -76,3 +76,81 @@ def test_on_action_uses_hook_markers() -> None:
         ("escape",),
         None,
     )
+
+
+def test_hook_tables_bucket_hooks_by_trigger_once_per_class() -> None:
+    from xnano.core.dispatch import _hook_table
+
+    class Base(BaseGrid):
+        @hooks.on_keyboard("q")
+        def quit(self) -> None:
+            pass
+
+        @hooks.on_tick
+        def step(self) -> None:
+            pass
+
+    class App(Base):
+        @hooks.on_event
+        def any_event(self) -> None:
+            pass
+
+        @hooks.on_poll("frame")
+        def poll_frame(self) -> None:
+            pass
+
+        def step(self) -> None:
+            pass
+
+    table = _hook_table(App)
+    assert _hook_table(App) is table
+    assert [hook.name for hook in table["keyboard"]] == ["any_event", "quit"]
+    assert [hook.name for hook in table["tick"]] == ["any_event"]
+    assert [hook.name for hook in table["other"]] == ["any_event"]
+    assert [hook.name for hook in table["frame"]] == ["poll_frame"]
+    assert table["keyboard"][1].filters == (("q",), None)
+    assert [hook.name for hook in _hook_table(Base)["tick"]] == ["step"]
+
+
+def test_keyboard_hooks_resolve_by_binding_index() -> None:
+    from xnano.core import Runtime
+    from xnano.core.dispatch import _keyboard_index
+
+    fired: list[str] = []
+
+    class App(BaseGrid):
+        @hooks.on_keyboard(*(f"ctrl+{key}" for key in "abcdefgh"), "esc")
+        def keymap(self) -> None:
+            fired.append("keymap")
+
+        @hooks.on_keyboard("shift", "x")
+        def shifted(self) -> None:
+            fired.append("shifted")
+
+        @hooks.on_keyboard
+        def any_key(self) -> None:
+            fired.append("any_key")
+
+    keyed, loose = _keyboard_index(App)
+    ctrl_c = keyed[(frozenset({"ctrl"}), "c")]
+    assert [hook.name for hook in ctrl_c] == ["keymap", "shifted", "any_key"]
+    assert ctrl_c[0].filters == (("ctrl+c",), None)
+    assert [hook.name for hook in loose] == ["shifted", "any_key"]
+
+    runtime = Runtime.offscreen(20, 2)
+    try:
+        runtime.set_root(App())
+        runtime.perform(Action.keyboard("ctrl+d"))
+        runtime.perform(Action.keyboard("escape"))
+        runtime.perform(Action.keyboard("x"))
+        runtime.perform(Action.keyboard("shift"))
+        runtime.perform(Action.keyboard("q"))
+    finally:
+        runtime.close()
+    assert fired == [
+        *("keymap", "any_key"),
+        *("keymap", "any_key"),
+        *("shifted", "any_key"),
+        *("shifted", "any_key"),
+        "any_key",
+    ]
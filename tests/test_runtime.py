@@ -192,6 +192,77 @@ def test_live_runtime_pump_uses_bounded_poll_and_ticks(
     assert runtime._root.ticked is True
 
 
+def test_interval_tick_hooks_fire_from_a_deadline_heap(monkeypatch) -> None:
+    import math
+
+    from xnano import hooks
+    from xnano.core.dispatch import next_tick_deadline
+    from xnano.grids import BaseGrid
+
+    class Session:
+        timeout_ms: int | None = None
+
+        def poll_event(self, timeout_ms: int):
+            self.timeout_ms = timeout_ms
+            return None
+
+        def is_animating(self) -> bool:
+            return False
+
+    class App(BaseGrid):
+        fast: int = 0
+        slow: int = 0
+
+        @hooks.on_tick(100)
+        def step_fast(self) -> None:
+            self.fast += 1
+
+        @hooks.on_tick(1000)
+        def step_slow(self) -> None:
+            self.slow += 1
+
+    now = [100.0]
+    monkeypatch.setattr(
+        xnano.core.runtime.time,
+        "monotonic",
+        lambda: now[0],
+    )
+    session = Session()
+    runtime = Runtime(
+        session,  # ty: ignore[invalid-argument-type]
+        live=True,
+        tick_interval=16,
+        render_on_demand=True,
+    )
+    app = App()
+    runtime.set_root(app)
+    assert next_tick_deadline(runtime) == 100
+    now[0] += 0.05
+    runtime.pump()
+    assert session.timeout_ms == 50
+    assert (app.fast, app.slow) == (0, 0)
+    now[0] += 0.05
+    runtime.pump()
+    assert (app.fast, app.slow) == (1, 0)
+    assert next_tick_deadline(runtime) == 200
+    now[0] += 0.9
+    runtime.pump()
+    assert (app.fast, app.slow) == (2, 1)
+    assert next_tick_deadline(runtime) == 1100
+
+    class Idle(BaseGrid):
+        @hooks.on_tick
+        def every(self) -> None:
+            pass
+
+    runtime.set_root(Idle())
+    assert next_tick_deadline(runtime) is None
+    runtime.set_root(BaseGrid())
+    assert next_tick_deadline(runtime) == math.inf
+    runtime.pump()
+    assert session.timeout_ms == runtime._IDLE_WAIT_MS
+
+
 def test_runtime_focus_api() -> None:
     from xnano.components.text import Text
     from xnano.fields import Field
@@ -434,3 +505,909 @@ def test_atexit_restore_closes_active_live_runtime() -> None:
     # this runtime).
     assert runtime._closed is True
     assert _ACTIVE_RUNTIME.get() is not runtime
+
+
+def test_render_on_demand_tracks_frame_requests() -> None:
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid):
+        label: str = Field(default="a")
+
+    runtime = Runtime.offscreen(20, 3, render_on_demand=True)
+    try:
+        app = App()
+        runtime.set_root(app)
+        assert runtime.render_on_demand is True
+        assert runtime._render_due() is True
+        runtime.render()
+        assert runtime._render_due() is False
+        runtime.pump()
+        assert runtime._render_due() is False
+        app.label = "b"
+        assert runtime._render_due() is True
+        runtime.render()
+        runtime.call_soon(lambda: None)
+        runtime.pump()
+        assert runtime._render_due() is True
+        runtime.render()
+        runtime.request_render()
+        assert runtime._render_due() is True
+    finally:
+        runtime.close()
+
+
+class _PasteEvent:
+    """Stand-in for a native paste ``CoreEvent``."""
+
+    paste = "x"
+
+    def kind_str(self) -> str:
+        return "paste"
+
+
+class _QueuedSession:
+    """Offscreen session whose ``poll_event`` replays a fixed queue."""
+
+    def __init__(self, events: list) -> None:
+        from xnano_core.core import CoreSession
+
+        self.events = list(events)
+        self.inner = CoreSession.offscreen(20, 3)
+
+    def poll_event(self, timeout_ms: int):
+        return self.events.pop(0) if self.events else None
+
+    def __getattr__(self, name: str):
+        return getattr(self.inner, name)
+
+
+def test_drain_events_folds_pending_input_into_one_frame() -> None:
+    from xnano import hooks
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid):
+        pastes: int = 0
+
+        @hooks.on_clipboard
+        def pasted(self) -> None:
+            self.pastes += 1
+
+    for drain, expected in ((False, 1), (True, 3)):
+        runtime = Runtime(
+            _QueuedSession(  # ty: ignore[invalid-argument-type]
+                [_PasteEvent(), _PasteEvent(), _PasteEvent()]
+            ),
+            live=False,
+            drain_events=drain,
+        ).enter()
+        try:
+            app = App()
+            runtime.set_root(app)
+            runtime.render()
+            runtime.pump()
+            assert app.pastes == expected
+            runtime.render()
+            assert runtime.frame_event_count == expected
+        finally:
+            runtime.close()
+
+
+class _NativeMouse:
+    def __init__(self, kind: str, x: int, y: int) -> None:
+        self.kind, self.x, self.y = kind, x, y
+
+    def xnano_kind_str(self) -> str:
+        return self.kind
+
+    def xnano_button_str(self) -> str:
+        return "none"
+
+
+class _MouseEvent:
+    """Stand-in for a native mouse ``CoreEvent``."""
+
+    def __init__(self, kind: str, x: int = 1, y: int = 1) -> None:
+        self.mouse = _NativeMouse(kind, x, y)
+
+    def kind_str(self) -> str:
+        return "mouse"
+
+
+class _ResizeEvent:
+    """Stand-in for a native resize ``CoreEvent``."""
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width, self.height = width, height
+
+    def kind_str(self) -> str:
+        return "resize"
+
+
+def test_drain_events_coalesces_wheel_moves_and_resizes() -> None:
+    from typing import Any
+
+    from xnano import hooks
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid):
+        body: Any = Field(
+            default="\n".join(f"line{i}" for i in range(40)),
+            scroll=True,
+        )
+        seen: list = Field(default_factory=list, state=True)
+
+        @hooks.on_event
+        def mouse(self, ctx) -> None:
+            event = ctx.event.mouse_event
+            if event is not None:
+                self.seen.append(
+                    (event.kind, event.x, event.field, event.count)
+                )
+
+        @hooks.on_resize
+        def resized(self, ctx) -> None:
+            self.seen.append(("resize", *ctx.event.resize_size))
+
+    events = [
+        _ResizeEvent(30, 10),
+        *(_MouseEvent("scroll_down") for _ in range(4)),
+        _MouseEvent("move", x=2),
+        _MouseEvent("move", x=5),
+        _ResizeEvent(40, 12),
+        _MouseEvent("scroll_down"),
+    ]
+    runtime = Runtime(
+        _QueuedSession(events),  # ty: ignore[invalid-argument-type]
+        live=False,
+        drain_events=True,
+    ).enter()
+    try:
+        app = App()
+        runtime.set_root(app)
+        runtime.render()
+        runtime.pump()
+        assert app.seen == [
+            *[("scroll_down", 1, "body", 1)] * 4,
+            ("move", 5, "body", 1),
+            ("resize", 40, 12),
+            ("scroll_down", 1, "body", 1),
+        ]
+        assert app._grid_scroll_handle("body").offset == 15
+        runtime.render()
+        assert runtime.frame_event_count == len(events)
+    finally:
+        runtime.close()
+
+
+def test_async_hooks_share_one_loop_and_finish_on_ui_thread() -> None:
+    import asyncio
+    import threading
+
+    from xnano import hooks
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    loops: list[object] = []
+    threads: list[object] = []
+
+    class App(BaseGrid):
+        label: str = Field(default="a")
+
+        @hooks.on_event
+        async def remember(self, ctx) -> None:
+            await asyncio.sleep(0)
+            loops.append(asyncio.get_running_loop())
+            ctx.terminal.call_soon(
+                lambda: threads.append(threading.current_thread())
+            )
+
+    session = _QueuedSession([_PasteEvent()])
+    with Runtime(session, live=False) as runtime:
+        runtime.set_root(App())
+        runtime.pump()
+        for _ in range(100):
+            if len(threads) >= 2:
+                break
+            threading.Event().wait(0.01)
+            runtime.pump()
+        assert len(loops) >= 2 and all(loop is loops[0] for loop in loops)
+        assert set(threads) == {threading.current_thread()}
+        assert runtime.hook_loop.is_running
+    assert not runtime.hook_loop.is_running
+
+
+def test_async_hook_errors_surface_on_the_next_pump() -> None:
+    import threading
+
+    import pytest
+
+    from xnano import hooks
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid):
+        @hooks.on_event
+        async def broken(self) -> None:
+            raise LookupError("missing remote data")
+
+    session = _QueuedSession([_PasteEvent()])
+    with Runtime(session, live=False) as runtime:
+        runtime.set_root(App())
+        with pytest.raises(LookupError, match="missing remote data"):
+            for _ in range(100):
+                runtime.pump()
+                threading.Event().wait(0.01)
+
+
+def test_async_hook_bodies_finish_inside_offscreen_dispatch() -> None:
+    import asyncio
+    import threading
+
+    from xnano import hooks
+    from xnano.actions import Action
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    threads: list[object] = []
+
+    class App(BaseGrid):
+        count: int = Field(default=0)
+
+        @hooks.on_keyboard("enter")
+        async def bump(self) -> None:
+            await asyncio.sleep(0.01)
+            threads.append(threading.current_thread())
+            self.count += 1
+
+    app = App()
+    with Runtime.offscreen(20, 3) as runtime:
+        runtime.set_root(app)
+        runtime.perform(Action.keyboard("enter"))
+        assert app.count == 1
+    assert threads == [threading.current_thread()]
+
+
+def test_hook_loop_resumes_coroutines_on_the_home_thread() -> None:
+    import asyncio
+    import threading
+
+    from xnano.utils.dispatch import HookLoop
+
+    woken = threading.Event()
+    hook_loop = HookLoop(woken.set)
+    threads: list[object] = []
+
+    async def body() -> str:
+        threads.append(threading.current_thread())
+        await asyncio.sleep(0.01)
+        threads.append(threading.current_thread())
+        return "done"
+
+    try:
+        future = hook_loop.submit(body())
+        for _ in range(200):
+            if future.done():
+                break
+            woken.wait(0.01)
+            woken.clear()
+            hook_loop.run_steps()
+        assert future.result(timeout=1) == "done"
+        assert threads == [threading.current_thread()] * 2
+    finally:
+        hook_loop.close()
+
+
+def test_call_soon_from_a_worker_wakes_a_blocked_pump() -> None:
+    import threading
+    import time
+
+    runtime = Runtime.offscreen(20, 3)
+    calls: list[str] = []
+    try:
+        worker = threading.Timer(
+            0.05, runtime.call_soon, args=(calls.append, "fed")
+        )
+        started = time.monotonic()
+        worker.start()
+        runtime.pump(timeout=5.0)
+        elapsed = time.monotonic() - started
+        worker.join()
+        assert calls == ["fed"]
+        assert elapsed < 1.0
+    finally:
+        runtime.close()
+
+
+def test_terminal_resize_wakes_a_live_runtime() -> None:
+    import select
+
+    import pytest
+
+    if not hasattr(signal, "SIGWINCH"):
+        pytest.skip("platform has no SIGWINCH")
+    xnano.core.runtime._install_resize_wake()
+    runtime = _live_runtime_over_offscreen_session()
+    try:
+        waker = runtime._ensure_waker()
+        assert not select.select([waker], [], [], 0)[0]
+        signal.raise_signal(signal.SIGWINCH)
+        assert select.select([waker], [], [], 1.0)[0]
+    finally:
+        runtime.close()
+    assert waker not in xnano.core.runtime._resize_wakers
+
+
+def test_profiled_runtime_records_per_phase_frame_samples() -> None:
+    from xnano.core.profiling import PHASES
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    renders: list[int] = []
+
+    class App(BaseGrid):
+        label: str = Field(default="a")
+
+        def grid_render(self) -> None:
+            renders.append(1)
+
+    plain = Runtime.offscreen(20, 3)
+    assert plain.stats is None
+    plain.close()
+    runtime = Runtime.offscreen(20, 3, profile=True)
+    try:
+        runtime.set_root(App())
+        for _ in range(5):
+            runtime.pump()
+            runtime.render()
+        samples = runtime.stats.samples
+        assert len(samples) == 5
+        sample = samples[-1]
+        assert set(PHASES) <= set(sample.phases)
+        assert sample.phases["layout"] > 0
+        assert sample.phases["native_render"] > 0
+        assert sample.phases["snapshot"] > 0
+        assert sample.phases["events"] > 0
+        assert sample.nodes > 0 and samples[0].lowered > 0
+        # The unchanged label is retained rather than lowered again.
+        assert sample.lowered == 0
+        assert sample.total == sum(sample.phases.values())
+        summary = runtime.stats.summary()
+        assert set(summary["total"]) == {"p50", "p95", "p99"}
+        assert summary["total"]["p50"] <= summary["total"]["p99"]
+        assert "total" in runtime.stats.report()
+    finally:
+        runtime.close()
+
+
+def test_frame_stats_ring_buffer_and_nearest_rank_percentiles() -> None:
+    from xnano.core.profiling import FrameStats
+
+    stats = FrameStats(capacity=3)
+    assert stats.percentiles() == {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+    for value in (1.0, 2.0, 3.0, 4.0):
+        stats.end_frame()
+        stats.amend("layout", value)
+    assert [s.phases["layout"] for s in stats.samples] == [2.0, 3.0, 4.0]
+    assert stats.percentiles("layout") == {"p50": 3.0, "p95": 4.0, "p99": 4.0}
+
+
+def test_hook_budget_accounts_hooks_and_warns_when_slow(caplog) -> None:
+    import logging
+    import time
+
+    from xnano import hooks
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid):
+        @hooks.on_tick
+        def step(self) -> None:
+            time.sleep(0.003)
+
+    runtime = Runtime.offscreen(20, 3, hook_budget_ms=1.0)
+    try:
+        runtime.set_root(App())
+        assert runtime.stats is None
+        with caplog.at_level(logging.WARNING, logger="xnano.hooks"):
+            runtime.pump()
+            runtime.pump()
+        record = runtime.hook_stats.records[("App", "step")]
+        assert record.calls == 2 and record.slow == 2
+        assert record.max_ms >= 3.0 and record.total_ms >= record.max_ms
+        assert "Slow hook App.step" in caplog.text
+        assert runtime.hook_stats.slowest(1)[0][0] == ("App", "step")
+        assert "App.step" in runtime.hook_stats.report()
+    finally:
+        runtime.close()
+
+
+def test_trace_writes_nested_chrome_trace_events(tmp_path) -> None:
+    import json
+
+    from xnano import hooks
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    class Child(BaseGrid):
+        note: str = Field(default="child")
+
+    class App(BaseGrid):
+        child: Child = Field(default_factory=Child)
+
+        @hooks.on_tick
+        def step(self) -> None:
+            pass
+
+    path = tmp_path / "trace.json"
+    runtime = Runtime.offscreen(20, 4, trace=path)
+    try:
+        runtime.set_root(App())
+        runtime.pump()
+        runtime.render()
+    finally:
+        runtime.close()
+    assert runtime.tracer is None
+    events = json.loads(path.read_text())["traceEvents"]
+    spans = {event["name"] for event in events if event["ph"] == "X"}
+    assert {"pump", "dispatch", "grid_render", "lower"} <= spans
+    assert {"native_render", "assemble App", "assemble Child"} <= spans
+    assert any(name.endswith("App.step") for name in spans)
+    counters = [event for event in events if event["ph"] == "C"]
+    assert counters and set(counters[0]["args"]) == {
+        "call_soon_queue",
+        "batch_events",
+        "effects_running",
+    }
+    pump = next(event for event in events if event["name"] == "pump")
+    dispatch = next(event for event in events if event["name"] == "dispatch")
+    assert pump["ts"] <= dispatch["ts"]
+    assert dispatch["ts"] + dispatch["dur"] <= pump["ts"] + pump["dur"]
+
+
+def test_recorded_session_replays_to_identical_frames(tmp_path) -> None:
+    import pytest
+
+    from xnano import hooks
+    from xnano.actions import Action
+    from xnano.core.recording import Recording, event_to_record, replay
+    from xnano.events import Event, MouseEventData
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid):
+        label: str = Field(default="zero")
+        ticks: int = Field(default=0)
+
+        @hooks.on_keyboard("n")
+        def advance(self) -> None:
+            self.label = "once" if self.label == "zero" else "twice"
+
+        @hooks.on_tick(10)
+        def step(self) -> None:
+            self.ticks += 1
+
+    path = tmp_path / "session.jsonl"
+    runtime = Runtime.offscreen(20, 3, record=path, record_frames=True)
+    try:
+        runtime.set_root(App())
+        runtime.render()
+        runtime.perform(Action.keyboard("n"))
+        runtime.pump()
+        runtime.render()
+        runtime.perform(Action.keyboard("n"))
+        runtime.render()
+    finally:
+        runtime.close()
+    assert runtime.recorder is None
+
+    recording = Recording.load(path)
+    assert (recording.width, recording.height) == (20, 3)
+    assert recording.frames == 3
+    assert [step.event["type"] for step in recording.steps if step.event] == [
+        "keyboard",
+        "tick",
+        "keyboard",
+    ]
+    mouse = Event.from_data(MouseEventData(kind="press", x=2, y=1))
+    assert event_to_record(mouse) == {
+        "type": "mouse",
+        "kind": "press",
+        "x": 2,
+        "y": 1,
+    }
+
+    report = replay(path, App, check_frames=True)
+    assert report.frames == 3
+    assert report.mismatches == []
+    assert len(report.stats.samples) == 3
+
+    class Other(App):
+        label: str = Field(default="other")
+
+    assert replay(recording, Other).mismatches == [0, 1]
+    with pytest.raises(AssertionError, match="frame 0"):
+        replay(recording, Other, check_frames=True)
+
+
+def test_replay_flags_frames_recorded_at_another_size(tmp_path) -> None:
+    import dataclasses
+
+    from xnano.actions import Action
+    from xnano.core.recording import Recording, replay
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid):
+        label: str = Field(default="zero")
+
+    path = tmp_path / "session.jsonl"
+    runtime = Runtime.offscreen(20, 3, record=path)
+    try:
+        runtime.set_root(App())
+        runtime.render()
+        runtime.perform(Action.resize(20, 3))
+        runtime.render()
+    finally:
+        runtime.close()
+    recording = Recording.load(path)
+    assert [step.digest for step in recording.steps if step.is_frame] == [
+        None,
+        None,
+    ]
+
+    recording.steps[1] = dataclasses.replace(
+        recording.steps[1], event={"type": "resize", "width": 30, "height": 6}
+    )
+    recording.steps[2] = dataclasses.replace(recording.steps[2], digest="x")
+    report = replay(recording, App, check_frames=True)
+    assert report.frames == 2
+    assert report.resized == [1]
+    assert report.mismatches == []
+
+
+def test_frames_serialize_their_buffer_lazily_and_stay_immutable() -> None:
+    import dataclasses
+    import pickle
+
+    import pytest
+
+    def stored(frame: Frame, name: str) -> str | None:
+        return getattr(Frame, name).stored(frame)
+
+    runtime = Runtime.offscreen(12, 2)
+    try:
+        first = runtime.render("alpha")
+        assert stored(first, "text") is None and stored(first, "ansi") is None
+        second = runtime.render("beta")
+        assert first.revision == 1 and stored(first, "text") is None
+        assert first.rows == ("alpha", "")
+        assert stored(first, "ansi") is None
+        assert second.contains("beta") and not first.contains("beta")
+        assert "alpha" in first.ansi
+    finally:
+        runtime.close()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.text = "changed"  # type: ignore[misc]
+    restored = pickle.loads(pickle.dumps(first))
+    assert restored == first and hash(restored) == hash(first)
+    assert restored != second
+    assert Frame(width=4, height=1).text == ""
+
+
+def test_frames_are_dataclasses() -> None:
+    import dataclasses
+
+    runtime = Runtime.offscreen(12, 2)
+    try:
+        frame = runtime.render("alpha")
+    finally:
+        runtime.close()
+    assert dataclasses.is_dataclass(frame) and not hasattr(frame, "__dict__")
+    assert [field.name for field in dataclasses.fields(frame)] == [
+        "width",
+        "height",
+        "text",
+        "ansi",
+        "cursor_position",
+        "cursor_visible",
+        "cursor_style",
+        "title",
+        "commands",
+        "revision",
+    ]
+    titled = dataclasses.replace(frame, title="demo")
+    assert titled.title == "demo" and titled.rows == ("alpha", "")
+    assert titled.revision == frame.revision and titled != frame
+    plain = dataclasses.replace(Frame(width=4, height=1, text="ab"), text="cd")
+    assert plain.rows == ("cd",) and plain.ansi == ""
+
+
+def test_frame_diffs_encode_each_buffer_once() -> None:
+    runtime = Runtime.offscreen(12, 2)
+    try:
+        first = runtime.render("alpha")
+        second = runtime.render("alpha")
+        assert second.diff(first).rows == ()
+        encoded = second._ansi_lines()
+        assert runtime.render("beta").diff(second).rows == (0,)
+        assert second._ansi_lines() is encoded
+        assert Frame.ansi.stored(second) is None  # type: ignore[attr-defined]
+    finally:
+        runtime.close()
+
+
+def test_render_diff_reports_changed_rows_and_styled_cell_runs() -> None:
+    from xnano.core.frame import CellRun
+
+    runtime = Runtime.offscreen(12, 3)
+    try:
+        full = runtime.render_diff("alpha\nbeta")
+        assert full.base_revision is None
+        assert full.rows == (0, 1, 2) and full.cursor_moved
+        assert runtime.render_diff("alpha\nbeta").is_empty
+        diff = runtime.render_diff("alpha\nbeth")
+        assert (diff.base_revision, diff.revision) == (2, 3)
+        assert diff.rows == (1,)
+        assert diff.runs == (CellRun(3, 1, "h", "Reset", "Reset", "NONE"),)
+    finally:
+        runtime.close()
+
+    from xnano.core import Frame
+
+    before = Frame(width=5, height=2, text="ab\ncd", revision=1)
+    after = Frame(width=5, height=2, text="ab\nce", revision=2)
+    assert after.diff(before).runs == (CellRun(0, 1, "ce"),)
+
+
+def test_grid_tree_is_cached_until_a_grid_field_is_reassigned() -> None:
+    from xnano.components.input import Input
+    from xnano.core.dispatch import grid_tree
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+    from xnano.utils.focus import collect_focusable_fields
+
+    class Child(BaseGrid):
+        note: str = Field(default="child")
+
+    class App(BaseGrid):
+        child: Child = Field(default_factory=Child)
+        label: str = Field(default="idle")
+        entry: Input = Field(default_factory=Input, group="entry")
+
+    app = App()
+    runtime = Runtime.offscreen(20, 4)
+    try:
+        runtime.set_root(app)
+        tree = grid_tree(runtime)
+        assert tree.grids == (app, app.child)
+        assert [t.group for t in collect_focusable_fields(runtime)] == [
+            "entry"
+        ]
+        app.label = "busy"
+        app.child.note = "changed"
+        assert grid_tree(runtime) is tree
+        replacement = Child()
+        app.child = replacement
+        rebuilt = grid_tree(runtime)
+        assert rebuilt is not tree and rebuilt.grids == (app, replacement)
+        app.entry = Input()
+        assert grid_tree(runtime) is not rebuilt
+    finally:
+        runtime.close()
+
+
+def test_focus_targets_follow_focusable_toggled_in_place() -> None:
+    from xnano.components.button import Button
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+    from xnano.utils.focus import collect_focusable_fields
+
+    class App(BaseGrid):
+        a: Button = Field(default_factory=lambda: Button("a"))
+        b: Button = Field(default_factory=lambda: Button("b"))
+
+    def names() -> list[str]:
+        return [t.field_name for t in collect_focusable_fields(runtime)]
+
+    app = App()
+    runtime = Runtime.offscreen(20, 4)
+    try:
+        runtime.set_root(app)
+        assert names() == ["a", "b"]
+        app.b.focusable = False
+        assert names() == ["a"]
+        app.b.focusable = True
+        assert names() == ["a", "b"]
+    finally:
+        runtime.close()
+
+
+def test_grid_set_field_swaps_invalidate_the_grid_tree() -> None:
+    from xnano import hooks
+    from xnano.actions import Action
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    seen: list[str] = []
+
+    class Child(BaseGrid):
+        name: str = Field(default="A")
+
+        @hooks.on_keyboard("enter")
+        def pressed(self) -> None:
+            seen.append(self.name)
+
+    class App(BaseGrid):
+        child: Child = Field(default_factory=Child)
+
+    app = App()
+    runtime = Runtime.offscreen(20, 4)
+    try:
+        runtime.set_root(app)
+        runtime.perform(Action.keyboard("enter"))
+        app.grid_set_field("child", Child(name="B"))
+        runtime.perform(Action.keyboard("enter"))
+    finally:
+        runtime.close()
+    assert seen == ["A", "B"]
+
+
+def test_field_hits_resolve_through_a_per_frame_index() -> None:
+    from xnano.components.input import Input
+    from xnano.core.dispatch import grid_tree, hit_index
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    class Row(BaseGrid, direction="horizontal"):
+        left: Input = Field(default_factory=Input, group="left")
+        right: Input = Field(default_factory=Input, group="right")
+
+    class Board(BaseGrid, direction="vertical"):
+        top: Row = Field(default_factory=Row)
+        bottom: Row = Field(default_factory=Row)
+        note: Input = Field(default_factory=Input, group="note", height=1)
+
+    def scan(x: int, y: int):
+        for grid in grid_tree(runtime).grids:
+            for hit in reversed(getattr(grid, "_grid_field_hits", ())):
+                if hit.area.contains((x, y)):
+                    return hit
+        return None
+
+    board = Board()
+    runtime = Runtime.offscreen(30, 9)
+    try:
+        runtime.set_root(board)
+        runtime.render()
+        index = hit_index(runtime)
+        assert hit_index(runtime) is index
+        names = set()
+        for y in range(9):
+            for x in range(30):
+                hit = runtime._field_hit_at(x, y)
+                assert hit is scan(x, y)
+                if hit is not None:
+                    names.add(hit.field_name)
+        assert names == {"left", "right", "note"}
+        runtime.render()
+        assert hit_index(runtime) is not index
+    finally:
+        runtime.close()
+
+
+def test_clean_field_slots_reuse_their_previous_paint() -> None:
+    import dataclasses
+
+    from xnano.components.component import Component
+    from xnano.core.content import TextBlock
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    calls: list[str] = []
+
+    @dataclasses.dataclass
+    class Clock(Component):
+        text: str = "ok"
+
+        def compose(self, ctx):
+            calls.append(self.text)
+            return TextBlock.from_plain(self.text)
+
+    @dataclasses.dataclass
+    class Badge(Clock):
+        retain_render = True
+
+    @dataclasses.dataclass
+    class Feed(Badge):
+        lines: list[str] = dataclasses.field(default_factory=list)
+
+        def compose(self, ctx):
+            calls.append(",".join(self.lines))
+            return TextBlock.from_plain(",".join(self.lines))
+
+    class Box:
+        def __init__(self) -> None:
+            self.text = "boxed"
+
+    @dataclasses.dataclass
+    class Boxed(Badge):
+        box: Box = dataclasses.field(default_factory=Box)
+
+        def compose(self, ctx):
+            calls.append(self.box.text)
+            return TextBlock.from_plain(self.box.text)
+
+    class App(BaseGrid, direction="vertical"):
+        badge: Badge = Field(default_factory=Badge, height=1)
+        clock: Clock = Field(default_factory=lambda: Clock("tick"), height=1)
+        label: str = Field(default="idle", height=1)
+        feed: Feed = Field(default_factory=lambda: Feed(lines=["a"]), height=1)
+        boxed: Boxed = Field(default_factory=Boxed, height=1)
+
+    app = App()
+    runtime = Runtime.offscreen(12, 5)
+    try:
+        runtime.set_root(app)
+        first = runtime.render().text
+        calls.clear()
+        runtime.render()
+        assert calls == ["tick", "a"]
+        app.badge.text = "new"
+        app.label = "busy"
+        app.feed.lines.append("b")
+        app.boxed.box.text = "moved"
+        calls.clear()
+        frame = runtime.render()
+        assert calls == ["new", "tick", "a,b"]
+        assert frame.text.splitlines()[:4] == ["new", "tick", "busy", "a,b"]
+        assert first.splitlines()[0] == "ok"
+        app.grid_mark_field_dirty("boxed")
+        calls.clear()
+        assert runtime.render().text.splitlines()[4] == "moved"
+        assert calls == ["tick", "a,b", "moved"]
+        calls.clear()
+        runtime.render()
+        assert calls == ["tick", "a,b"]
+    finally:
+        runtime.close()
+
+
+def test_split_layout_reuses_solved_splits(monkeypatch) -> None:
+    import collections
+
+    from xnano.core import controller
+    from xnano.core.controller import TerminalController
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid, direction="vertical", gap=1):
+        title: str = Field(default="title", height=1)
+        body: str = Field(default="body", height="50%")
+        footer: str = Field(default="footer")
+
+    solved: list[object] = []
+    solve = TerminalController._solve_split
+
+    def counting(self, *args):
+        solved.append(args)
+        return solve(self, *args)
+
+    monkeypatch.setattr(controller, "_split_cache", collections.OrderedDict())
+    monkeypatch.setattr(TerminalController, "_solve_split", counting)
+    runtime = Runtime.offscreen(20, 8)
+    try:
+        runtime.set_root(App())
+        first = runtime.render().text
+        assert len(solved) == 1
+        assert runtime.render().text == first
+        assert len(solved) == 1
+    finally:
+        runtime.close()
+    for size, total in (((20, 8), 1), ((24, 8), 2)):
+        runtime = Runtime.offscreen(*size)
+        try:
+            runtime.set_root(App())
+            runtime.render()
+            assert len(solved) == total
+        finally:
+            runtime.close()
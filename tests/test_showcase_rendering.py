@@ -295,10 +295,8 @@ def test_canvas_ir_cache_stays_bounded_under_animation() -> None:
         for _ in range(300):
             runtime.perform(Action.tick(66))
             runtime.render()
-        assert (
-            len(rendering._cell_canvas_ir_cache)
-            <= rendering._CELL_CANVAS_IR_CACHE_CAPACITY
-        )
+        cache = rendering.lowering_cache
+        assert len(cache) <= cache.capacity
     finally:
         runtime.close()
 
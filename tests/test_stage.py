@@ -30,3 +30,83 @@ def test_stage_queues_paint_commands() -> None:
 def test_layout_map_alias() -> None:
     layout: LayoutMap = {"a": Area(x=0, y=0, width=1, height=1)}
     assert isinstance(layout["a"], Area)
+
+
+def test_stage_cell_writes_paint_as_merged_overlay_canvases() -> None:
+    from xnano.core.runtime import Runtime
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid):
+        label: str = Field(default="abcdefgh")
+
+    runtime = Runtime.offscreen(8, 3, profile=True)
+    try:
+        runtime.set_root(App())
+        before = runtime.render()
+        stage = runtime.stage
+        stage.paint_cell(0, 0, "X", foreground="red")
+        stage.paint_cell(1, 0, "Y", foreground="red")
+        stage.paint_cell(0, 0, "Z", foreground="red")
+        stage.paint_cell(3, 0, " ", background="blue")
+        stage.paint_cell(4, 0, " ", background="blue")
+        stage.paint_cell(6, 2, "!")
+        frame = runtime.render()
+        assert frame.rows[0] == "ZYc  fgh"
+        assert frame.rows[2] == "      !"
+        assert stage._commands == []
+        first, second = runtime.stats.samples[-2:]
+        # One transparent canvas per glyph row, one run for the blanks.
+        assert second.nodes == first.nodes + 3
+        runs = {run.x: run for run in frame.diff(before).runs}
+        assert runs[0].text == "ZY" and runs[0].foreground is not None
+        assert runs[3].text == "  " and runs[3].background is not None
+    finally:
+        runtime.close()
+
+
+def test_stage_cell_writes_clip_to_the_viewport_and_batch_dense_glyphs(
+    monkeypatch,
+) -> None:
+    from xnano.core.controller import TerminalController
+    from xnano.core.runtime import Runtime
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid):
+        label: str = Field(default="")
+
+    painted: list[Area] = []
+    paint = TerminalController._paint
+
+    def spy(self, content, area, **kwargs):
+        if kwargs.get("z") == 10_000:
+            painted.append(area)
+        return paint(self, content, area, **kwargs)
+
+    monkeypatch.setattr(TerminalController, "_paint", spy)
+    runtime = Runtime.offscreen(8, 3)
+    try:
+        runtime.set_root(App())
+        stage = runtime.stage
+        stage.paint_cell(5000, 3000, "#")
+        stage.paint_cell(8, 0, "#")
+        stage.paint_cell(0, 0, "a")
+        stage.paint_cell(7, 2, "b")
+        frame = runtime.render()
+        assert frame.rows[0] == "a"
+        assert frame.rows[2] == "       b"
+        assert sorted((area.x, area.y, area.width) for area in painted) == [
+            (0, 0, 1),
+            (7, 2, 1),
+        ]
+        painted.clear()
+        for x, y in ((1, 0), (2, 0), (1, 1), (2, 1), (3, 1)):
+            stage.paint_cell(x, y, "#")
+        assert runtime.render().rows[:2] == ("a##", " ###")
+        # Glyphs filling most of their bounding box share one canvas.
+        assert [(a.x, a.y, a.width, a.height) for a in painted] == [
+            (1, 0, 3, 2)
+        ]
+    finally:
+        runtime.close()
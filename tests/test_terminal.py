@@ -88,6 +88,41 @@ def test_terminal_live_run_skips_unused_frame_serialization(
     terminal.run(App())
 
 
+def test_terminal_run_async_interleaves_with_other_coroutines() -> None:
+    import asyncio
+
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid):
+        label: str = Field(default="zero")
+
+    terminal = Terminal.offscreen(cols=20, rows=3, render_on_demand=True)
+    app = App()
+    frames = []
+    render = terminal.runtime.render
+
+    def capture_render(*args, **kwargs):
+        frame = render(*args, **kwargs)
+        frames.append(frame)
+        return frame
+
+    terminal.runtime.render = capture_render
+
+    async def feed() -> None:
+        for value in ("once", "twice"):
+            await asyncio.sleep(0.01)
+            app.label = value
+        await asyncio.sleep(0.01)
+        terminal.runtime.request_exit()
+
+    async def main() -> None:
+        await asyncio.gather(terminal.run_async(app), feed())
+
+    asyncio.run(main())
+    assert [f.text.split()[0] for f in frames] == ["zero", "once", "twice"]
+
+
 def test_render_packs_multiple_items_by_content() -> None:
     """Multiple top-level renderables pack to their content size with ``gap``
     as literal spacing, rather than each taking an equal fill share that would
@@ -102,3 +137,43 @@ def test_render_packs_multiple_items_by_content() -> None:
     lines = terminal.render("AAA", "BBB", "CCC", gap=1).text.split("\n")
     assert lines[:5] == ["AAA", "", "BBB", "", "CCC"]
     terminal.close()
+
+
+def test_terminal_render_on_demand_skips_idle_frames(monkeypatch) -> None:
+    from xnano import hooks
+    from xnano.fields import Field
+    from xnano.grids import BaseGrid
+
+    class App(BaseGrid):
+        label: str = Field(default="idle")
+        fired: int = Field(default=0, state=True)
+
+        @hooks.on_tick(20)
+        def step(self, ctx) -> None:
+            self.fired += 1
+            if self.fired == 3:
+                ctx.terminal.request_exit()
+
+    terminal = Terminal.offscreen(cols=20, rows=3, render_on_demand=True)
+    runtime = terminal.runtime
+    frames = []
+    pumps = []
+    render = runtime.render
+    pump = runtime.pump
+
+    def capture_render(*args, **kwargs):
+        frame = render(*args, **kwargs)
+        frames.append(frame)
+        return frame
+
+    def count_pump(*args, **kwargs):
+        pumps.append(None)
+        return pump(*args, **kwargs)
+
+    monkeypatch.setattr(runtime, "render", capture_render)
+    monkeypatch.setattr(runtime, "pump", count_pump)
+    terminal.run(App())
+    # The first frame plus one per fired interval hook; idle pumps in
+    # between paint nothing.
+    assert len(frames) == 3
+    assert len(pumps) > len(frames)
@@ -199,6 +199,28 @@ def test_evaluate_state_expression_refuses_code_execution() -> None:
     assert ev("__import__('os')", model) is False
 
 
+def test_compiled_expressions_record_the_names_they_read() -> None:
+    compiled = introspection.compile_state_expression(
+        "len(items) > limit and ready"
+    )
+    assert compiled is not None
+    assert introspection.compile_state_expression(compiled.source) is compiled
+    assert compiled.names == ("items", "limit", "ready")
+    assert compiled.reference is False
+    assert compiled.inputs({"items": [1], "limit": 2}) is None
+    assert compiled.inputs({"items": "abc", "limit": 2}) == (
+        "abc",
+        2,
+        introspection._MISSING,
+    )
+    whole = introspection.compile_state_expression("state.count")
+    assert whole is not None and whole.names is None and whole.reference
+    # Refused constructs fail only when evaluation reaches them.
+    ev = introspection.evaluate_state_expression
+    assert ev("ready or open('x')", {"ready": True}) is True
+    assert ev("ready and open('x')", {"ready": True}) is False
+
+
 def test_reference_watchers_read_nested_mutable_state() -> None:
     state = {"jobs": [{"status": "queued"}]}
 
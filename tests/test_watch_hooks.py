@@ -112,3 +112,99 @@ def test_expression_form_still_fires_every_truthy_frame() -> None:
         assert fires == [2, 2]
     finally:
         terminal.close()
+
+
+def test_expression_hooks_skip_evaluation_while_inputs_hold(
+    monkeypatch,
+) -> None:
+    from xnano.utils.introspection import CompiledExpression
+
+    evaluated: list[str] = []
+    evaluate = CompiledExpression.evaluate
+
+    def counting(self, target):
+        evaluated.append(self.source)
+        return evaluate(self, target)
+
+    monkeypatch.setattr(CompiledExpression, "evaluate", counting)
+    fires: list[str] = []
+
+    class App(BaseGrid):
+        count: int = Field(default=1)
+        items: list = Field(default_factory=list)
+
+        @on_field("count > 0")
+        def _positive(self) -> None:
+            fires.append("positive")
+
+        @on_field("count")
+        def _count(self) -> None:
+            fires.append("count")
+
+        @on_field("len(items) > 0")
+        def _items(self) -> None:
+            fires.append("items")
+
+    app = App()
+    terminal = Terminal.offscreen(cols=20, rows=3)
+    try:
+        terminal.render(app)
+        terminal.render(app)
+        assert evaluated.count("count > 0") == 1
+        assert evaluated.count("count") == 1
+        assert evaluated.count("len(items) > 0") == 2
+        assert fires == ["positive", "positive"]
+        app.items.append(1)
+        app.count = 2
+        terminal.render(app)
+        assert evaluated.count("count > 0") == 2
+        assert fires[2:] == ["positive", "count", "items"]
+    finally:
+        terminal.close()
+
+
+def test_bare_names_on_state_are_reread_only_after_assignment(
+    monkeypatch,
+) -> None:
+    from xnano.state import State
+    from xnano.utils.introspection import CompiledExpression
+
+    evaluated: list[str] = []
+    evaluate = CompiledExpression.evaluate
+
+    def counting(self, target):
+        evaluated.append(self.source)
+        return evaluate(self, target)
+
+    monkeypatch.setattr(CompiledExpression, "evaluate", counting)
+    fires: list[str] = []
+
+    class App(BaseGrid):
+        @on_state("rows")
+        def _rows(self, ctx) -> None:
+            fires.append("rows")
+            ctx.state.total = len(ctx.state.rows)
+
+        @on_state("total")
+        def _total(self, ctx) -> None:
+            fires.append(f"total={ctx.state.total}")
+
+    app = App()
+    state = State(rows=list(range(1000)), total=0)
+    terminal = Terminal.offscreen(cols=20, rows=3, state=state)
+    try:
+        terminal.render(app)
+        terminal.render(app)
+        terminal.render(app)
+        assert evaluated == ["rows", "total"]
+        assert fires == []
+        state.rows = [1, 2]
+        terminal.render(app)
+        assert fires == ["rows", "total=2"]
+        terminal.render(app)
+        assert fires == ["rows", "total=2"]
+        state.total = 2
+        terminal.render(app)
+        assert fires == ["rows", "total=2"]
+    finally:
+        terminal.close()
@@ -9,7 +9,7 @@ click hooks.
 from __future__ import annotations
 
 import dataclasses
-from typing import TYPE_CHECKING, Any, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar, Sequence
 
 from xnano.components.component import Component
 from xnano.utils.deprecation import color_alias_dataclass
@@ -83,6 +83,9 @@ class Button(Component):
     activation_keys: Sequence[str] = ("enter", "space")
     """Bindings that bubble to hooks (never consumed here)."""
 
+    retain_render: ClassVar[bool] = True
+    """A button paints only its own attributes."""
+
     def get_label_text(self) -> str:
         """Return the plain-text form of ``label``."""
         if isinstance(self.label, str):
@@ -44,6 +44,9 @@ if TYPE_CHECKING:
 
 StateT = TypeVar("StateT")
 
+_MUTABLE_CONTAINERS = (list, dict, set, bytearray)
+"""Attribute types that rule out reusing a component's previous paint."""
+
 
 @dataclasses.dataclass(frozen=True, slots=True)
 class ComponentRenderContext(Generic[StateT]):
@@ -136,6 +139,15 @@ class Component(metaclass=_ComponentMeta):
     _xnano_component_base: ClassVar[bool] = True
     _declared: ClassVar[dict[str, Any]] = {}
     _component_responsive_composes: ClassVar[dict[str, str]] = {}
+    retain_render: ClassVar[bool] = False
+    """Whether a frame may reuse this component's previous paint.
+
+    Opt in on a subclass whose ``compose`` reads only its own attributes:
+    the previous paint is then reused while the slot is unchanged, its
+    field is not marked dirty, and every attribute still holds the same
+    object. An attribute holding a list, dict, or set always repaints,
+    since it may be mutated in place.
+    """
 
     visible: bool = dataclasses.field(default=True, kw_only=True)
     """Whether this component paints at all."""
@@ -163,6 +175,28 @@ class Component(metaclass=_ComponentMeta):
         """Whether this component currently holds field focus."""
         return bool(self._input_focused)
 
+    def _component_render_key(self) -> tuple[Any, ...] | None:
+        """Return the attribute values this component's paint depends on.
+
+        Nested components contribute their own keys. ``None`` means the
+        component must repaint every frame.
+        """
+        if not self.retain_render:
+            return None
+        values = getattr(self, "__dict__", None)
+        if values is None:
+            return None
+        key: list[Any] = []
+        for value in values.values():
+            if type(value) in _MUTABLE_CONTAINERS:
+                return None
+            if isinstance(value, Component):
+                value = value._component_render_key()
+                if value is None:
+                    return None
+            key.append(value)
+        return tuple(key)
+
     def get_frame(self) -> Any | None:
         """Optional frame/panel chrome around composed content."""
         return None
@@ -14,7 +14,7 @@ import os
 import struct
 import time
 import zlib
-from typing import BinaryIO, Literal, TypeAlias
+from typing import Any, BinaryIO, ClassVar, Literal, TypeAlias
 
 from xnano.area import Size
 from xnano.components.component import Component, ComponentRenderContext
@@ -480,6 +480,9 @@ class Image(Component):
     fit_content: bool = dataclasses.field(default=False, kw_only=True)
     """Whether layout should use the image's natural cell size."""
 
+    retain_render: ClassVar[bool] = True
+    """Stills keep their paint; playing animations opt back out below."""
+
     _frames: tuple[_RasterFrame, ...] = dataclasses.field(
         init=False, repr=False, compare=False
     )
@@ -666,6 +669,12 @@ class Image(Component):
             return 0.0
         return (now_ns - self._started_at_ns) / 1_000_000
 
+    def _component_render_key(self) -> tuple[Any, ...] | None:
+        """Repaint a playing animation every frame; stills keep their paint."""
+        if self.playing and self.position_ms is None and len(self._frames) > 1:
+            return None
+        return super()._component_render_key()
+
     def get_size(self, ctx: ComponentRenderContext) -> Size:
         """Return the native terminal cell dimensions of the source."""
         self._ensure_decoded()
@@ -8,11 +8,11 @@ Edit single-line or multiline text with optional masking and length limits.
 from __future__ import annotations
 
 import dataclasses
-import math
 from typing import TYPE_CHECKING, Sequence
 
 from xnano.area import Size
 from xnano.components.text import Text
+from xnano.utils.measure import cell_width, char_wrapped_row_count
 
 if TYPE_CHECKING:
     from xnano.components.component import ComponentRenderContext
@@ -60,13 +60,9 @@ class Input(Text):
 
     def _wrapped_row_count(self, text: str, width: int) -> int:
         """Return how many rows ``text`` occupies at ``width`` cells."""
-        lines = text.split("\n")
-        if width <= 0 or not self.wrap:
-            return max(1, len(lines))
-        rows = 0
-        for line in lines:
-            rows += max(1, math.ceil(len(line) / width))
-        return max(1, rows)
+        if not self.wrap:
+            return max(1, text.count("\n") + 1)
+        return char_wrapped_row_count(text, width)
 
     def get_size(self, ctx: "ComponentRenderContext") -> Size:
         """Report the preferred cell size, growing with content when asked."""
@@ -79,9 +75,7 @@ class Input(Text):
                 rows = min(self.max_rows, rows)
         else:
             rows = self.rows if self.rows is not None else text.count("\n") + 1
-        preferred_width = width or max(
-            (len(line) for line in text.split("\n")), default=0
-        )
+        preferred_width = width or max(map(cell_width, text.split("\n")))
         return Size(width=preferred_width, height=rows)
 
 
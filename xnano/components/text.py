@@ -8,7 +8,7 @@ Display styled text, nested spans, ANSI, Markdown, or highlighted source code.
 from __future__ import annotations
 
 import dataclasses
-from typing import TYPE_CHECKING, Any, Sequence
+from typing import TYPE_CHECKING, Any, ClassVar, Sequence
 
 from xnano.area import Alignment, VerticalAlignment
 from xnano.components.component import Component, ComponentRenderContext
@@ -111,6 +111,9 @@ class Text(Component):
     the full cell width (no manual right-padding required).
     """
 
+    retain_render: ClassVar[bool] = True
+    """Text paints only its own attributes; editors opt back out below."""
+
     _editor: Any = dataclasses.field(
         default=None, init=False, repr=False, compare=False
     )
@@ -139,6 +142,12 @@ class Text(Component):
             if editor is not None and editor.text() != value:
                 editor.set_text(value)
 
+    def _component_render_key(self) -> tuple[Any, ...] | None:
+        """Repaint a multi-line editor every frame: its caret lives natively."""
+        if self._editor is not None:
+            return None
+        return super()._component_render_key()
+
     def _validate_display_modes(self) -> None:
         """Raise when mutually exclusive display modes are combined."""
         display_modes = [
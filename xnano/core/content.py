@@ -31,6 +31,7 @@ from xnano.utils.deprecation import (
     resolve_color_alias,
     resolve_init_alias,
 )
+from xnano.utils.measure import cell_width
 
 
 @dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
@@ -903,6 +904,7 @@ class CellCanvas(ContentBase):
         rows: Rows of styled spans.
         width: Canvas width in cells.
         height: Canvas height in cells.
+        transparent: Whether space cells leave lower layers showing.
     """
 
     rows: tuple[tuple[CellSpan, ...], ...] = ()
@@ -911,6 +913,8 @@ class CellCanvas(ContentBase):
     """Canvas width in cells."""
     height: int = 0
     """Canvas height in cells."""
+    transparent: bool = False
+    """Whether space cells leave lower layers showing, styled or not."""
 
     @classmethod
     def from_rows(
@@ -918,6 +922,7 @@ class CellCanvas(ContentBase):
         rows: Sequence[Sequence[CellSpan | str]],
         *,
         width: int | None = None,
+        transparent: bool = False,
         style: Style | None = None,
         z: int = 0,
         visible: bool = True,
@@ -930,20 +935,26 @@ class CellCanvas(ContentBase):
             )
             for row in rows
         )
-        measured_width = max(
-            (sum(len(span.text) for span in row) for row in normalized),
-            default=0,
-        )
+        measured_width = max(map(_row_width, normalized), default=0)
         return cls(
             rows=normalized,
             width=measured_width if width is None else width,
             height=len(normalized),
+            transparent=transparent,
             style=style,
             z=z,
             visible=visible,
         )
 
 
+def _row_width(row: Sequence[CellSpan]) -> int:
+    """Return the cells one canvas row occupies, skipping ASCII rows fast."""
+    text = "".join([span.text for span in row])
+    if text.isascii():
+        return len(text)
+    return sum(cell_width(span.text) for span in row)
+
+
 @dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
 class Native(ContentBase):
     """Content already lowered for a named interface.
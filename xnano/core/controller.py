@@ -7,19 +7,32 @@ Paint grids through their complete layout pipeline.
 
 from __future__ import annotations
 
+import collections
 import collections.abc
 import copy
-import textwrap
 from typing import Any
 
 import xnano_core.rust.native as native
 from xnano_core import core
 
 from xnano.area import Area, Padding
-from xnano.core.content import Clear, Panel, TextBlock
+from xnano.core.content import (
+    CellCanvas,
+    CellSpan,
+    Clear,
+    Panel,
+    TextBlock,
+)
 from xnano.core.layout import LayoutConstraint
 from xnano.core.rendering import lower_content
 from xnano.types import Frame, is_grid
+from xnano.utils.measure import (
+    cell_width,
+    drop_cells,
+    text_cache,
+    text_size,
+    wrapped_line_count,
+)
 from xnano.utils.responsive import resolve_responsive_variant
 
 
@@ -31,37 +44,52 @@ def _string_content(value: Any) -> str | None:
     return content if isinstance(content, str) else None
 
 
-def wrapped_line_count(text: str, width: int) -> int:
-    """Return how many rows ``text`` occupies when wrapped at ``width``.
-
-    ratatui wraps on word boundaries, so a raw ``splitlines()`` count is
-    short for any line longer than its slot. ``textwrap`` matches that
-    behavior closely enough to place content; it is not a substitute for
-    ratatui's own measurement.
-
-    ponytail: approximates unicode width as one cell per character. Bind
-    ratatui's ``Paragraph::line_count`` if wide glyphs need exact rows.
+class _LineIndex:
+    """Start offsets of every line of one text, for O(rows) windowing."""
+
+    __slots__ = ("text", "starts", "_width")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        starts = [0]
+        find = text.find
+        position = find("\n")
+        while position >= 0:
+            starts.append(position + 1)
+            position = find("\n", position + 1)
+        self.starts = starts
+        self._width: int | None = None
+
+    @property
+    def width(self) -> int:
+        """Cells in the widest line, measured once."""
+        if self._width is None:
+            self._width = max(map(cell_width, self.text.split("\n")))
+        return self._width
+
+    def window(self, offset: int, rows: int | None = None) -> str:
+        """Return lines ``offset`` through ``offset + rows`` joined."""
+        starts = self.starts
+        count = len(starts)
+        if offset >= count:
+            return ""
+        end = count if rows is None else min(count, offset + max(0, rows))
+        if offset <= 0 and end == count:
+            return self.text
+        stop = len(self.text) if end == count else starts[end] - 1
+        return self.text[starts[offset] : max(starts[offset], stop)]
+
+
+@text_cache(1 << 22, maxsize=64)
+def _line_index(text: str) -> _LineIndex:
+    """Return the cached line index of ``text``.
+
+    Scroll fields re-measure and re-window their content every frame, so
+    the index is built once per content value and every later frame costs
+    only the visible rows. An appending log is a new value each time, so
+    the cache is bounded by the text it holds, not just its entries.
     """
-    lines = text.splitlines() or [""]
-    if width <= 0:
-        return len(lines)
-    total = 0
-    for line in lines:
-        if len(line) <= width:
-            total += 1
-        else:
-            total += (
-                len(
-                    textwrap.wrap(
-                        line,
-                        width=width,
-                        break_long_words=True,
-                        break_on_hyphens=False,
-                    )
-                )
-                or 1
-            )
-    return total
+    return _LineIndex(text)
 
 
 def content_scroll_extent(value: Any, axis: str) -> int:
@@ -72,10 +100,8 @@ def content_scroll_extent(value: Any, axis: str) -> int:
     """
     text = _string_content(value)
     if text is not None:
-        lines = text.split("\n")
-        if axis == "y":
-            return len(lines)
-        return max((len(line) for line in lines), default=0)
+        index = _line_index(text)
+        return len(index.starts) if axis == "y" else index.width
     if isinstance(value, collections.abc.Sequence) and not isinstance(
         value, (str, bytes)
     ):
@@ -83,22 +109,33 @@ def content_scroll_extent(value: Any, axis: str) -> int:
     return 0
 
 
-def window_scroll_value(value: Any, offset: int, axis: str) -> Any:
+def window_scroll_value(
+    value: Any, offset: int, axis: str, rows: int | None = None
+) -> Any:
     """Return ``value`` windowed by ``offset`` cells along ``axis``.
 
     Drops the leading ``offset`` rows/columns of plain-string content so the
     fixed-height slot (which clips the bottom natively) shows the window.
-    Non-text values are returned unchanged.
+    With ``rows``, only that many lines are kept, so the work is bounded by
+    the visible rows rather than the document. Non-text values, and text
+    the window leaves whole, are returned unchanged.
     """
-    if offset <= 0:
+    if offset <= 0 and rows is None:
         return value
     text = _string_content(value)
     if text is None:
         return value
+    index = _line_index(text)
     if axis == "y":
-        windowed = "\n".join(text.split("\n")[offset:])
+        windowed = index.window(offset, rows)
     else:
-        windowed = "\n".join(line[offset:] for line in text.split("\n"))
+        windowed = index.window(0, rows)
+        if offset > 0:
+            windowed = "\n".join(
+                drop_cells(line, offset) for line in windowed.split("\n")
+            )
+    if windowed is text:
+        return value
     if isinstance(value, str):
         return windowed
     clone = copy.copy(value)
@@ -106,12 +143,84 @@ def window_scroll_value(value: Any, offset: int, axis: str) -> Any:
     return clone
 
 
+_SPLIT_CACHE_CAPACITY = 512
+_split_cache: collections.OrderedDict[tuple[Any, ...], tuple[Area, ...]] = (
+    collections.OrderedDict()
+)
+"""LRU of solved splits keyed by area, direction, gap, and constraints.
+
+Every grid splits its slot on every frame, and the result only changes when
+the viewport resizes or a field's visibility or measured size changes, so
+solved splits skip both the native constraint conversion and the solver.
+Bounded so resizing through many sizes does not grow it unbounded."""
+
+
+def _lower_constraint(constraint: Any) -> Any:
+    """Return the native constraint for one layout constraint."""
+    if constraint.kind == "length":
+        return native.Constraint.length(constraint.value)
+    if constraint.kind == "percentage":
+        return native.Constraint.percentage(constraint.value)
+    if constraint.kind == "ratio":
+        return native.Constraint.ratio(constraint.value, constraint.value2)
+    if constraint.kind == "min":
+        return native.Constraint.min(constraint.value)
+    if constraint.kind == "max":
+        return native.Constraint.max(constraint.value)
+    if constraint.kind == "content":
+        # Size-to-content: a fit field claims exactly its measured content
+        # length (plus chrome), not a fill-weighted share.
+        return native.Constraint.length(max(0, constraint.value))
+    return native.Constraint.fill(max(1, constraint.value))
+
+
+_RETAINED_SCALARS = (str, int, float, bool)
+"""Plain field value types whose paint depends only on the value."""
+
+
+def _retain_signature(value: Any, field: Any) -> tuple[Any, ...] | None:
+    """Return what a field slot's paint depends on, or ``None`` if unknown.
+
+    Plain scalars depend on the value and the field's styling; components
+    that opt in on their attribute values (see ``Component.retain_render``).
+    Grids, sequences, and other objects are painted afresh.
+    """
+    if type(value) in _RETAINED_SCALARS:
+        return (value, field)
+    render_key = getattr(value, "_component_render_key", None)
+    if render_key is None:
+        return None
+    key = render_key()
+    return None if key is None else (value, field, key)
+
+
+def _same_signature(previous: Any, current: Any) -> bool:
+    """Return whether two retain signatures hold the very same objects."""
+    if previous is current:
+        return True
+    if (
+        type(previous) is not tuple
+        or type(current) is not tuple
+        or len(previous) != len(current)
+    ):
+        return False
+    return all(map(_same_signature, previous, current))
+
+
 class TerminalController:
-    """Collect absolute paint requests for one native frame."""
+    """Collect absolute paint requests for one native frame.
+
+    Field slots are retained: the nodes a slot painted last frame are
+    reused when its owner, area, layer, and value are unchanged and the
+    field is not marked dirty, so clean fields skip ``compose`` and
+    lowering entirely.
+    """
 
     def __init__(self, runtime: Any) -> None:
         self.runtime = runtime
         self.nodes: list[Any] = []
+        self._previous: dict[tuple[Any, ...], Any] = runtime._retained_paint
+        self._retained: dict[tuple[Any, ...], Any] = {}
 
     def _paint(
         self,
@@ -123,6 +232,14 @@ class TerminalController:
     ) -> None:
         if area.width <= 0 or area.height <= 0:
             return
+        runtime = self.runtime
+        if runtime._stats is None and runtime._tracer is None:
+            lowered = lower_content(content)
+        else:
+            with runtime._phase("lower"):
+                lowered = lower_content(content)
+            if runtime._stats is not None:
+                runtime._stats.count(lowered=1)
         self.nodes.append(
             core.CoreRenderNode(
                 x=area.x,
@@ -131,20 +248,28 @@ class TerminalController:
                 height=area.height,
                 content=core.CoreRenderContent.empty(),
                 constraints=[native.Constraint.fill(1)],
-                children=[lower_content(content)],
+                children=[lowered],
                 effect_key=effect_key,
                 z=z,
             )
         )
 
     def commit(self) -> None:
+        self.runtime._retained_paint = self._retained
         width, height = self.runtime.size
         node = (
             core.CoreRenderNode.stack(0, 0, width, height, self.nodes)
             if self.nodes
             else core.CoreRenderNode.leaf(core.CoreRenderContent.empty())
         )
-        self.runtime.session.render(node)
+        runtime = self.runtime
+        if runtime._stats is None and runtime._tracer is None:
+            runtime.session.render(node)
+            return
+        if runtime._stats is not None:
+            runtime._stats.count(nodes=len(self.nodes))
+        with runtime._phase("native_render"):
+            runtime.session.render(node)
 
     def paint_frame(self, area: Area, frame: Frame, *, z: int = 0) -> Area:
         self._paint(
@@ -196,36 +321,37 @@ class TerminalController:
         gap: int,
         constraints: collections.abc.Sequence[Any],
     ) -> list[Area]:
-        lowered = []
-        for constraint in constraints:
-            if constraint.kind == "length":
-                value = native.Constraint.length(constraint.value)
-            elif constraint.kind == "percentage":
-                value = native.Constraint.percentage(constraint.value)
-            elif constraint.kind == "ratio":
-                value = native.Constraint.ratio(
-                    constraint.value, constraint.value2
-                )
-            elif constraint.kind == "min":
-                value = native.Constraint.min(constraint.value)
-            elif constraint.kind == "max":
-                value = native.Constraint.max(constraint.value)
-            elif constraint.kind == "content":
-                # Size-to-content: a fit field claims exactly its measured
-                # content length (plus chrome), not a fill-weighted share.
-                value = native.Constraint.length(max(0, constraint.value))
-            else:
-                value = native.Constraint.fill(max(1, constraint.value))
-            lowered.append(value)
+        key = (area, direction, gap, tuple(constraints))
+        try:
+            cached = _split_cache.get(key)
+        except TypeError:
+            # Unhashable duck-typed constraints: solve without caching.
+            return list(self._solve_split(area, direction, gap, constraints))
+        if cached is None:
+            cached = self._solve_split(area, direction, gap, constraints)
+            _split_cache[key] = cached
+            while len(_split_cache) > _SPLIT_CACHE_CAPACITY:
+                _split_cache.popitem(last=False)
+        else:
+            _split_cache.move_to_end(key)
+        return list(cached)
+
+    def _solve_split(
+        self,
+        area: Area,
+        direction: str,
+        gap: int,
+        constraints: collections.abc.Sequence[Any],
+    ) -> tuple[Area, ...]:
         layout = native.Layout.new(
             native.Direction.Horizontal
             if direction == "horizontal"
             else native.Direction.Vertical,
-            lowered,
+            [_lower_constraint(constraint) for constraint in constraints],
         )
         if gap:
             layout = layout.spacing(gap)
-        return [
+        return tuple(
             Area(
                 x=rect.x,
                 y=rect.y,
@@ -235,7 +361,7 @@ class TerminalController:
             for rect in layout.split(
                 native.Rect(area.x, area.y, area.width, area.height)
             )
-        ]
+        )
 
     def measure_field_slot(
         self,
@@ -248,10 +374,8 @@ class TerminalController:
         if value is None:
             return 0
         if isinstance(value, str):
-            lines = value.splitlines() or [""]
-            return (
-                len(lines) if direction == "vertical" else max(map(len, lines))
-            )
+            width, height = text_size(value)
+            return height if direction == "vertical" else width
         get_size = getattr(value, "get_size", None)
         if callable(get_size):
             from xnano.components.component import ComponentRenderContext
@@ -331,8 +455,70 @@ class TerminalController:
         scroll_offset: int = 0,
         scroll_axis: str = "y",
     ) -> None:
-        if scroll_offset > 0:
-            value = window_scroll_value(value, scroll_offset, scroll_axis)
+        signature = None if owner is None else _retain_signature(value, field)
+        if signature is None:
+            self._paint_field_slot(
+                value,
+                area,
+                field,
+                parent_z=parent_z,
+                effect_key=effect_key,
+                scroll_offset=scroll_offset,
+                scroll_axis=scroll_axis,
+            )
+            return
+        key = (
+            id(owner),
+            owner_field_name,
+            area,
+            parent_z,
+            effect_key,
+            scroll_offset,
+            scroll_axis,
+            self.runtime.size,
+        )
+        # A field marked dirty (``grid_mark_field_dirty``, or any
+        # assignment) may hide an in-place mutation the signature cannot see.
+        state = getattr(owner, "_grid_field_states", {}).get(owner_field_name)
+        dirty = state is not None and state.dirty
+        retained = None if dirty else self._previous.get(key)
+        if retained is not None and _same_signature(retained[0], signature):
+            self.nodes.extend(retained[1])
+            self._retained[key] = retained
+            return
+        start = len(self.nodes)
+        self._paint_field_slot(
+            value,
+            area,
+            field,
+            parent_z=parent_z,
+            effect_key=effect_key,
+            scroll_offset=scroll_offset,
+            scroll_axis=scroll_axis,
+        )
+        # Keyed after painting: ``compose`` may refresh private caches, and
+        # only changes made after this frame should invalidate the nodes.
+        signature = _retain_signature(value, field)
+        if signature is not None:
+            self._retained[key] = (signature, tuple(self.nodes[start:]))
+        if dirty:
+            state.clear_dirty()
+
+    def _paint_field_slot(
+        self,
+        value: Any,
+        area: Area,
+        field: Any,
+        *,
+        parent_z: int = 0,
+        effect_key: str | None = None,
+        scroll_offset: int = 0,
+        scroll_axis: str = "y",
+    ) -> None:
+        if scroll_offset > 0 or getattr(field, "scroll", None):
+            value = window_scroll_value(
+                value, scroll_offset, scroll_axis, rows=area.height
+            )
         area = self.align_slot_content(value, area, field, parent_z=parent_z)
         if isinstance(value, collections.abc.Sequence) and not isinstance(
             value, (str, bytes)
@@ -447,24 +633,135 @@ class TerminalController:
         )
 
     def paint_stage(self) -> None:
-        for command in self.runtime.stage._commands:
-            self._paint(
-                TextBlock(
-                    text=str(command["value"])[:1],
-                    foreground=command["foreground"],
-                    background=command["background"],
-                    modifiers=command["modifiers"],
-                    wrap=False,
+        """Paint the stage's queued cell writes as a few overlay canvases.
+
+        Writes outside the viewport are dropped, and the rest fold into a
+        sparse grid where the last write to a cell wins. Glyphs paint as
+        transparent canvases (see ``_paint_stage_glyphs``); written spaces,
+        which a transparent canvas would skip, paint as one opaque canvas
+        per horizontal run. Adjacent cells of one style merge into a single
+        span.
+        """
+        commands = self.runtime.stage._commands
+        if not commands:
+            return
+        width, height = self.runtime.size
+        glyphs: dict[tuple[int, int], tuple[str, tuple[Any, ...]]] = {}
+        blanks: dict[tuple[int, int], tuple[str, tuple[Any, ...]]] = {}
+        for command in commands:
+            x, y = command["x"], command["y"]
+            text = str(command["value"])[:1]
+            if not (0 <= x < width and 0 <= y < height) or not text:
+                continue
+            cell = (
+                text,
+                (
+                    command["foreground"],
+                    command["background"],
+                    command["modifiers"],
                 ),
+            )
+            if text == " ":
+                glyphs.pop((y, x), None)
+                blanks[(y, x)] = cell
+            else:
+                blanks.pop((y, x), None)
+                glyphs[(y, x)] = cell
+        commands.clear()
+        if glyphs:
+            self._paint_stage_glyphs(glyphs)
+        run: list[tuple[str, tuple[Any, ...]]] = []
+        start = (0, 0)
+        for y, x in sorted(blanks):
+            if run and (y, x) != (start[0], start[1] + len(run)):
+                self._paint_stage_run(start, run)
+                run = []
+            if not run:
+                start = (y, x)
+            run.append(blanks[(y, x)])
+        if run:
+            self._paint_stage_run(start, run)
+
+    def _paint_stage_glyphs(
+        self, glyphs: dict[tuple[int, int], tuple[str, tuple[Any, ...]]]
+    ) -> None:
+        """Paint written glyphs as transparent canvases.
+
+        Glyphs that fill most of their bounding box share one canvas over
+        it. Sparser glyphs paint one canvas per row, spanning only that
+        row's written columns, so the gaps never cost more than the cells.
+        """
+        top = min(y for y, _ in glyphs)
+        left = min(x for _, x in glyphs)
+        bottom = max(y for y, _ in glyphs)
+        right = max(x for _, x in glyphs)
+        gap = (" ", (None, None, ()))
+        if (bottom - top + 1) * (right - left + 1) <= 2 * len(glyphs):
+            rows = [
+                _merge_cells(
+                    glyphs.get((y, x), gap) for x in range(left, right + 1)
+                )
+                for y in range(top, bottom + 1)
+            ]
+            self._paint(
+                CellCanvas.from_rows(rows, transparent=True),
                 Area(
-                    x=command["x"],
-                    y=command["y"],
-                    width=1,
-                    height=1,
+                    x=left,
+                    y=top,
+                    width=right - left + 1,
+                    height=bottom - top + 1,
                 ),
                 z=10_000,
             )
-        self.runtime.stage._commands.clear()
+            return
+        by_row: dict[int, dict[int, tuple[str, tuple[Any, ...]]]] = {}
+        for (y, x), cell in glyphs.items():
+            by_row.setdefault(y, {})[x] = cell
+        for y, cells in by_row.items():
+            start, end = min(cells), max(cells)
+            self._paint(
+                CellCanvas.from_rows(
+                    [
+                        _merge_cells(
+                            cells.get(x, gap) for x in range(start, end + 1)
+                        )
+                    ],
+                    transparent=True,
+                ),
+                Area(x=start, y=y, width=end - start + 1, height=1),
+                z=10_000,
+            )
+
+    def _paint_stage_run(
+        self,
+        start: tuple[int, int],
+        cells: list[tuple[str, tuple[Any, ...]]],
+    ) -> None:
+        """Paint one horizontal run of written cells as an opaque canvas."""
+        y, x = start
+        self._paint(
+            CellCanvas.from_rows([_merge_cells(cells)]),
+            Area(x=x, y=y, width=len(cells), height=1),
+            z=10_000,
+        )
+
+
+def _merge_cells(
+    cells: collections.abc.Iterable[tuple[str, tuple[Any, ...]]],
+) -> list[CellSpan]:
+    """Merge adjacent ``(text, style)`` cells of one style into spans."""
+    spans: list[CellSpan] = []
+    text: list[str] = []
+    style: tuple[Any, ...] = ()
+    for character, cell_style in cells:
+        if text and cell_style != style:
+            spans.append(CellSpan("".join(text), *style))
+            text = []
+        style = cell_style
+        text.append(character)
+    if text:
+        spans.append(CellSpan("".join(text), *style))
+    return spans
 
 
 __all__ = ("TerminalController",)
@@ -9,9 +9,9 @@ sized boxes, several with their own inner tabs and effects, driven entirely
 through ``xnano``. The whole scene stays fluid because every animated box
 follows one rule — a per-pixel ``CellCanvas`` is built once and stored on its
 component, then returned unchanged from ``compose`` until a throttled tick
-rebuilds it. The renderer caches lowered canvas IR by object identity, so
-reusing the same canvas between rebuilds is a cache hit rather than a full
-re-lowering every frame.
+rebuilds it. The renderer's lowering cache recognizes the same canvas object
+by identity, without hashing its cells, so reusing it between rebuilds is a
+cache hit rather than a full re-lowering every frame.
 """
 
 from __future__ import annotations
@@ -7,18 +7,25 @@ Collect and invoke hook markers for terminal, web, and synthetic events.
 
 from __future__ import annotations
 
+import dataclasses
 import functools
+import heapq
+import math
 from typing import Any, Iterator
 
 from xnano import hooks
 from xnano.context import Context
-from xnano.events import AbstractEventData, Event
+from xnano.events import (
+    AbstractEventData,
+    Event,
+    binding_index_keys,
+    normalize_keyboard_binding,
+)
 from xnano.utils.dispatch import invoke_hook
 from xnano.utils.introspection import (
     _MISSING,
-    evaluate_reference_value,
-    evaluate_state_expression,
-    is_reference_expression,
+    CompiledExpression,
+    compile_state_expression,
 )
 
 _CONTEXT_EVENT = Event.from_data(AbstractEventData())
@@ -34,6 +41,15 @@ _HOOK_MARKERS = (
     hooks.ON_STATE_HOOK_ATTR,
     hooks.ON_FIELD_HOOK_ATTR,
 )
+_EVENT_MARKERS = (
+    ("keyboard", hooks.ON_KEYBOARD_HOOK_ATTR),
+    ("mouse", hooks.ON_MOUSE_HOOK_ATTR),
+    ("resize", hooks.ON_RESIZE_HOOK_ATTR),
+    ("clipboard", hooks.ON_CLIPBOARD_HOOK_ATTR),
+    ("focus", hooks.ON_FOCUS_HOOK_ATTR),
+    ("tick", hooks.ON_TICK_HOOK_ATTR),
+)
+_EVENT_TYPES = tuple(event_type for event_type, _ in _EVENT_MARKERS)
 
 
 def iter_grids(root: Any) -> Iterator[Any]:
@@ -46,32 +62,428 @@ def iter_grids(root: Any) -> Iterator[Any]:
         yield from iter_grids(getattr(root, name, None))
 
 
+_grid_tree_generation = 0
+
+
+def invalidate_grid_trees() -> None:
+    """Mark every cached grid tree stale.
+
+    ``BaseGrid.__setattr__`` calls this when a field gains or loses a grid
+    or component value, the only assignments that change which grids and
+    focus candidates a tree holds.
+    """
+    global _grid_tree_generation
+    _grid_tree_generation += 1
+
+
+@dataclasses.dataclass(slots=True)
+class GridTree:
+    """Flattened grid tree of one root, reused until a grid field changes.
+
+    Attributes:
+        root: Root the tree was flattened from.
+        generation: Invalidation generation the tree was built at.
+        grids: The root and every nested grid, depth first.
+    """
+
+    root: Any
+    """Root the tree was flattened from."""
+    generation: int
+    """Invalidation generation the tree was built at."""
+    grids: tuple[Any, ...]
+    """The root and every nested grid, depth first."""
+    focus_fields: tuple[tuple[Any, bool], ...] | None = None
+    """Fields that can take focus, collected on first use.
+
+    Each pairs a ``FieldFocus`` with whether it always qualifies (it
+    declares ``autofocus`` or a group); the rest hold a component whose
+    ``focusable`` flag is read on every walk.
+    """
+    autofocus: bool | None = None
+    """Whether any focus target declares ``autofocus``."""
+    timers: list[tuple[int, tuple[int, str]]] | None = None
+    """Heap of ``(deadline, (grid id, hook name))`` for interval ticks."""
+    steady: bool | None = None
+    """Whether some hook needs every tick (tick, event, or idle hooks)."""
+
+
+def _timers(runtime: Any, tree: GridTree) -> list[tuple[int, tuple[int, str]]]:
+    """Return the tree's timer heap, scheduling every interval hook once."""
+    if tree.timers is None:
+        times = runtime._tick_hook_times
+        timers = []
+        for grid in tree.grids:
+            for hook in _hook_table(type(grid))["tick"]:
+                if _is_timer(hook):
+                    key = (id(grid), hook.function_name)
+                    timers.append((times.get(key, 0) + hook.filters[0], key))
+        heapq.heapify(timers)
+        tree.timers = timers
+    return tree.timers
+
+
+def next_tick_deadline(runtime: Any) -> float | None:
+    """Return when the next ``@on_tick(interval)`` hook falls due.
+
+    Args:
+        runtime: Runtime whose root grid tree to inspect.
+
+    Returns:
+        The deadline on the runtime's elapsed-milliseconds clock,
+        ``math.inf`` when no timer is scheduled, or ``None`` when some hook
+        must see every tick (an interval-less ``@on_tick``, ``@on_event``,
+        or idle ``@on_poll``), so the poll cannot sleep past one tick.
+    """
+    tree = grid_tree(runtime)
+    if tree.steady is None:
+        tree.steady = any(
+            table["tick_steady"] or table["idle"]
+            for table in map(_hook_table, map(type, tree.grids))
+        )
+    if tree.steady:
+        return None
+    timers = _timers(runtime, tree)
+    return timers[0][0] if timers else math.inf
+
+
+def _due_timers(
+    runtime: Any, timers: list[tuple[int, tuple[int, str]]]
+) -> set[tuple[int, str]]:
+    """Pop and return the timers due at the runtime's current elapsed time."""
+    elapsed = runtime._elapsed_ms
+    due: set[tuple[int, str]] = set()
+    while timers and timers[0][0] <= elapsed:
+        due.add(heapq.heappop(timers)[1])
+    return due
+
+
+def grid_tree(runtime: Any) -> GridTree:
+    """Return the runtime's cached grid tree, rebuilding it when stale.
+
+    Args:
+        runtime: Runtime or terminal whose ``_root`` to flatten.
+
+    Returns:
+        The cached tree for the current root.
+    """
+    root = getattr(runtime, "_root", None)
+    tree: GridTree | None = getattr(runtime, "_grid_tree", None)
+    if (
+        tree is None
+        or tree.root is not root
+        or tree.generation != _grid_tree_generation
+    ):
+        tree = GridTree(root, _grid_tree_generation, tuple(iter_grids(root)))
+        try:
+            runtime._grid_tree = tree
+        except AttributeError:
+            pass
+    return tree
+
+
+_HIT_BLOCK_COLUMNS = 8
+_HIT_BLOCK_ROWS = 4
+
+
+@dataclasses.dataclass(slots=True)
+class HitIndex:
+    """Field hit regions of one painted frame, bucketed by cell block.
+
+    Each block of ``8x4`` cells lists the hits overlapping it in precedence
+    order: grids depth first, and within a grid the last registered hit
+    first. A lookup scans one short bucket instead of every hit.
+
+    Attributes:
+        tree: Grid tree the hits were collected from.
+        buckets: Hits per ``(block column, block row)``.
+    """
+
+    tree: GridTree
+    """Grid tree the hits were collected from."""
+    buckets: dict[tuple[int, int], list[Any]]
+    """Hits per ``(block column, block row)``."""
+
+    @classmethod
+    def build(cls, tree: GridTree, width: int, height: int) -> HitIndex:
+        """Bucket the hits every grid of ``tree`` registered last paint.
+
+        Args:
+            tree: Grid tree whose ``_grid_field_hits`` to index.
+            width: Viewport width; cells beyond it are never hit.
+            height: Viewport height; cells beyond it are never hit.
+        """
+        buckets: dict[tuple[int, int], list[Any]] = {}
+        for grid in tree.grids:
+            for hit in reversed(getattr(grid, "_grid_field_hits", ())):
+                area = hit.area
+                left = max(area.x, 0)
+                top = max(area.y, 0)
+                right = min(area.x + area.width, width)
+                bottom = min(area.y + area.height, height)
+                if left >= right or top >= bottom:
+                    continue
+                for row in range(
+                    top // _HIT_BLOCK_ROWS, (bottom - 1) // _HIT_BLOCK_ROWS + 1
+                ):
+                    for column in range(
+                        left // _HIT_BLOCK_COLUMNS,
+                        (right - 1) // _HIT_BLOCK_COLUMNS + 1,
+                    ):
+                        bucket = buckets.get((column, row))
+                        if bucket is None:
+                            buckets[column, row] = [hit]
+                        else:
+                            bucket.append(hit)
+        return cls(tree, buckets)
+
+    def at(self, x: int, y: int) -> Any:
+        """Return the topmost hit under cell ``(x, y)``, if any."""
+        bucket = self.buckets.get(
+            (x // _HIT_BLOCK_COLUMNS, y // _HIT_BLOCK_ROWS)
+        )
+        if bucket is not None:
+            for hit in bucket:
+                if hit.area.contains((x, y)):
+                    return hit
+        return None
+
+
+def hit_index(runtime: Any) -> HitIndex:
+    """Return the runtime's hit index, rebuilding it after a paint.
+
+    The runtime drops its index whenever it commits a frame, since painting
+    re-registers every grid's hits; a changed grid tree also forces a
+    rebuild.
+
+    Args:
+        runtime: Runtime whose painted hit regions to index.
+    """
+    tree = grid_tree(runtime)
+    index: HitIndex | None = runtime._hit_index
+    if index is None or index.tree is not tree:
+        width, height = runtime.size
+        index = runtime._hit_index = HitIndex.build(tree, width, height)
+    return index
+
+
+def _tree_grids(root: Any, runtime: Any) -> Any:
+    """Return the cached grids when ``root`` is the runtime's own root."""
+    if root is getattr(runtime, "_root", None):
+        return grid_tree(runtime).grids
+    return iter_grids(root)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Hook:
+    """One hook of a grid class with its filters pre-extracted."""
+
+    name: str
+    """Attribute name the handler is bound under."""
+    kind: str
+    """Event type, or ``"event"``, ``"poll"``, ``"state"``, ``"field"``."""
+    filters: tuple[Any, ...] = ()
+    """Marker-specific filter values, read once at table build."""
+    function_name: str = ""
+    """Underlying function name, keying tick and watch bookkeeping."""
+
+
+def _hook_for(name: str, function: Any, kind: str) -> _Hook:
+    """Build the table entry for ``function`` under marker ``kind``."""
+    filters: tuple[Any, ...] = ()
+    if kind == "keyboard":
+        filters = getattr(function, hooks.ON_KEYBOARD_FILTER_ATTR, ((), None))
+    elif kind == "mouse":
+        buttons, mouse_kind = getattr(
+            function, hooks.ON_MOUSE_FILTER_ATTR, ((), None)
+        )
+        filters = (
+            buttons,
+            mouse_kind,
+            getattr(function, hooks.ON_MOUSE_FIELD_ATTR, None),
+            getattr(function, hooks.ON_MOUSE_GROUP_ATTR, None),
+        )
+    elif kind == "focus":
+        filters = (
+            getattr(function, hooks.ON_FOCUS_KIND_ATTR, None),
+            getattr(function, hooks.ON_FOCUS_FIELD_ATTR, None),
+            getattr(function, hooks.ON_FOCUS_GROUP_ATTR, None),
+        )
+    elif kind == "tick":
+        filters = (getattr(function, hooks.ON_TICK_INTERVAL_ATTR, 0),)
+    elif kind == "state":
+        filters = (getattr(function, hooks.ON_STATE_EXPRESSION_ATTR),)
+    elif kind == "field":
+        filters = (getattr(function, hooks.ON_FIELD_EXPRESSION_ATTR),)
+    return _Hook(name, kind, filters, getattr(function, "__name__", ""))
+
+
 @functools.cache
-def _get_handler_names(grid_class: type) -> tuple[str, ...]:
-    """Return callable attribute names once, respecting class overrides."""
+def _hook_table(grid_class: type) -> dict[str, tuple[_Hook, ...]]:
+    """Return a class's hooks bucketed by what triggers them, built once.
+
+    Each event type maps to its own hooks plus every ``@on_event`` hook,
+    in declaration order; ``"other"`` holds the ``@on_event`` hooks alone,
+    ``"idle"`` the idle polls, and ``"frame"`` the frame polls and the
+    state and field expression hooks. ``"tick_steady"`` is the tick bucket
+    without ``@on_tick(interval)`` hooks, for ticks where no timer is due.
+    Class overrides are respected.
+    """
+    buckets: dict[str, list[_Hook]] = {
+        key: [] for key in (*_EVENT_TYPES, "other", "idle", "frame")
+    }
     seen: set[str] = set()
-    names: list[str] = []
     for base in grid_class.__mro__:
         for name, member in base.__dict__.items():
             if name in seen:
                 continue
             seen.add(name)
-            if callable(member) and any(
+            if not callable(member) or not any(
                 hasattr(member, marker) for marker in _HOOK_MARKERS
             ):
-                names.append(name)
-    return tuple(names)
+                continue
+            function = getattr(member, "__func__", member)
+            if getattr(function, hooks.ON_EVENT_HOOK_ATTR, False):
+                hook = _hook_for(name, function, "event")
+                for key in (*_EVENT_TYPES, "other"):
+                    buckets[key].append(hook)
+            for event_type, marker in _EVENT_MARKERS:
+                if getattr(function, marker, False):
+                    buckets[event_type].append(
+                        _hook_for(name, function, event_type)
+                    )
+            if getattr(function, hooks.ON_POLL_HOOK_ATTR, False):
+                when = getattr(function, hooks.ON_POLL_WHEN_ATTR, "idle")
+                if when in ("idle", "frame"):
+                    buckets[when].append(_hook_for(name, function, "poll"))
+            if (
+                getattr(function, hooks.ON_STATE_EXPRESSION_ATTR, None)
+                is not None
+            ):
+                buckets["frame"].append(_hook_for(name, function, "state"))
+            if (
+                getattr(function, hooks.ON_FIELD_EXPRESSION_ATTR, None)
+                is not None
+            ):
+                buckets["frame"].append(_hook_for(name, function, "field"))
+    buckets["tick_steady"] = [
+        hook for hook in buckets["tick"] if not _is_timer(hook)
+    ]
+    return {key: tuple(bucket) for key, bucket in buckets.items()}
+
 
+def _is_timer(hook: _Hook) -> bool:
+    """Return whether ``hook`` is an ``@on_tick`` hook with an interval."""
+    return hook.kind == "tick" and hook.filters[0] > 0
 
-def _iter_handlers(grid: Any) -> Iterator[Any]:
-    """Yield cached handler attributes bound to ``grid``."""
-    for name in _get_handler_names(type(grid)):
-        yield getattr(grid, name)
+
+_BARE_MODIFIERS = frozenset({"ctrl", "alt", "shift"})
+
+
+def _is_bare_modifier(binding: str) -> bool:
+    modifiers, key = normalize_keyboard_binding(binding)
+    return not modifiers and key in _BARE_MODIFIERS
+
+
+@functools.cache
+def _keyboard_index(
+    grid_class: type,
+) -> tuple[
+    dict[tuple[frozenset[str], str], tuple[_Hook, ...]], tuple[_Hook, ...]
+]:
+    """Return a class's keyboard hooks keyed by normalized binding.
+
+    Each key maps to the hooks a press of that key can fire, in declaration
+    order, with their bindings narrowed to the ones indexed under the key;
+    the second value holds the hooks that see every key (``@on_event``,
+    unfiltered and bare-modifier ``@on_keyboard`` hooks), which are also
+    merged into every keyed entry.
+    """
+    bucket = _hook_table(grid_class)["keyboard"]
+    keyed: dict[tuple[frozenset[str], str], dict[int, list[str]]] = {}
+    loose: dict[int, _Hook] = {}
+    for position, hook in enumerate(bucket):
+        if hook.kind != "keyboard" or not hook.filters[0]:
+            loose[position] = hook
+            continue
+        bindings, kind = hook.filters
+        bare = tuple(
+            binding for binding in bindings if _is_bare_modifier(str(binding))
+        )
+        if bare:
+            loose[position] = dataclasses.replace(hook, filters=(bare, kind))
+        for binding in bindings:
+            if binding in bare:
+                continue
+            for key in binding_index_keys(str(binding)):
+                keyed.setdefault(key, {}).setdefault(position, []).append(
+                    binding
+                )
+
+    def ordered(narrowed: dict[int, list[str]]) -> tuple[_Hook, ...]:
+        hooks: list[_Hook] = []
+        for position, hook in enumerate(bucket):
+            bindings = narrowed.get(position)
+            extra = loose.get(position)
+            if bindings is None:
+                if extra is not None:
+                    hooks.append(extra)
+                continue
+            if extra is not None:
+                bindings = [*bindings, *extra.filters[0]]
+            hooks.append(
+                dataclasses.replace(
+                    hook, filters=(tuple(bindings), hook.filters[1])
+                )
+            )
+        return tuple(hooks)
+
+    return (
+        {key: ordered(narrowed) for key, narrowed in keyed.items()},
+        ordered({}),
+    )
+
+
+def _keyboard_matches(hook: _Hook, event: Any) -> bool:
+    bindings, kind = hook.filters
+    keyboard = event.keyboard_event
+    return keyboard is not None and (
+        (kind is None or keyboard.kind == kind)
+        and (not bindings or keyboard.matches(*bindings))
+    )
+
+
+def _mouse_matches(hook: _Hook, event: Any) -> bool:
+    buttons, kind, expected_field, expected_group = hook.filters
+    mouse = event.mouse_event
+    return mouse is not None and (
+        (kind is None or mouse.kind == kind)
+        and (not buttons or mouse.button in buttons)
+        and (expected_field is None or mouse.field == expected_field)
+        and (expected_group is None or mouse.group == expected_group)
+    )
+
+
+def _focus_matches(hook: _Hook, event: Any) -> bool:
+    expected, expected_field, expected_group = hook.filters
+    focus = event.focus_event
+    return (
+        focus is not None
+        and (expected is None or focus.kind.removeprefix("field_") == expected)
+        and (expected_field is None or focus.field == expected_field)
+        and (expected_group is None or focus.group == expected_group)
+    )
 
 
 def dispatch_event(root: Any, runtime: Any, event: Any) -> None:
     """Dispatch one event through all matching grid hooks.
 
+    Only the hooks bucketed under the event's type are visited, so a tick
+    never touches keyboard hooks and a key press never touches tick hooks.
+    A key press looks its hooks up by normalized binding rather than
+    matching every binding of every keyboard hook, and a tick pops due
+    ``@on_tick(interval)`` hooks off a deadline heap instead of checking
+    each one.
+
     Args:
         root: Root grid.
         runtime: Runtime handling the event.
@@ -79,105 +491,56 @@ def dispatch_event(root: Any, runtime: Any, event: Any) -> None:
     """
     context = Context(event=event, terminal=runtime, state=runtime.state)
     event_type = event.type
-    for grid in iter_grids(root):
-        for handler in _iter_handlers(grid):
-            function = getattr(handler, "__func__", handler)
-            if getattr(function, hooks.ON_EVENT_HOOK_ATTR, False):
-                invoke_hook(handler, grid, context)
-            if event_type == "keyboard" and getattr(
-                function, hooks.ON_KEYBOARD_HOOK_ATTR, False
-            ):
-                bindings, kind = getattr(
-                    function,
-                    hooks.ON_KEYBOARD_FILTER_ATTR,
-                    ((), None),
-                )
-                keyboard = event.keyboard_event
-                if keyboard is not None and (
-                    (kind is None or keyboard.kind == kind)
-                    and (not bindings or keyboard.matches(*bindings))
-                ):
-                    invoke_hook(handler, grid, context)
-            if event_type == "mouse" and getattr(
-                function, hooks.ON_MOUSE_HOOK_ATTR, False
-            ):
-                buttons, kind = getattr(
-                    function,
-                    hooks.ON_MOUSE_FILTER_ATTR,
-                    ((), None),
-                )
-                mouse = event.mouse_event
-                expected_field = getattr(
-                    function,
-                    hooks.ON_MOUSE_FIELD_ATTR,
-                    None,
-                )
-                expected_group = getattr(
-                    function,
-                    hooks.ON_MOUSE_GROUP_ATTR,
-                    None,
-                )
-                if mouse is not None and (
-                    (kind is None or mouse.kind == kind)
-                    and (not buttons or mouse.button in buttons)
-                    and (
-                        expected_field is None or mouse.field == expected_field
-                    )
-                    and (
-                        expected_group is None or mouse.group == expected_group
-                    )
-                ):
-                    invoke_hook(handler, grid, context)
-            if event_type == "resize" and getattr(
-                function,
-                hooks.ON_RESIZE_HOOK_ATTR,
-                False,
-            ):
-                invoke_hook(handler, grid, context)
-            if event_type == "clipboard" and getattr(
-                function,
-                hooks.ON_CLIPBOARD_HOOK_ATTR,
-                False,
-            ):
-                invoke_hook(handler, grid, context)
-            if event_type == "focus" and getattr(
-                function,
-                hooks.ON_FOCUS_HOOK_ATTR,
-                False,
-            ):
-                focus = event.focus_event
-                expected = getattr(function, hooks.ON_FOCUS_KIND_ATTR, None)
-                expected_field = getattr(
-                    function, hooks.ON_FOCUS_FIELD_ATTR, None
-                )
-                expected_group = getattr(
-                    function, hooks.ON_FOCUS_GROUP_ATTR, None
-                )
-                if (
-                    focus is not None
-                    and (
-                        expected is None
-                        or focus.kind.removeprefix("field_") == expected
-                    )
-                    and (
-                        expected_field is None or focus.field == expected_field
-                    )
-                    and (
-                        expected_group is None or focus.group == expected_group
-                    )
-                ):
-                    invoke_hook(handler, grid, context)
-            if event_type == "tick" and getattr(
-                function,
-                hooks.ON_TICK_HOOK_ATTR,
-                False,
-            ):
-                interval = getattr(function, hooks.ON_TICK_INTERVAL_ATTR, 0)
-                key = (id(grid), getattr(function, "__name__", ""))
-                last = runtime._tick_hook_times.get(key, 0)
-                if interval <= 0 or runtime._elapsed_ms - last >= interval:
-                    runtime._tick_hook_times[key] = runtime._elapsed_ms
-                    invoke_hook(handler, grid, context)
+    index_key = None
+    if event_type == "keyboard":
+        keyboard = event.keyboard_event
+        index_key = None if keyboard is None else keyboard._index_key()
+    due: set[tuple[int, str]] | None = None
+    timers: list[tuple[int, tuple[int, str]]] = []
+    if event_type == "tick" and root is getattr(runtime, "_root", None):
+        tree = grid_tree(runtime)
+        timers = _timers(runtime, tree)
+        due = _due_timers(runtime, timers)
+        if not due:
+            event_type = "tick_steady"
+    for grid in _tree_grids(root, runtime):
+        if index_key is not None:
+            keyed, loose = _keyboard_index(type(grid))
+            candidates = keyed.get(index_key, loose)
+        else:
+            table = _hook_table(type(grid))
+            candidates = table.get(event_type, table["other"])
+        for hook in candidates:
+            kind = hook.kind
+            if kind == "event":
+                runtime.request_render()
+            elif kind == "keyboard":
+                if not _keyboard_matches(hook, event):
+                    continue
+            elif kind == "mouse":
+                if not _mouse_matches(hook, event):
+                    continue
+            elif kind == "focus":
+                if not _focus_matches(hook, event):
+                    continue
+            elif kind == "tick":
+                interval = hook.filters[0]
+                key = (id(grid), hook.function_name)
+                elapsed = runtime._elapsed_ms
+                if interval > 0:
+                    if due is None:
+                        last = runtime._tick_hook_times.get(key, 0)
+                        if elapsed - last < interval:
+                            continue
+                    elif key not in due:
+                        continue
+                    else:
+                        heapq.heappush(timers, (elapsed + interval, key))
+                runtime._tick_hook_times[key] = elapsed
+                # A fired tick hook may change anything it can reach,
+                # so it always earns a frame under render-on-demand.
+                runtime.request_render()
+            invoke_hook(getattr(grid, hook.name), grid, context, wait=False)
 
 
 def dispatch_post_init(root: Any, runtime: Any) -> None:
@@ -191,7 +554,7 @@ def dispatch_post_init(root: Any, runtime: Any) -> None:
     context = Context(
         event=_CONTEXT_EVENT, terminal=runtime, state=runtime.state
     )
-    for grid in iter_grids(root):
+    for grid in _tree_grids(root, runtime):
         if grid is None or id(grid) in fired:
             continue
         fired.add(id(grid))
@@ -205,24 +568,28 @@ def dispatch_idle(root: Any, runtime: Any) -> None:
     context = Context(
         event=_CONTEXT_EVENT, terminal=runtime, state=runtime.state
     )
-    for grid in iter_grids(root):
-        for handler in _iter_handlers(grid):
-            function = getattr(handler, "__func__", handler)
-            if (
-                getattr(function, hooks.ON_POLL_HOOK_ATTR, False)
-                and getattr(function, hooks.ON_POLL_WHEN_ATTR, "idle")
-                == "idle"
-            ):
-                invoke_hook(handler, grid, context)
+    for grid in _tree_grids(root, runtime):
+        for hook in _hook_table(type(grid))["idle"]:
+            runtime.request_render()
+            invoke_hook(getattr(grid, hook.name), grid, context, wait=False)
+
+
+def _same_inputs(previous: tuple[Any, ...], current: tuple[Any, ...]) -> bool:
+    """Return whether two expression input snapshots hold equal values."""
+    return all(
+        old is new or (type(old) is type(new) and old == new)
+        for old, new in zip(previous, current)
+    )
 
 
 def _expression_hook_fires(
     runtime: Any,
     grid: Any,
-    function: Any,
+    name: str,
     kind: str,
     expression: str,
     target: Any,
+    assigned: set[tuple[int, str]],
 ) -> bool:
     """Return whether a state/field expression hook should fire this frame.
 
@@ -231,13 +598,65 @@ def _expression_hook_fires(
     seen for this hook, and a difference triggers exactly once. Anything
     with computation (``count > 0``) keeps the truthiness semantics, firing
     every frame the expression holds.
+
+    When every value the expression reads is immutable and equal to last
+    frame's, it is not evaluated again: a reference cannot have changed,
+    and a computed expression reuses its previous result. A bare name on a
+    ``State`` or grid is only re-read on frames after it was assigned,
+    whatever its value: ``assigned`` holds the assignments published since
+    the previous frame, and the runtime's change set those made since.
     """
-    if not is_reference_expression(expression):
-        return evaluate_state_expression(expression, target)
-    current = evaluate_reference_value(expression, target)
-    if current is _MISSING:
+    compiled = compile_state_expression(expression)
+    if compiled is None:
+        return False
+    key = (id(grid), name, kind)
+    memo = runtime._expression_memo
+    watches = compiled.watches
+    if watches is not None and getattr(
+        type(target), "_publishes_changes", False
+    ):
+        cached = memo.get(key)
+        if (
+            cached is not None
+            and cached[0] is compiled
+            and cached[1] == id(target)
+            and (id(target), watches) not in assigned
+            and not runtime._changes.changed(target, watches)
+        ):
+            return False
+        memo[key] = (compiled, id(target))
+        return _expression_fires(runtime, key, compiled, target)
+    inputs = compiled.inputs(target)
+    cached = memo.get(key)
+    if (
+        inputs is not None
+        and cached is not None
+        and cached[0] is compiled
+        and _same_inputs(cached[1], inputs)
+    ):
+        return cached[2]
+    fired = _expression_fires(runtime, key, compiled, target)
+    if inputs is None:
+        memo.pop(key, None)
+    else:
+        # A reference whose inputs hold still has no mutation to report.
+        memo[key] = (compiled, inputs, fired and not compiled.reference)
+    return fired
+
+
+def _expression_fires(
+    runtime: Any,
+    key: tuple[int, str, str],
+    compiled: CompiledExpression,
+    target: Any,
+) -> bool:
+    """Evaluate one expression hook; see :func:`_expression_hook_fires`."""
+    try:
+        current = compiled.evaluate(target)
+    except Exception:
         return False
-    key = (id(grid), getattr(function, "__name__", ""), kind)
+    if not compiled.reference:
+        return bool(current)
     watched = runtime._watch_values
     previous = watched.get(key, _MISSING)
     watched[key] = current
@@ -251,39 +670,33 @@ def dispatch_frame(root: Any, runtime: Any) -> None:
     context = Context(
         event=_CONTEXT_EVENT, terminal=runtime, state=runtime.state
     )
-    for grid in iter_grids(root):
-        for handler in _iter_handlers(grid):
-            function = getattr(handler, "__func__", handler)
-            if (
-                getattr(function, hooks.ON_POLL_HOOK_ATTR, False)
-                and getattr(function, hooks.ON_POLL_WHEN_ATTR, "idle")
-                == "frame"
-            ):
-                invoke_hook(handler, grid, context)
-            state_expression = getattr(
-                function,
-                hooks.ON_STATE_EXPRESSION_ATTR,
-                None,
-            )
-            if state_expression is not None and runtime.state is not None:
-                if _expression_hook_fires(
+    state = runtime.state
+    assigned = runtime._changes.take()
+    for grid in _tree_grids(root, runtime):
+        for hook in _hook_table(type(grid))["frame"]:
+            kind = hook.kind
+            if kind == "state":
+                if state is None or not _expression_hook_fires(
                     runtime,
                     grid,
-                    function,
+                    hook.function_name,
                     "state",
-                    state_expression,
-                    runtime.state,
+                    hook.filters[0],
+                    state,
+                    assigned,
                 ):
-                    invoke_hook(handler, grid, context)
-            field_expression = getattr(
-                function,
-                hooks.ON_FIELD_EXPRESSION_ATTR,
-                None,
-            )
-            if field_expression is not None and _expression_hook_fires(
-                runtime, grid, function, "field", field_expression, grid
+                    continue
+            elif kind == "field" and not _expression_hook_fires(
+                runtime,
+                grid,
+                hook.function_name,
+                "field",
+                hook.filters[0],
+                grid,
+                assigned,
             ):
-                invoke_hook(handler, grid, context)
+                continue
+            invoke_hook(getattr(grid, hook.name), grid, context, wait=False)
 
 
 __all__ = (
@@ -291,5 +704,11 @@ __all__ = (
     "dispatch_frame",
     "dispatch_idle",
     "dispatch_post_init",
+    "GridTree",
+    "HitIndex",
+    "grid_tree",
+    "hit_index",
+    "invalidate_grid_trees",
     "iter_grids",
+    "next_tick_deadline",
 )
@@ -11,11 +11,67 @@ from __future__ import annotations
 import dataclasses
 from typing import Any, Mapping, Sequence
 
+_FIELDS = (
+    "width",
+    "height",
+    "text",
+    "ansi",
+    "cursor_position",
+    "cursor_visible",
+    "cursor_style",
+    "title",
+    "commands",
+    "revision",
+)
+
+
+class _FrameState:
+    """Private slots of a ``Frame``, kept out of its dataclass fields."""
+
+    __slots__ = ("_buffer", "_rows", "_ansi_rows")
+
+
+class _Serialized:
+    """Frame field serialized from the native buffer on first read.
+
+    Wraps the field's slot: a stored string is returned as-is, while
+    ``None`` (what a runtime passes) is replaced on first read by the
+    buffer's serialization, or an empty string without one.
+    """
+
+    def __init__(self, slot: Any, lines: str) -> None:
+        self._slot = slot
+        self._lines = lines
+
+    def __get__(self, frame: Frame | None, owner: type) -> Any:
+        if frame is None:
+            return self
+        value = self._slot.__get__(frame, owner)
+        if value is None:
+            value = (
+                ""
+                if frame._buffer is None
+                else "\n".join(getattr(frame, self._lines)())
+            )
+            self._slot.__set__(frame, value)
+        return value
+
+    def __set__(self, frame: Frame, value: str | None) -> None:
+        self._slot.__set__(frame, value)
+
+    def stored(self, frame: Frame) -> str | None:
+        """Return the stored value, ``None`` while still unserialized."""
+        return self._slot.__get__(frame, type(frame))
+
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Frame:
+class Frame(_FrameState):
     """Immutable snapshot of one painted native frame.
 
+    A runtime builds frames around the native buffer snapshot and
+    serializes ``text``, ``ansi``, and ``rows`` on first access, so a caller
+    that only reads ``revision`` or ``text`` never pays for ANSI encoding.
+
     Example:
         ``Frame(width=20, height=4, text="Ready")``
 
@@ -53,20 +109,265 @@ class Frame:
     revision: int = 0
     """Monotonic frame revision."""
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_buffer", None)
+        object.__setattr__(self, "_rows", None)
+        object.__setattr__(self, "_ansi_rows", None)
+
+    @classmethod
+    def _from_buffer(cls, buffer: Any, **fields: Any) -> Frame:
+        """Build a frame whose ``text`` and ``ansi`` serialize ``buffer``."""
+        frame = cls(text=None, ansi=None, **fields)  # type: ignore[arg-type]
+        object.__setattr__(frame, "_buffer", buffer)
+        return frame
+
+    def _text_lines(self) -> Sequence[str]:
+        """Return the buffer's plain-text rows."""
+        return self._buffer.to_string_lines()
+
+    def _ansi_lines(self) -> tuple[str, ...]:
+        """Return the buffer's ANSI rows, serialized once per frame.
+
+        :meth:`diff` compares these rows, so a frame diffed against its
+        predecessor and then against its successor encodes its buffer once.
+        """
+        lines = self._ansi_rows
+        if lines is None:
+            lines = tuple(self._buffer.to_ansi_lines())
+            object.__setattr__(self, "_ansi_rows", lines)
+        return lines
+
     @property
     def rows(self) -> tuple[str, ...]:
         """Plain-text rows of the frame."""
-        if not self.text:
-            return tuple("" for _ in range(self.height))
-        lines = self.text.split("\n")
-        if len(lines) < self.height:
-            lines = lines + [""] * (self.height - len(lines))
-        return tuple(lines[: self.height])
+        rows = self._rows
+        if rows is not None:
+            return rows
+        text = self.text
+        if not text:
+            rows = tuple("" for _ in range(self.height))
+        else:
+            lines = text.split("\n")
+            if len(lines) < self.height:
+                lines = lines + [""] * (self.height - len(lines))
+            rows = tuple(lines[: self.height])
+        object.__setattr__(self, "_rows", rows)
+        return rows
 
     def contains(self, needle: str) -> bool:
         """Return whether plain text contains ``needle``."""
         return needle in self.text
 
+    def diff(self, previous: Frame | None) -> FrameDiff:
+        """Return what changed since ``previous``.
+
+        Rows are compared through the native buffer's per-row styled
+        serialization, which each frame computes once and keeps, so diffing
+        a stream of frames encodes every buffer a single time. Only changed
+        rows are walked cell by cell. Frames built from text alone diff
+        whole rows without styles.
+
+        Args:
+            previous: Earlier frame, or ``None`` to describe every row.
+
+        Returns:
+            Changed rows, style runs of changed cells, and cursor, title,
+            and command changes.
+        """
+        full = (
+            previous is None
+            or previous.width != self.width
+            or previous.height != self.height
+        )
+        old = None if full else previous
+        buffer = self._buffer
+        base = None if old is None else old._buffer
+        if buffer is None or (old is not None and base is None):
+            old_rows = None if old is None else old.rows
+            rows = tuple(
+                y
+                for y, row in enumerate(self.rows)
+                if old_rows is None or old_rows[y] != row
+            )
+            runs = tuple(CellRun(0, y, self.rows[y]) for y in rows)
+        else:
+            new_lines = self._ansi_lines()
+            old_lines = None if old is None else old._ansi_lines()
+            rows = tuple(
+                y
+                for y in range(self.height)
+                if old_lines is None or old_lines[y] != new_lines[y]
+            )
+            runs = _cell_runs(self.width, buffer, base, rows)
+        if previous is None:
+            cursor_moved = title_changed = True
+        else:
+            cursor_moved = (
+                previous.cursor_position,
+                previous.cursor_visible,
+                previous.cursor_style,
+            ) != (self.cursor_position, self.cursor_visible, self.cursor_style)
+            title_changed = previous.title != self.title
+        return FrameDiff(
+            width=self.width,
+            height=self.height,
+            revision=self.revision,
+            base_revision=None if previous is None else previous.revision,
+            rows=rows,
+            runs=runs,
+            cursor_moved=cursor_moved,
+            cursor_position=self.cursor_position,
+            cursor_visible=self.cursor_visible,
+            cursor_style=self.cursor_style,
+            title_changed=title_changed,
+            title=self.title,
+            commands=self.commands,
+        )
+
+    def __reduce__(self) -> tuple[Any, tuple[Any, ...]]:
+        # Pickle the serialized fields, never the native snapshot.
+        return (type(self), tuple(getattr(self, name) for name in _FIELDS))
+
+
+# ``slots=True`` turns every field into a slot, so the lazy fields wrap
+# theirs once the class exists.
+Frame.text = _Serialized(Frame.text, "_text_lines")  # type: ignore[assignment]
+Frame.ansi = _Serialized(Frame.ansi, "_ansi_lines")  # type: ignore[assignment]
+
+
+def _cell_key(cell: Any) -> tuple[str, str, str, str]:
+    return (
+        cell.symbol,
+        str(cell.fg),
+        str(cell.bg),
+        str(cell.modifier),
+    )
+
+
+def _cell_runs(
+    width: int, buffer: Any, base: Any, rows: tuple[int, ...]
+) -> tuple[CellRun, ...]:
+    """Group the changed cells of ``rows`` into same-style runs."""
+    if not rows:
+        return ()
+    cells = buffer.content()
+    old_cells = None if base is None else base.content()
+    runs: list[CellRun] = []
+    for y in rows:
+        start = y * width
+        run_x = -1
+        run_symbols: list[str] = []
+        run_style: tuple[str, str, str] | None = None
+        for x in range(width):
+            key = _cell_key(cells[start + x])
+            changed = (
+                old_cells is None or _cell_key(old_cells[start + x]) != key
+            )
+            style = key[1:]
+            if changed and run_x >= 0 and style == run_style:
+                run_symbols.append(key[0])
+                continue
+            if run_x >= 0:
+                runs.append(
+                    CellRun(run_x, y, "".join(run_symbols), *run_style)
+                )
+                run_x = -1
+            if changed:
+                run_x, run_symbols, run_style = x, [key[0]], style
+        if run_x >= 0 and run_style is not None:
+            runs.append(CellRun(run_x, y, "".join(run_symbols), *run_style))
+    return tuple(runs)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CellRun:
+    """Consecutive changed cells on one row that share a style.
+
+    Attributes:
+        x: Column of the first cell.
+        y: Row of the run.
+        text: Cell symbols, concatenated.
+        foreground: Foreground color name, when styles are known.
+        background: Background color name, when styles are known.
+        modifiers: Modifier flags, when styles are known.
+    """
+
+    x: int
+    """Column of the first cell."""
+    y: int
+    """Row of the run."""
+    text: str
+    """Cell symbols, concatenated."""
+    foreground: str | None = None
+    """Foreground color name, when styles are known."""
+    background: str | None = None
+    """Background color name, when styles are known."""
+    modifiers: str | None = None
+    """Modifier flags, when styles are known."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FrameDiff:
+    """Changes between two frame revisions.
+
+    Example:
+        ``frame.diff(previous).rows`` lists the rows a viewer must repaint.
+
+    Attributes:
+        width: Frame width in cells.
+        height: Frame height in cells.
+        revision: Revision of the newer frame.
+        base_revision: Revision diffed against, or ``None`` for a full
+            frame.
+        rows: Indexes of rows with any changed cell.
+        runs: Same-style runs of changed cells.
+        cursor_moved: Whether the caret position, visibility, or style
+            changed.
+        cursor_position: Caret position in the newer frame.
+        cursor_visible: Caret visibility in the newer frame.
+        cursor_style: Caret style in the newer frame.
+        title_changed: Whether the title changed.
+        title: Title of the newer frame.
+        commands: Device commands emitted with the newer frame.
+    """
+
+    width: int
+    """Frame width in cells."""
+    height: int
+    """Frame height in cells."""
+    revision: int
+    """Revision of the newer frame."""
+    base_revision: int | None
+    """Revision diffed against, or ``None`` for a full frame."""
+    rows: tuple[int, ...] = ()
+    """Indexes of rows with any changed cell."""
+    runs: tuple[CellRun, ...] = ()
+    """Same-style runs of changed cells."""
+    cursor_moved: bool = False
+    """Whether the caret position, visibility, or style changed."""
+    cursor_position: tuple[int, int] | None = None
+    """Caret position in the newer frame."""
+    cursor_visible: bool = True
+    """Caret visibility in the newer frame."""
+    cursor_style: str | None = None
+    """Caret style in the newer frame."""
+    title_changed: bool = False
+    """Whether the title changed."""
+    title: str | None = None
+    """Title of the newer frame."""
+    commands: tuple[Mapping[str, Any], ...] = ()
+    """Device commands emitted with the newer frame."""
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether nothing visible changed."""
+        return not (
+            self.rows
+            or self.cursor_moved
+            or self.title_changed
+            or self.commands
+        )
+
 
 def frame_from_terminal(terminal: Any, *, revision: int = 0) -> Frame:
     """Build a ``Frame`` snapshot from a terminal or runtime.
@@ -133,4 +434,4 @@ def frame_from_terminal(terminal: Any, *, revision: int = 0) -> Frame:
     )
 
 
-__all__ = ("Frame", "frame_from_terminal")
+__all__ = ("CellRun", "Frame", "FrameDiff", "frame_from_terminal")
@@ -48,7 +48,7 @@ class AbstractInterface:
         return getattr(self, "_grid_field_states", {}).get(name)
 
     def grid_mark_field_dirty(self, name: str) -> None:
-        """Mark a field as changed.
+        """Mark a field as changed and request a frame from the runtime.
 
         Args:
             name: Field attribute name.
@@ -57,6 +57,11 @@ class AbstractInterface:
         if state is not None:
             state.mark_dirty()
             state.value = getattr(self, name, None)
+            from xnano.core.runtime import get_active_runtime
+
+            runtime = get_active_runtime()
+            if runtime is not None:
+                runtime.request_render()
 
     @warn_renamed_attribute(
         "AbstractInterface.get_field_state",
@@ -0,0 +1,418 @@
+"""xnano.core.profiling
+
+---
+
+Record opt-in per-phase frame timings, per-hook wall times, and Chrome
+trace-event timelines.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import json
+import logging
+import math
+import os
+import threading
+import time
+from typing import Any
+
+PHASES: tuple[str, ...] = (
+    "events",
+    "hooks",
+    "grid_render",
+    "layout",
+    "lower",
+    "native_render",
+    "snapshot",
+)
+"""Pipeline phases a frame sample reports, in pipeline order."""
+
+_hook_logger = logging.getLogger("xnano.hooks")
+
+NO_PHASE: contextlib.AbstractContextManager[None] = contextlib.nullcontext()
+"""Shared no-op phase returned while profiling is off."""
+
+
+@dataclasses.dataclass(slots=True)
+class FrameSample:
+    """Timings and counts recorded for one painted frame.
+
+    Phase times are self times: a nested phase (``grid_render`` for a
+    child grid inside ``layout``) is subtracted from its parent, so the
+    phases of one sample add up to ``total``.
+
+    Attributes:
+        phases: Self time per phase in milliseconds.
+        nodes: Paint nodes committed to the native session.
+        lowered: Content values lowered to native render nodes.
+        events: Native events dispatched ahead of the frame.
+    """
+
+    phases: dict[str, float] = dataclasses.field(
+        default_factory=lambda: dict.fromkeys(PHASES, 0.0)
+    )
+    """Self time per phase in milliseconds."""
+    nodes: int = 0
+    """Paint nodes committed to the native session."""
+    lowered: int = 0
+    """Content values lowered to native render nodes."""
+    events: int = 0
+    """Native events dispatched ahead of the frame."""
+
+    @property
+    def total(self) -> float:
+        """Milliseconds spent across every phase of the frame."""
+        return sum(self.phases.values())
+
+
+class _Phase:
+    """Time one phase of the current sample, excluding nested phases."""
+
+    __slots__ = ("_stats", "_name", "_start", "_nested")
+
+    def __init__(self, stats: FrameStats, name: str) -> None:
+        self._stats = stats
+        self._name = name
+        self._start = 0.0
+        self._nested = 0.0
+
+    def __enter__(self) -> None:
+        self._stats._open.append(self)
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exception: Any) -> None:
+        elapsed = (time.perf_counter() - self._start) * 1000
+        stats = self._stats
+        stats._open.pop()
+        phases = stats._current.phases
+        phases[self._name] = phases.get(self._name, 0.0) + (
+            elapsed - self._nested
+        )
+        if stats._open:
+            stats._open[-1]._nested += elapsed
+
+
+class FrameStats:
+    """Ring buffer of recent frame samples with percentile summaries.
+
+    A runtime created with ``profile=True`` owns one as ``runtime.stats``
+    and closes a sample each time it paints.
+
+    Example:
+        >>> stats = FrameStats(capacity=4)
+        >>> with stats.phase("layout"):
+        ...     pass
+        >>> sample = stats.end_frame()
+        >>> len(stats.samples)
+        1
+    """
+
+    def __init__(self, capacity: int = 512) -> None:
+        self._samples: collections.deque[FrameSample] = collections.deque(
+            maxlen=max(1, capacity)
+        )
+        self._current = FrameSample()
+        self._open: list[_Phase] = []
+
+    @property
+    def samples(self) -> tuple[FrameSample, ...]:
+        """Recorded samples, oldest first."""
+        return tuple(self._samples)
+
+    def phase(self, name: str) -> _Phase:
+        """Return a context manager timing ``name`` in the current frame."""
+        return _Phase(self, name)
+
+    def count(self, *, nodes: int = 0, lowered: int = 0) -> None:
+        """Add paint-node and lowering counts to the current frame."""
+        self._current.nodes += nodes
+        self._current.lowered += lowered
+
+    def end_frame(self, *, events: int = 0) -> FrameSample:
+        """Close the current sample, push it, and start the next one."""
+        sample = self._current
+        sample.events = events
+        self._samples.append(sample)
+        self._current = FrameSample()
+        return sample
+
+    def amend(self, name: str, milliseconds: float) -> None:
+        """Add time spent after a frame closed, such as its snapshot."""
+        if self._samples:
+            phases = self._samples[-1].phases
+            phases[name] = phases.get(name, 0.0) + milliseconds
+
+    def clear(self) -> None:
+        """Drop every recorded sample."""
+        self._samples.clear()
+
+    def percentiles(
+        self,
+        phase: str = "total",
+        quantiles: tuple[float, ...] = (0.5, 0.95, 0.99),
+    ) -> dict[str, float]:
+        """Return nearest-rank percentiles for one phase, in milliseconds.
+
+        Args:
+            phase: A name from :data:`PHASES`, or ``"total"``.
+            quantiles: Fractions in ``(0, 1]`` to report.
+
+        Returns:
+            ``{"p50": ..., "p95": ..., "p99": ...}`` keyed by quantile;
+            zeros before any frame is recorded.
+        """
+        values = sorted(
+            sample.total if phase == "total" else sample.phases.get(phase, 0.0)
+            for sample in self._samples
+        )
+        result: dict[str, float] = {}
+        for quantile in quantiles:
+            key = f"p{quantile * 100:g}"
+            if not values:
+                result[key] = 0.0
+                continue
+            rank = max(1, math.ceil(quantile * len(values)))
+            result[key] = values[min(rank, len(values)) - 1]
+        return result
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return p50/p95/p99 for every phase and the frame total."""
+        return {name: self.percentiles(name) for name in (*PHASES, "total")}
+
+    def report(self) -> str:
+        """Format :meth:`summary` as a fixed-width text table."""
+        lines = [
+            f"{len(self._samples)} frames (ms)",
+            f"{'phase':<14}{'p50':>9}{'p95':>9}{'p99':>9}",
+        ]
+        for name, values in self.summary().items():
+            lines.append(
+                f"{name:<14}"
+                + "".join(f"{value:>9.3f}" for value in values.values())
+            )
+        return "\n".join(lines)
+
+
+@dataclasses.dataclass(slots=True)
+class HookRecord:
+    """Accumulated wall time for one hook.
+
+    Attributes:
+        calls: Completed invocations.
+        total_ms: Cumulative wall time in milliseconds.
+        max_ms: Longest single invocation in milliseconds.
+        slow: Invocations that exceeded the budget.
+    """
+
+    calls: int = 0
+    """Completed invocations."""
+    total_ms: float = 0.0
+    """Cumulative wall time in milliseconds."""
+    max_ms: float = 0.0
+    """Longest single invocation in milliseconds."""
+    slow: int = 0
+    """Invocations that exceeded the budget."""
+
+    @property
+    def mean_ms(self) -> float:
+        """Average wall time per invocation in milliseconds."""
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+class HookStats:
+    """Call counts and wall times per ``(grid class, hook name)``.
+
+    A runtime created with ``profile=True`` or ``hook_budget_ms=...`` owns
+    one as ``runtime.hook_stats``; ``invoke_hook`` records every hook it
+    runs for that runtime. An invocation slower than ``budget_ms`` logs a
+    warning through the ``xnano.hooks`` logger.
+
+    Example:
+        >>> stats = HookStats(budget_ms=None)
+        >>> stats.record(("App", "step"), 2.0)
+        >>> stats.records[("App", "step")].calls
+        1
+    """
+
+    def __init__(self, budget_ms: float | None = None) -> None:
+        self.budget_ms = budget_ms
+        self._records: dict[tuple[str, str], HookRecord] = {}
+
+    @property
+    def records(self) -> dict[tuple[str, str], HookRecord]:
+        """Accumulated records keyed by ``(grid class, hook name)``."""
+        return dict(self._records)
+
+    def record(self, key: tuple[str, str], elapsed_ms: float) -> None:
+        """Add one invocation of ``key`` that took ``elapsed_ms``."""
+        entry = self._records.get(key)
+        if entry is None:
+            entry = self._records[key] = HookRecord()
+        entry.calls += 1
+        entry.total_ms += elapsed_ms
+        if elapsed_ms > entry.max_ms:
+            entry.max_ms = elapsed_ms
+        budget = self.budget_ms
+        if budget is not None and elapsed_ms > budget:
+            entry.slow += 1
+            _hook_logger.warning(
+                "Slow hook %s.%s took %.1f ms (budget %.1f ms)",
+                key[0],
+                key[1],
+                elapsed_ms,
+                budget,
+            )
+
+    def slowest(
+        self, limit: int = 10
+    ) -> list[tuple[tuple[str, str], HookRecord]]:
+        """Return up to ``limit`` hooks ordered by cumulative wall time."""
+        ranked = sorted(
+            self._records.items(),
+            key=lambda item: item[1].total_ms,
+            reverse=True,
+        )
+        return ranked[:limit]
+
+    def clear(self) -> None:
+        """Drop every record."""
+        self._records.clear()
+
+    def report(self, limit: int = 10) -> str:
+        """Format :meth:`slowest` as a fixed-width text table."""
+        lines = [f"{'hook':<40}{'calls':>8}{'total':>10}{'mean':>9}{'max':>9}"]
+        for (owner, name), entry in self.slowest(limit):
+            label = f"{owner}.{name}" if owner else name
+            lines.append(
+                f"{label[:39]:<40}{entry.calls:>8}{entry.total_ms:>10.2f}"
+                f"{entry.mean_ms:>9.3f}{entry.max_ms:>9.3f}"
+            )
+        return "\n".join(lines)
+
+
+class _Span:
+    """Record one complete (``"X"``) trace event around a block."""
+
+    __slots__ = ("_recorder", "_name", "_cat", "_args", "_inner", "_start")
+
+    def __init__(
+        self,
+        recorder: TraceRecorder,
+        name: str,
+        cat: str,
+        args: dict[str, Any] | None,
+        inner: Any,
+    ) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._cat = cat
+        self._args = args
+        self._inner = inner
+        self._start = 0
+
+    def __enter__(self) -> None:
+        if self._inner is not None:
+            self._inner.__enter__()
+        self._start = time.perf_counter_ns()
+
+    def __exit__(self, *exception: Any) -> None:
+        end = time.perf_counter_ns()
+        recorder = self._recorder
+        event: dict[str, Any] = {
+            "name": self._name,
+            "cat": self._cat,
+            "ph": "X",
+            "ts": (self._start - recorder._origin) / 1000,
+            "dur": (end - self._start) / 1000,
+            "pid": recorder._pid,
+            "tid": threading.get_ident(),
+        }
+        if self._args:
+            event["args"] = self._args
+        recorder._events.append(event)
+        if self._inner is not None:
+            self._inner.__exit__(*exception)
+
+
+class TraceRecorder:
+    """Collect trace events for ``about:tracing`` and Perfetto.
+
+    Spans nest by time on each thread, so the viewer draws pump, dispatch,
+    hook, render, layout, lowering, and native-render spans as a flame
+    chart; counters draw as tracks. Only the newest ``limit`` events are
+    kept.
+
+    Example:
+        >>> recorder = TraceRecorder()
+        >>> with recorder.span("layout"):
+        ...     pass
+        >>> recorder.events[0]["ph"]
+        'X'
+    """
+
+    def __init__(self, *, limit: int = 1_000_000) -> None:
+        self._events: collections.deque[dict[str, Any]] = collections.deque(
+            maxlen=max(1, limit)
+        )
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    @property
+    def events(self) -> list[dict[str, Any]]:
+        """Recorded trace events, oldest first."""
+        return list(self._events)
+
+    def span(
+        self,
+        name: str,
+        *,
+        cat: str = "xnano",
+        args: dict[str, Any] | None = None,
+        inner: Any = None,
+    ) -> _Span:
+        """Return a context manager recording ``name`` as one span.
+
+        Args:
+            name: Label shown on the span.
+            cat: Trace category used for filtering in the viewer.
+            args: Extra values shown when the span is selected.
+            inner: Optional context manager entered inside the span, such
+                as a :class:`FrameStats` phase timing the same block.
+        """
+        return _Span(self, name, cat, args, inner)
+
+    def counter(self, name: str, values: dict[str, float]) -> None:
+        """Record counter ``values`` as one sample of the ``name`` track."""
+        self._events.append(
+            {
+                "name": name,
+                "ph": "C",
+                "ts": (time.perf_counter_ns() - self._origin) / 1000,
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+                "args": values,
+            }
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        """Return the trace as a JSON-object-format document."""
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str | os.PathLike[str]) -> None:
+        """Write the trace JSON to ``path``."""
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_json(), handle)
+
+
+__all__ = (
+    "NO_PHASE",
+    "PHASES",
+    "FrameSample",
+    "FrameStats",
+    "HookRecord",
+    "HookStats",
+    "TraceRecorder",
+)
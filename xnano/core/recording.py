@@ -0,0 +1,377 @@
+"""xnano.core.recording
+
+---
+
+Record a session's input stream and replay it deterministically offscreen
+for frame-time and frame-equality regression checks.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import time
+from typing import TYPE_CHECKING, Any, Callable
+
+from xnano.core.profiling import NO_PHASE
+
+if TYPE_CHECKING:
+    import contextlib
+
+    from xnano.core.profiling import FrameStats
+
+_FORMAT = "xnano-recording"
+_VERSION = 1
+_PAYLOADS = ("mouse", "resize", "clipboard", "focus", "tick")
+
+
+def frame_digest(text: str) -> str:
+    """Return the digest recorded for one frame's plain text."""
+    return hashlib.blake2b(text.encode(), digest_size=12).hexdigest()
+
+
+def event_to_record(event: Any) -> dict[str, Any] | None:
+    """Serialize a public event to a JSON-ready dictionary.
+
+    Args:
+        event: Event built by ``event_from_core`` or an action.
+
+    Returns:
+        ``{"type": ..., **payload}``, or ``None`` for payloads without a
+        public representation.
+    """
+    from xnano.events import KeyboardEventData
+
+    try:
+        data = event.data
+    except ValueError:
+        return None
+    if isinstance(data, KeyboardEventData):
+        record: dict[str, Any] = {
+            "type": "keyboard",
+            "binding": str(data.binding),
+            "kind": data.kind,
+        }
+        if data.character is not None:
+            record["character"] = data.character
+        return record
+    if data.type not in _PAYLOADS:
+        return None
+    record = {"type": data.type}
+    for field in dataclasses.fields(data):
+        value = getattr(data, field.name)
+        if value != field.default:
+            record[field.name] = value
+    return record
+
+
+def event_from_record(record: dict[str, Any]) -> Any:
+    """Rebuild a public event from :func:`event_to_record` output.
+
+    Raises:
+        ValueError: If the record's type is not a recordable payload.
+    """
+    from xnano.events import Event, KeyboardEventData
+
+    values = dict(record)
+    kind = values.pop("type", None)
+    if kind == "keyboard":
+        return Event.from_data(
+            KeyboardEventData.from_binding(
+                str(values["binding"]),
+                kind=values.get("kind", "press"),
+                character=values.get("character"),
+            )
+        )
+    payload = _payload_class(kind)
+    return Event.from_data(payload(**values))
+
+
+def _payload_class(kind: Any) -> Any:
+    """Return the event-data class serialized under ``kind``."""
+    from xnano import events
+
+    classes = {
+        "mouse": events.MouseEventData,
+        "resize": events.ResizeEventData,
+        "clipboard": events.ClipboardEventData,
+        "focus": events.FocusEventData,
+        "tick": events.TickEventData,
+    }
+    if kind not in classes:
+        raise ValueError(f"Unknown recorded event type: {kind!r}")
+    return classes[kind]
+
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class RecordedStep:
+    """One dispatched event or painted frame in a recording.
+
+    Attributes:
+        at_ms: Milliseconds since recording started.
+        event: Serialized event, or ``None`` for a frame mark.
+        digest: Frame text digest, when frames were captured.
+    """
+
+    at_ms: float
+    """Milliseconds since recording started."""
+    event: dict[str, Any] | None = None
+    """Serialized event, or ``None`` for a frame mark."""
+    digest: str | None = None
+    """Frame text digest, when frames were captured."""
+
+    @property
+    def is_frame(self) -> bool:
+        """Whether this step marks a painted frame."""
+        return self.event is None
+
+
+@dataclasses.dataclass(slots=True)
+class Recording:
+    """Input stream of one session and the frames it painted.
+
+    Stored as JSON lines: a header with the viewport size, then one compact
+    object per step.
+
+    Attributes:
+        width: Viewport width when recording started.
+        height: Viewport height when recording started.
+        steps: Events and frame marks, in dispatch order.
+    """
+
+    width: int
+    """Viewport width when recording started."""
+    height: int
+    """Viewport height when recording started."""
+    steps: list[RecordedStep] = dataclasses.field(default_factory=list)
+    """Events and frame marks, in dispatch order."""
+
+    @property
+    def frames(self) -> int:
+        """Number of frame marks."""
+        return sum(1 for step in self.steps if step.event is None)
+
+    def write(self, path: str | os.PathLike[str]) -> None:
+        """Write the recording to ``path``."""
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(
+                _dumps(
+                    {
+                        "format": _FORMAT,
+                        "version": _VERSION,
+                        "size": [self.width, self.height],
+                    }
+                )
+            )
+            for step in self.steps:
+                line: dict[str, Any] = {"t": round(step.at_ms, 3)}
+                if step.event is None:
+                    line["f"] = step.digest
+                else:
+                    line["e"] = step.event
+                handle.write(_dumps(line))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> Recording:
+        """Read a recording written by :meth:`write`.
+
+        Raises:
+            ValueError: If ``path`` is not an xnano recording.
+        """
+        with open(path, encoding="utf-8") as handle:
+            header = json.loads(handle.readline() or "{}")
+            if header.get("format") != _FORMAT:
+                raise ValueError(f"{os.fspath(path)!r} is not a recording")
+            width, height = header["size"]
+            recording = cls(int(width), int(height))
+            for line in handle:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                recording.steps.append(
+                    RecordedStep(
+                        at_ms=float(entry["t"]),
+                        event=entry.get("e"),
+                        digest=entry.get("f"),
+                    )
+                )
+        return recording
+
+
+def _dumps(value: Any) -> str:
+    """Return one compact JSON line."""
+    return json.dumps(value, separators=(",", ":")) + "\n"
+
+
+class _Capture:
+    """Mark the recorder busy so nested dispatches are not recorded."""
+
+    __slots__ = ("_recorder",)
+
+    def __init__(self, recorder: SessionRecorder) -> None:
+        self._recorder = recorder
+
+    def __enter__(self) -> None:
+        self._recorder._busy = True
+
+    def __exit__(self, *exception: Any) -> None:
+        self._recorder._busy = False
+
+
+class SessionRecorder:
+    """Append a runtime's dispatched events and frame marks to a recording.
+
+    A runtime created with ``record=...`` owns one as ``runtime.recorder``.
+    Only outermost dispatches are recorded: events a hook dispatches while
+    handling another are reproduced by replaying their cause.
+
+    Example:
+        >>> recorder = SessionRecorder(80, 24)
+        >>> recorder.frame()
+        >>> recorder.recording.frames
+        1
+    """
+
+    def __init__(
+        self, width: int, height: int, *, frames: bool = False
+    ) -> None:
+        self.frames = frames
+        self._recording = Recording(width, height)
+        self._origin = time.perf_counter()
+        self._busy = False
+
+    @property
+    def recording(self) -> Recording:
+        """Recording collected so far."""
+        return self._recording
+
+    def _now(self) -> float:
+        return (time.perf_counter() - self._origin) * 1000
+
+    def capture(self, event: Any) -> contextlib.AbstractContextManager[None]:
+        """Record ``event`` unless it is nested in another dispatch.
+
+        Returns:
+            A context manager to hold around the event's dispatch.
+        """
+        if self._busy:
+            return NO_PHASE
+        record = event_to_record(event)
+        if record is not None:
+            self._recording.steps.append(RecordedStep(self._now(), record))
+        return _Capture(self)
+
+    def frame(self, text: str | None = None) -> None:
+        """Mark a painted frame, with its digest when ``text`` is given."""
+        self._recording.steps.append(
+            RecordedStep(
+                self._now(),
+                digest=None if text is None else frame_digest(text),
+            )
+        )
+
+
+@dataclasses.dataclass(slots=True)
+class ReplayReport:
+    """Outcome of one :func:`replay`.
+
+    Attributes:
+        stats: Per-phase timings for every replayed frame.
+        frames: Frames painted.
+        mismatches: Indexes of frames whose text differed from the
+            recorded digest.
+        resized: Indexes of frames recorded after a resize to a size other
+            than the starting one.
+    """
+
+    stats: FrameStats
+    """Per-phase timings for every replayed frame."""
+    frames: int = 0
+    """Frames painted."""
+    mismatches: list[int] = dataclasses.field(default_factory=list)
+    """Indexes of frames whose text differed from the recorded digest."""
+    resized: list[int] = dataclasses.field(default_factory=list)
+    """Indexes of frames recorded at a viewport size the replay could not
+    reproduce; their digests are not checked."""
+
+
+def replay(
+    recording: Recording | str | os.PathLike[str],
+    factory: Callable[[], Any],
+    *,
+    state: Any = None,
+    check_frames: bool = False,
+) -> ReplayReport:
+    """Replay a recording against a fresh offscreen runtime.
+
+    Events are dispatched in recorded order and a frame is painted at every
+    frame mark, without sleeping between steps; tick events carry their
+    recorded ``elapsed_ms``, so ``@on_tick`` intervals fire on the same
+    frames they did live. The offscreen viewport keeps the recorded starting
+    size: resize events still reach hooks, but frames painted while the
+    recording was at another size are listed in ``resized`` instead of
+    being checked against their digests.
+
+    Args:
+        recording: A :class:`Recording` or a path to one.
+        factory: Callable returning the root grid or component; called
+            once per replay so replays are repeatable.
+        state: Application state shared with hooks.
+        check_frames: Raise when a frame differs from its recorded digest.
+
+    Returns:
+        Frame timings, the frame count, and any mismatched frames.
+
+    Raises:
+        AssertionError: If ``check_frames`` is set and a frame differs.
+    """
+    from xnano.core.runtime import Runtime
+
+    if not isinstance(recording, Recording):
+        recording = Recording.load(recording)
+    runtime = Runtime.offscreen(
+        recording.width, recording.height, state=state, profile=True
+    )
+    assert runtime.stats is not None
+    report = ReplayReport(runtime.stats)
+    size = (recording.width, recording.height)
+    try:
+        runtime.set_root(factory())
+        for step in recording.steps:
+            if step.event is not None:
+                event = event_from_record(step.event)
+                if step.event["type"] == "resize":
+                    size = (event.data.width, event.data.height)
+                runtime.dispatch(event)
+                continue
+            frame = runtime.render()
+            if size != runtime.size:
+                report.resized.append(report.frames)
+            elif (
+                step.digest is not None
+                and frame_digest(frame.text) != step.digest
+            ):
+                report.mismatches.append(report.frames)
+                if check_frames:
+                    raise AssertionError(
+                        f"Replayed frame {report.frames} differs from the "
+                        f"recording:\n{frame.text}"
+                    )
+            report.frames += 1
+    finally:
+        runtime.close()
+    return report
+
+
+__all__ = (
+    "RecordedStep",
+    "Recording",
+    "ReplayReport",
+    "SessionRecorder",
+    "event_from_record",
+    "event_to_record",
+    "frame_digest",
+    "replay",
+)
@@ -8,6 +8,7 @@ Lower components and content primitives into ``xnano_core`` render nodes.
 from __future__ import annotations
 
 import collections
+import threading
 from typing import Any
 
 import xnano_core.rust.native as native
@@ -254,30 +255,158 @@ def _canvas_shape(shape: Any) -> tuple[Any, ...]:
     raise TypeError(f"Unsupported canvas shape: {type(shape)!r}")
 
 
-_CELL_CANVAS_IR_CACHE_CAPACITY = 64
-_cell_canvas_ir_cache: "collections.OrderedDict[int, tuple[Any, Any]]" = (
-    collections.OrderedDict()
+class LoweringCache:
+    """Bounded LRU of lowered render IR for frozen content values.
+
+    Content primitives are frozen dataclasses, so the ``CoreRenderIR``
+    lowered for one is cached and replayed. A component that returns the
+    very same object again, like a canvas stored between rebuilds, hits by
+    identity without hashing it. Content rebuilt equal every frame, like a
+    static label or an unchanged table, hits by value: a miss hashes it
+    once and compares it with the entry of the same hash. Content that
+    cannot be hashed is lowered afresh. ``CoreRenderIR`` is immutable and
+    cloned on paint, so reusing one instance across frames is safe.
+
+    Native IR must be released on the thread that built it, so each thread
+    keeps its own entries, bounded by ``capacity`` apiece. Each entry keeps
+    its latest content alive, so the bound also caps what the cache holds.
+
+    Example:
+        >>> cache = LoweringCache(capacity=2)
+        >>> cache.lookup(TextBlock(text="ok")) is None
+        True
+        >>> cache.store(TextBlock(text="ok"), "ir")
+        >>> cache.lookup(TextBlock(text="ok")), cache.hits, cache.misses
+        ('ir', 1, 1)
+    """
+
+    def __init__(self, capacity: int = 32) -> None:
+        self._local = threading.local()
+        self._capacity = max(0, capacity)
+        self.hits = 0
+        """Lookups answered from the cache."""
+        self.misses = 0
+        """Lookups that had to lower the content."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def _entries(self) -> collections.OrderedDict[int, tuple[Any, Any]]:
+        """Entries lowered on the calling thread, keyed by content hash."""
+        try:
+            return self._local.entries
+        except AttributeError:
+            entries = self._local.entries = collections.OrderedDict()
+            self._local.identities = {}
+            self._local.missed = None
+            return entries
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of cached entries; ``0`` disables caching."""
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int) -> None:
+        self._capacity = max(0, value)
+        self._trim()
+
+    def _hash(self, content: Any) -> int | None:
+        # The last miss's hash is kept for the ``store`` that follows it.
+        missed = getattr(self._local, "missed", None)
+        if missed is not None and missed[0] is content:
+            return missed[1]
+        try:
+            return hash(content)
+        except TypeError:
+            return None
+
+    def _hold(self, digest: int, content: Any, render_ir: Any) -> None:
+        """Make ``content`` the entry for ``digest`` and index its identity."""
+        entries = self._entries
+        identities = self._local.identities
+        previous = entries.get(digest)
+        if previous is not None and identities.get(id(previous[0])) == digest:
+            del identities[id(previous[0])]
+        entries[digest] = (content, render_ir)
+        entries.move_to_end(digest)
+        identities[id(content)] = digest
+
+    def lookup(self, content: Any) -> Any | None:
+        """Return the cached IR for ``content``, or ``None`` on a miss."""
+        entries = self._entries
+        digest = self._local.identities.get(id(content))
+        cached = None if digest is None else entries.get(digest)
+        if cached is not None and cached[0] is content:
+            entries.move_to_end(digest)
+            self.hits += 1
+            return cached[1]
+        digest = self._hash(content)
+        cached = None if digest is None else entries.get(digest)
+        if cached is not None and cached[0] == content:
+            # Hold the newer object, so it hits by identity next frame.
+            self._hold(digest, content, cached[1])
+            self._local.missed = None
+            self.hits += 1
+            return cached[1]
+        self._local.missed = None if digest is None else (content, digest)
+        self.misses += 1
+        return None
+
+    def store(self, content: Any, render_ir: Any) -> None:
+        """Cache ``render_ir`` as the lowering of ``content``."""
+        digest = self._hash(content)
+        self._local.missed = None
+        if digest is None or not self._capacity:
+            return
+        self._hold(digest, content, render_ir)
+        self._trim()
+
+    def clear(self) -> None:
+        """Drop this thread's entries and reset the hit and miss counters."""
+        self._entries.clear()
+        self._local.identities.clear()
+        self._local.missed = None
+        self.hits = self.misses = 0
+
+    def _trim(self) -> None:
+        entries = self._entries
+        identities = self._local.identities
+        while len(entries) > self._capacity:
+            digest, (content, _) = entries.popitem(last=False)
+            if identities.get(id(content)) == digest:
+                del identities[id(content)]
+
+
+lowering_cache = LoweringCache()
+"""Process-wide cache consulted by :func:`lower_content`."""
+
+_MEMOIZED_CONTENT = (
+    Run,
+    TextBlock,
+    Gauge,
+    LineGauge,
+    Bars,
+    Sparkline,
+    Items,
+    TableGrid,
+    Scrollbar,
+    Canvas,
+    CellCanvas,
 )
-"""Identity-keyed LRU of lowered ``CellCanvas`` IR.
+"""Content types lowered to a single ``CoreRenderIR``; see ``LoweringCache``.
 
-Lowering a canvas rebuilds one ``IrLine`` per row and resolves a native color
-for every span, every frame — the dominant cost when painting per-pixel
-canvases (backgrounds, splashes, image frames). A canvas re-paints unchanged
-across many frames, and even animated content rebuilds only a few canvases per
-tick, so the lowered ``CoreRenderIR`` is cached and replayed. ``CoreRenderIR``
-is immutable and cloned on paint, so reusing one instance across frames is
-safe. Each entry keeps a strong reference to the source canvas so its ``id``
-can never be reused by another object while cached; the ``is`` check makes
-that explicit. Bounded so long-running animations do not grow it unbounded."""
+Plots, stacks, and panels lower to native nodes, which cannot be shared
+between frames, but their children still hit the cache."""
 
 
 def _cell_canvas_ir(content: CellCanvas) -> Any:
-    """Return cached (or freshly lowered) ``CoreRenderIR`` for a canvas."""
-    key = id(content)
-    cached = _cell_canvas_ir_cache.get(key)
-    if cached is not None and cached[0] is content:
-        _cell_canvas_ir_cache.move_to_end(key)
-        return cached[1]
+    """Lower a canvas to one ``IrLine`` per row of resolved spans.
+
+    A transparent canvas lowers to a glyph overlay, which skips space cells
+    so lower layers show through.
+    """
     lines = [
         core.IrLine.from_spans(
             [
@@ -292,12 +421,18 @@ def _cell_canvas_ir(content: CellCanvas) -> Any:
         )
         for row in content.rows
     ]
-    render_ir = core.CoreRenderIR.text_lines(lines)
-    _cell_canvas_ir_cache[key] = (content, render_ir)
-    _cell_canvas_ir_cache.move_to_end(key)
-    while len(_cell_canvas_ir_cache) > _CELL_CANVAS_IR_CACHE_CAPACITY:
-        _cell_canvas_ir_cache.popitem(last=False)
-    return render_ir
+    if content.transparent:
+        return core.CoreRenderIR.glyph_overlay(lines)
+    return core.CoreRenderIR.text_lines(lines)
+
+
+def _ir_node(content: Any, render_ir: Any) -> core.CoreRenderNode:
+    """Wrap lowered IR in a leaf node carrying the content's layer."""
+    return core.CoreRenderNode(
+        content=core.CoreRenderContent.ir(render_ir),
+        z=getattr(content, "z", 0),
+        visible=getattr(content, "visible", True),
+    )
 
 
 def lower_content(content: Any) -> core.CoreRenderNode:
@@ -388,6 +523,11 @@ def lower_content(content: Any) -> core.CoreRenderNode:
         return core.CoreRenderNode.leaf(core.CoreRenderContent.empty())
     if isinstance(content, str):
         content = TextBlock(text=content)
+    memoize = isinstance(content, _MEMOIZED_CONTENT)
+    if memoize:
+        render_ir = lowering_cache.lookup(content)
+        if render_ir is not None:
+            return _ir_node(content, render_ir)
     if isinstance(content, Run):
         render_ir = core.CoreRenderIR.span(
             content.text,
@@ -616,11 +756,9 @@ def lower_content(content: Any) -> core.CoreRenderNode:
         )
     else:
         render_ir = core.CoreRenderIR.paragraph_raw(str(content))
-    return core.CoreRenderNode(
-        content=core.CoreRenderContent.ir(render_ir),
-        z=getattr(content, "z", 0),
-        visible=getattr(content, "visible", True),
-    )
+    if memoize:
+        lowering_cache.store(content, render_ir)
+    return _ir_node(content, render_ir)
 
 
-__all__ = ("lower_content",)
+__all__ = ("LoweringCache", "lower_content", "lowering_cache")
@@ -9,10 +9,18 @@ from __future__ import annotations
 
 import atexit
 import collections
+import contextlib
 import contextvars
+import dataclasses
+import logging
+import os
+import select
 import signal
+import socket
+import sys
 import threading
 import time
+import weakref
 from typing import Any, Callable, Generic, Sequence, TypeVar
 
 from xnano_core.core import CoreSession
@@ -21,12 +29,19 @@ from xnano.actions import Actions
 from xnano.area import Alignment, PaddingLike, VerticalAlignment
 from xnano.colors import ColorLike
 from xnano.core.content import Panel, Stack, TextBlock
-from xnano.core.frame import Frame
+from xnano.core.frame import Frame, FrameDiff
+from xnano.core.profiling import (
+    NO_PHASE,
+    FrameStats,
+    HookStats,
+    TraceRecorder,
+)
+from xnano.core.recording import Recording, SessionRecorder
 from xnano.core.rendering import lower_content
 from xnano.core.stage import Stage
 from xnano.cursor import Cursor
 from xnano.device import Device
-from xnano.events import event_from_core
+from xnano.events import Event, event_from_core
 from xnano.types import (
     Border,
     CharacterModifier,
@@ -35,13 +50,17 @@ from xnano.types import (
     Side,
     is_grid,
 )
+from xnano.utils.changes import ChangeSet
 from xnano.utils.deprecation import (
     resolve_color_alias,
     resolve_renamed_alias,
 )
+from xnano.utils.dispatch import HookLoop
 
 StateT = TypeVar("StateT")
 
+_logger = logging.getLogger("xnano.profile")
+
 _EXIT_SIGNALS: tuple[signal.Signals, ...] = tuple(
     resolved
     for resolved in (
@@ -54,6 +73,44 @@ platform. ``SIGHUP`` (controlling-terminal hangup) is POSIX-only and
 simply absent on Windows; individual signals a platform accepts to
 ``signal.signal`` but rejects at install time are skipped there too."""
 
+_RESIZE_SIGNAL: signal.Signals | None = getattr(signal, "SIGWINCH", None)
+"""Terminal resize signal, absent on Windows."""
+
+_resize_wakers: weakref.WeakSet[_WakeHandle] = weakref.WeakSet()
+"""Wake handles of live runtimes, poked on every terminal resize."""
+
+_resize_wake_installed = False
+
+
+def _wake_on_resize(signum: int, frame: Any) -> None:
+    """Interrupt every live runtime's input wait after a resize."""
+    for waker in tuple(_resize_wakers):
+        waker.wake()
+
+
+def _install_resize_wake() -> None:
+    """Route ``SIGWINCH`` into the live runtimes' wake handles.
+
+    Installed once per process, before the first live session starts
+    reading input, and never restored: crossterm's own resize handler is
+    registered on that first read and chains to whatever handler it finds,
+    so replacing ours later would silence it. A no-op off the main thread
+    and on platforms without the signal.
+    """
+    global _resize_wake_installed
+    if _resize_wake_installed or _RESIZE_SIGNAL is None:
+        return
+    try:
+        previous = signal.getsignal(_RESIZE_SIGNAL)
+        if previous not in (signal.SIG_DFL, signal.SIG_IGN, None):
+            # Another Python handler owns the signal; leave it alone.
+            return
+        signal.signal(_RESIZE_SIGNAL, _wake_on_resize)
+    except (OSError, ValueError, RuntimeError):
+        return
+    _resize_wake_installed = True
+
+
 _ACTIVE_RUNTIME: contextvars.ContextVar["Runtime[Any] | None"] = (
     contextvars.ContextVar("_ACTIVE_BETA_RUNTIME", default=None)
 )
@@ -84,6 +141,40 @@ def _atexit_restore_active_runtime() -> None:
 atexit.register(_atexit_restore_active_runtime)
 
 
+class _WakeHandle:
+    """Socket pair that lets ``call_soon`` interrupt an input wait.
+
+    The UI thread watches the read end next to the terminal's input
+    descriptor; any thread writes a byte to wake it. A full buffer means a
+    wake is already pending, so failed writes are dropped.
+    """
+
+    def __init__(self) -> None:
+        self._reader, self._writer = socket.socketpair()
+        self._reader.setblocking(False)
+        self._writer.setblocking(False)
+
+    def fileno(self) -> int:
+        return self._reader.fileno()
+
+    def wake(self) -> None:
+        try:
+            self._writer.send(b"\0")
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        try:
+            while self._reader.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        self._reader.close()
+        self._writer.close()
+
+
 class Runtime(Generic[StateT]):
     """Drive one application through an ``xnano_core`` session.
 
@@ -95,6 +186,15 @@ class Runtime(Generic[StateT]):
         terminal: Compatibility name for this runtime.
         surface: Presentation surface name.
         is_live: Whether the runtime owns the user's terminal.
+        render_on_demand: Whether run loops skip frames when nothing
+            changed.
+        drain_events: Whether each pump dispatches every pending event.
+        frame_event_count: Native events folded into the latest frame.
+        hook_loop: Persistent asyncio loop that runs async hooks.
+        stats: Per-phase frame timings, when created with ``profile=True``.
+        hook_stats: Per-hook wall times, when profiling or given a
+            ``hook_budget_ms``.
+        tracer: Active Chrome trace recorder, while tracing.
         state: Application state shared with hooks.
         device: Display controls for the session.
         cursor: Cursor controls for the session.
@@ -120,6 +220,13 @@ class Runtime(Generic[StateT]):
         title: str | None = None,
         surface: str = "terminal",
         tick_interval: int = 16,
+        render_on_demand: bool = False,
+        drain_events: bool = False,
+        profile: bool = False,
+        hook_budget_ms: float | None = None,
+        trace: str | os.PathLike[str] | None = None,
+        record: str | os.PathLike[str] | None = None,
+        record_frames: bool = False,
     ) -> None:
         self._session = session
         self._live = live
@@ -137,6 +244,8 @@ class Runtime(Generic[StateT]):
         self._tick_hook_times: dict[tuple[int, str], int] = {}
         self._post_init_grids: set[int] = set()
         self._watch_values: dict[tuple[int, str, str], Any] = {}
+        self._expression_memo: dict[tuple[int, str, str], Any] = {}
+        self._changes = ChangeSet()
         self._grid_breakpoints: dict[int, str] = {}
         self._tick_interval = max(1, tick_interval)
         self._last_tick_ms = time.monotonic() * 1000
@@ -149,6 +258,32 @@ class Runtime(Generic[StateT]):
             tuple[Callable[..., Any], tuple[Any, ...]]
         ] = collections.deque()
         self._call_soon_lock = threading.Lock()
+        self._render_on_demand = render_on_demand
+        self._render_requested = True
+        self._rendered_size: tuple[int, int] | None = None
+        self._drain_events = drain_events
+        self._batch_events = 0
+        self._frame_event_count = 0
+        self._last_frame: Frame | None = None
+        self._grid_tree: Any = None
+        self._hit_index: Any = None
+        self._retained_paint: dict[tuple[Any, ...], Any] = {}
+        self._hook_loop: HookLoop | None = None
+        self._waker: _WakeHandle | None = None
+        self._stats: FrameStats | None = FrameStats() if profile else None
+        self._hook_stats: HookStats | None = (
+            HookStats(hook_budget_ms)
+            if profile or hook_budget_ms is not None
+            else None
+        )
+        self._tracer: TraceRecorder | None = None
+        self._trace_path = trace
+        if trace is not None:
+            self.start_trace()
+        self._recorder: SessionRecorder | None = None
+        self._record_path = record
+        if record is not None:
+            self.start_recording(frames=record_frames)
         if title is not None:
             self._device.title = title
 
@@ -160,8 +295,16 @@ class Runtime(Generic[StateT]):
         title: str | None = None,
         tick_interval: int = 16,
         mouse_events: bool = False,
+        render_on_demand: bool = False,
+        drain_events: bool = False,
+        profile: bool = False,
+        hook_budget_ms: float | None = None,
+        trace: str | os.PathLike[str] | None = None,
+        record: str | os.PathLike[str] | None = None,
+        record_frames: bool = False,
     ) -> "Runtime[StateT]":
         """Create a runtime backed by the active terminal."""
+        _install_resize_wake()
         session = CoreSession.init(tick_rate_ms=None)
         if mouse_events:
             session.enable_mouse_capture()
@@ -171,6 +314,13 @@ class Runtime(Generic[StateT]):
             state=state,
             title=title,
             tick_interval=tick_interval,
+            render_on_demand=render_on_demand,
+            drain_events=drain_events,
+            profile=profile,
+            hook_budget_ms=hook_budget_ms,
+            trace=trace,
+            record=record,
+            record_frames=record_frames,
         )
 
     @classmethod
@@ -181,6 +331,12 @@ class Runtime(Generic[StateT]):
         *,
         state: StateT | None = None,
         title: str | None = None,
+        render_on_demand: bool = False,
+        profile: bool = False,
+        hook_budget_ms: float | None = None,
+        trace: str | os.PathLike[str] | None = None,
+        record: str | os.PathLike[str] | None = None,
+        record_frames: bool = False,
     ) -> "Runtime[StateT]":
         """Create an active in-memory runtime."""
         runtime = cls(
@@ -189,6 +345,12 @@ class Runtime(Generic[StateT]):
             state=state,
             title=title,
             surface="offscreen",
+            render_on_demand=render_on_demand,
+            profile=profile,
+            hook_budget_ms=hook_budget_ms,
+            trace=trace,
+            record=record,
+            record_frames=record_frames,
         )
         return runtime.enter()
 
@@ -256,8 +418,15 @@ class Runtime(Generic[StateT]):
         if self._closed:
             return
         self._closed = True
+        self._changes.close()
         if self._token is not None:
-            _ACTIVE_RUNTIME.reset(self._token)
+            try:
+                _ACTIVE_RUNTIME.reset(self._token)
+            except ValueError:
+                # Closed from another context than the one that entered it,
+                # e.g. the asyncio task driving ``Terminal.run_async``.
+                if _ACTIVE_RUNTIME.get() is self:
+                    _ACTIVE_RUNTIME.set(None)
             self._token = None
         # Restore the host terminal first (raw mode, mouse tracking,
         # alternate screen, SGR) so a failure restoring signal handlers
@@ -267,10 +436,26 @@ class Runtime(Generic[StateT]):
         finally:
             # Runtime owns cursor/device/action proxies that point back to it,
             # so the Python object can remain in a reference cycle after
-            # close. Release the unsendable PyO3 session now, on its owner
-            # thread, instead of leaving its destructor to a later GC pass.
+            # close. Release the unsendable PyO3 session and retained paint
+            # nodes now, on their owner thread, instead of leaving their
+            # destructors to a later GC pass.
             del self._session
+            self._retained_paint = {}
             self._restore_signal_handlers()
+            if self._hook_loop is not None:
+                self._hook_loop.close()
+            if self._waker is not None:
+                waker, self._waker = self._waker, None
+                _resize_wakers.discard(waker)
+                waker.close()
+            if self._stats is not None and self._stats.samples:
+                _logger.info("frame timings\n%s", self._stats.report())
+            if self._hook_stats is not None and self._hook_stats.records:
+                _logger.info("hook timings\n%s", self._hook_stats.report())
+            if self._trace_path is not None:
+                self.stop_trace(self._trace_path)
+            if self._record_path is not None:
+                self.stop_recording(self._record_path)
 
     def __enter__(self) -> "Runtime[StateT]":
         return self.enter()
@@ -298,6 +483,125 @@ class Runtime(Generic[StateT]):
         """Whether the runtime owns the user's terminal."""
         return self._live
 
+    @property
+    def render_on_demand(self) -> bool:
+        """Whether run loops paint only frames that something requested."""
+        return self._render_on_demand
+
+    @property
+    def drain_events(self) -> bool:
+        """Whether each pump dispatches every pending native event."""
+        return self._drain_events
+
+    @property
+    def frame_event_count(self) -> int:
+        """Native events dispatched between the last two painted frames."""
+        return self._frame_event_count
+
+    @property
+    def stats(self) -> FrameStats | None:
+        """Return recent frame timings, or ``None`` unless profiling."""
+        return self._stats
+
+    @property
+    def hook_stats(self) -> HookStats | None:
+        """Return per-hook wall times, or ``None`` unless accounting."""
+        return self._hook_stats
+
+    def _phase(self, name: str) -> contextlib.AbstractContextManager[None]:
+        """Time ``name`` in the current frame sample and trace, if any."""
+        stats = self._stats
+        tracer = self._tracer
+        if tracer is None:
+            return NO_PHASE if stats is None else stats.phase(name)
+        return tracer.span(
+            name,
+            cat="frame",
+            inner=None if stats is None else stats.phase(name),
+        )
+
+    def _trace(
+        self, name: str, cat: str = "runtime"
+    ) -> contextlib.AbstractContextManager[None]:
+        """Record ``name`` as a trace span while tracing."""
+        tracer = self._tracer
+        return NO_PHASE if tracer is None else tracer.span(name, cat=cat)
+
+    @property
+    def tracer(self) -> TraceRecorder | None:
+        """Return the active trace recorder, or ``None``."""
+        return self._tracer
+
+    def start_trace(self) -> TraceRecorder:
+        """Start recording a Chrome trace of pumps, hooks, and frames.
+
+        Returns:
+            The new recorder; any earlier recording is discarded.
+        """
+        self._tracer = TraceRecorder()
+        return self._tracer
+
+    def stop_trace(
+        self, path: str | os.PathLike[str] | None = None
+    ) -> TraceRecorder | None:
+        """Stop tracing and optionally write the trace JSON to ``path``.
+
+        Returns:
+            The recorder that was active, or ``None`` when not tracing.
+        """
+        tracer, self._tracer = self._tracer, None
+        if tracer is not None and path is not None:
+            tracer.write(path)
+        return tracer
+
+    @property
+    def recorder(self) -> SessionRecorder | None:
+        """Return the active session recorder, or ``None``."""
+        return self._recorder
+
+    def start_recording(self, *, frames: bool = False) -> SessionRecorder:
+        """Start recording dispatched events and painted frames.
+
+        Args:
+            frames: Store a digest of every painted frame so a replay can
+                check it reproduces the same screens. Off by default: it
+                serializes the whole buffer on every frame.
+
+        Returns:
+            The new recorder; any earlier recording is discarded.
+        """
+        width, height = self.size
+        self._recorder = SessionRecorder(width, height, frames=frames)
+        return self._recorder
+
+    def stop_recording(
+        self, path: str | os.PathLike[str] | None = None
+    ) -> Recording | None:
+        """Stop recording and optionally write it to ``path``.
+
+        Returns:
+            The finished recording, or ``None`` when not recording.
+        """
+        recorder, self._recorder = self._recorder, None
+        if recorder is None:
+            return None
+        if path is not None:
+            recorder.recording.write(path)
+        return recorder.recording
+
+    @property
+    def hook_loop(self) -> HookLoop:
+        """Return the persistent loop async hooks run on, starting it."""
+        if self._hook_loop is None:
+            self._hook_loop = HookLoop(self._wake_hook_steps)
+        return self._hook_loop
+
+    def _wake_hook_steps(self) -> None:
+        """Queue the hook loop's pending coroutine steps for the UI thread."""
+        hook_loop = self._hook_loop
+        if hook_loop is not None:
+            self.call_soon(hook_loop.run_steps)
+
     @property
     def state(self) -> StateT | None:
         """Application state shared with hooks."""
@@ -389,24 +693,27 @@ class Runtime(Generic[StateT]):
             )
             from xnano.utils.focus import ensure_default_field_focus
 
-            dispatch_post_init(self._root, self)
-            ensure_default_field_focus(self)
-            dispatch_frame(self._root, self)
+            with self._phase("hooks"):
+                dispatch_post_init(self._root, self)
+                ensure_default_field_focus(self)
+                dispatch_frame(self._root, self)
         if len(items) == 1 and is_grid(items[0]):
             from xnano.area import Area
             from xnano.core.controller import TerminalController
 
             self._stage.areas.clear()
             controller = TerminalController(self)
-            items[0]._grid_build_frame(
-                Area(x=0, y=0, width=self.size[0], height=self.size[1]),
-                controller,
-            )
-            controller.paint_stage()
+            with self._phase("layout"):
+                items[0]._grid_build_frame(
+                    Area(x=0, y=0, width=self.size[0], height=self.size[1]),
+                    controller,
+                )
+                controller.paint_stage()
             controller.commit()
             from xnano.utils.focus import place_cursor_for_focus
 
             place_cursor_for_focus(self)
+            self._mark_rendered()
             return
         panel_requested = (
             border is not None
@@ -459,13 +766,17 @@ class Runtime(Generic[StateT]):
                 )
                 for item in items
             ]
-            for styled, item_area in zip(
-                styled_items,
-                controller.split_layout(viewport, direction, gap, constraints),
-            ):
-                controller._paint(styled, item_area)
-            controller.paint_stage()
+            with self._phase("layout"):
+                for styled, item_area in zip(
+                    styled_items,
+                    controller.split_layout(
+                        viewport, direction, gap, constraints
+                    ),
+                ):
+                    controller._paint(styled, item_area)
+                controller.paint_stage()
             controller.commit()
+            self._mark_rendered()
             return
         content = (
             styled_items[0]
@@ -489,8 +800,58 @@ class Runtime(Generic[StateT]):
                 background=background,
                 padding=padding,
             )
-        node = lower_content(content)
-        self._session.render(node)
+        with self._phase("lower"):
+            node = lower_content(content)
+        if self._stats is not None:
+            self._stats.count(nodes=1, lowered=1)
+        with self._phase("native_render"):
+            self._session.render(node)
+        self._mark_rendered()
+
+    def request_render(self) -> None:
+        """Ask the run loop to paint on its next iteration.
+
+        Field assignments, dispatched input, fired hooks, and ``call_soon``
+        callbacks request frames automatically; call this after changing
+        something the runtime cannot observe, such as a component's
+        private attribute, when ``render_on_demand`` is enabled.
+        """
+        self._render_requested = True
+
+    def _render_due(self) -> bool:
+        """Return whether the run loop should paint this iteration.
+
+        Always true unless ``render_on_demand`` is set. Otherwise a frame
+        is due when one was requested since the last paint, an effect is
+        still animating, or the viewport changed size.
+        """
+        if not self._render_on_demand or self._render_requested:
+            return True
+        if self.is_animating():
+            return True
+        return self.size != self._rendered_size
+
+    def _mark_rendered(self) -> None:
+        """Settle pending frame requests and the event batch after a paint.
+
+        Mutations made while painting (``grid_render``, ``@on_state``
+        hooks) are already reflected in the frame just committed, so
+        requests raised during the paint are dropped with it.
+        """
+        self._render_requested = False
+        self._rendered_size = self.size
+        self._hit_index = None
+        if self._stats is not None:
+            self._stats.end_frame(events=self._batch_events)
+        recorder = self._recorder
+        if recorder is not None:
+            recorder.frame(
+                "\n".join(self._session.buffer_snapshot().to_string_lines())
+                if recorder.frames
+                else None
+            )
+        self._frame_event_count = self._batch_events
+        self._batch_events = 0
 
     def render(
         self,
@@ -536,19 +897,30 @@ class Runtime(Generic[StateT]):
             gap=gap,
             direction=direction,
         )
-        return self._snapshot_frame()
+        if self._stats is None:
+            return self._snapshot_frame()
+        started = time.perf_counter()
+        frame = self._snapshot_frame()
+        self._stats.amend("snapshot", (time.perf_counter() - started) * 1000)
+        return frame
+
+    def render_diff(self, *renderables: Any, **options: Any) -> FrameDiff:
+        """Render one frame and return its changes since the last snapshot.
+
+        Accepts the same arguments as :meth:`render`. The first call, and
+        any call after a resize, describes every row.
+        """
+        previous = self._last_frame
+        return self.render(*renderables, **options).diff(previous)
 
     def _snapshot_frame(self) -> Frame:
         """Return the rendered native buffer as one public frame."""
         self._revision += 1
-        buffer = self._session.buffer_snapshot()
-        text = "\n".join(buffer.to_string_lines())
-        ansi = "\n".join(buffer.to_ansi_lines())
-        frame = Frame(
-            width=self.size[0],
-            height=self.size[1],
-            text=text,
-            ansi=ansi,
+        width, height = self.size
+        frame = Frame._from_buffer(
+            self._session.buffer_snapshot(),
+            width=width,
+            height=height,
             cursor_position=self.cursor.position,
             cursor_visible=self.cursor.visible,
             cursor_style=self.cursor.style,
@@ -557,6 +929,7 @@ class Runtime(Generic[StateT]):
             revision=self._revision,
         )
         self._frame_commands.clear()
+        self._last_frame = frame
         return frame
 
     def call_soon(self, callback: Callable[..., Any], *args: Any) -> None:
@@ -564,10 +937,14 @@ class Runtime(Generic[StateT]):
 
         Thread-safe: worker threads enqueue here and the runtime drains the
         queue on its own thread, so background work can mutate grid state
-        without racing the renderer.
+        without racing the renderer. A pump blocked waiting for input wakes
+        immediately instead of sitting out its timeout.
         """
         with self._call_soon_lock:
             self._call_soon_queue.append((callback, args))
+        waker = self._waker
+        if waker is not None:
+            waker.wake()
 
     def _drain_call_soon(self) -> None:
         """Run every queued ``call_soon`` callback on the UI thread."""
@@ -576,26 +953,105 @@ class Runtime(Generic[StateT]):
                 if not self._call_soon_queue:
                     return
                 callback, args = self._call_soon_queue.popleft()
+            self._render_requested = True
             callback(*args)
 
     def pump(self, timeout: float = 0.0) -> bool:
-        """Poll and dispatch at most one event."""
+        """Poll and dispatch input, then advance the runtime clock.
+
+        Dispatches at most one native event, or — with ``drain_events`` —
+        every event already pending, interleaved with queued ``call_soon``
+        callbacks, for up to one tick interval. Either way one tick follows,
+        so the caller paints a single frame for the whole batch. A
+        ``call_soon`` from another thread cuts the input wait short.
+        """
+        timeout_ms = self._pump_timeout_ms(timeout)
+        if timeout_ms:
+            self._ensure_waker()
+        with self._trace("pump"):
+            self._drain_call_soon()
+            if self._should_exit:
+                return False
+            event_count = self._poll_native_events(timeout_ms)
+            self._drain_call_soon()
+            return self._finish_pump(event_count)
+
+    async def pump_async(self, timeout: float = 0.0) -> bool:
+        """Await input like :meth:`pump` without blocking the event loop.
+
+        A live runtime waits on the terminal's input descriptor through the
+        running loop, bounded by the same timeout as :meth:`pump`, so other
+        coroutines run while the app is idle; the pending input is then
+        dispatched exactly as :meth:`pump` would.
+        """
+        timeout_ms = self._pump_timeout_ms(timeout)
+        if timeout_ms:
+            self._ensure_waker()
         self._drain_call_soon()
         if self._should_exit:
             return False
+        native_event = self._session.poll_event(0)
+        if native_event is None and not self._call_soon_queue:
+            with self._trace("wait"):
+                await self._wait_for_input(timeout_ms)
+        with self._trace("pump"):
+            self._drain_call_soon()
+            if self._should_exit:
+                return False
+            return self._finish_pump(self._poll_native_events(0, native_event))
+
+    _IDLE_WAIT_MS = 250
+
+    def _pump_timeout_ms(self, timeout: float) -> int:
+        """Return how long a pump may wait for input, in milliseconds.
+
+        A live pump waits one tick interval by default. Under
+        ``render_on_demand``, when no hook needs every tick and no effect is
+        running, it sleeps until the next ``@on_tick(interval)`` hook falls
+        due instead, capped at ``_IDLE_WAIT_MS``; input and ``call_soon``
+        still wake it at once.
+        """
         timeout_ms = max(0, int(timeout * 1000))
-        if self._live and timeout_ms == 0:
-            timeout_ms = self._tick_interval
-        native_event = self._session.poll_event(timeout_ms)
-        if native_event is not None:
-            self.dispatch(event_from_core(native_event))
-        elif self._root is not None:
-            from xnano.core.dispatch import dispatch_idle
-
-            dispatch_idle(self._root, self)
-        if self._root is not None:
-            from xnano.events import Event, TickEventData
+        if not self._live or timeout_ms:
+            return timeout_ms
+        timeout_ms = self._tick_interval
+        if (
+            self._render_on_demand
+            and self._root is not None
+            and not self.is_animating()
+        ):
+            from xnano.core.dispatch import next_tick_deadline
 
+            deadline = next_tick_deadline(self)
+            if deadline is not None:
+                now = self._elapsed_ms + (
+                    time.monotonic() * 1000 - self._last_tick_ms
+                )
+                timeout_ms = int(
+                    min(max(timeout_ms, deadline - now), self._IDLE_WAIT_MS)
+                )
+        return timeout_ms
+
+    def _finish_pump(self, event_count: int) -> bool:
+        """Run idle hooks when no input arrived, then dispatch one tick."""
+        if self._root is None:
+            return not self._should_exit
+        from xnano.core.dispatch import dispatch_idle
+        from xnano.events import TickEventData
+
+        tracer = self._tracer
+        if tracer is not None:
+            tracer.counter(
+                "runtime",
+                {
+                    "call_soon_queue": len(self._call_soon_queue),
+                    "batch_events": self._batch_events,
+                    "effects_running": int(self.is_animating()),
+                },
+            )
+        with self._phase("events"):
+            if not event_count:
+                dispatch_idle(self._root, self)
             now = time.monotonic() * 1000
             elapsed_ms = max(0, int(now - self._last_tick_ms))
             self._last_tick_ms = now
@@ -604,13 +1060,190 @@ class Runtime(Generic[StateT]):
             )
         return not self._should_exit
 
+    async def _wait_for_input(self, timeout_ms: int) -> None:
+        """Sleep until terminal input is readable or ``timeout_ms`` passes.
+
+        Offscreen sessions, and hosts without a pollable stdin, simply yield
+        for the timeout; the following zero-wait poll picks up anything the
+        native session queued meanwhile (resizes included).
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+        watched: list[int] = []
+        fds = [self._input_fd()]
+        if self._waker is not None:
+            fds.append(self._waker.fileno())
+        for fd in fds:
+            if fd is None:
+                continue
+            try:
+                loop.add_reader(fd, ready.set)
+            except (NotImplementedError, OSError, ValueError):
+                continue
+            watched.append(fd)
+        try:
+            await asyncio.wait_for(ready.wait(), timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for fd in watched:
+                loop.remove_reader(fd)
+            if self._waker is not None:
+                self._waker.clear()
+
+    def _input_fd(self) -> int | None:
+        """Return the descriptor live terminal input arrives on, if any."""
+        if not self._live or os.name == "nt":
+            return None
+        try:
+            if sys.stdin is not None and sys.stdin.isatty():
+                return sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            pass
+        return None
+
+    def _ensure_waker(self) -> _WakeHandle:
+        if self._waker is None:
+            self._waker = _WakeHandle()
+            if self._live:
+                # A resize must end the wait too, or the new size would
+                # only paint once input or the timeout arrives.
+                _resize_wakers.add(self._waker)
+        return self._waker
+
+    def _next_native_event(self, timeout_ms: int) -> Any:
+        """Return the next native event, waiting up to ``timeout_ms``.
+
+        With a wake handle the wait happens in ``select`` over the terminal
+        input descriptor and the handle, so ``call_soon`` and terminal
+        resizes (``SIGWINCH``) end it early.
+        Live hosts without a pollable descriptor fall back to the native
+        timed poll. Events the native reader already buffered are returned
+        before waiting.
+        """
+        waker = self._waker
+        if timeout_ms <= 0 or waker is None:
+            return self._session.poll_event(timeout_ms)
+        native_event = self._session.poll_event(0)
+        if native_event is not None or self._call_soon_queue:
+            return native_event
+        fd = self._input_fd()
+        if self._live and fd is None:
+            return self._session.poll_event(timeout_ms)
+        readers = [waker.fileno()] if fd is None else [fd, waker.fileno()]
+        try:
+            select.select(readers, [], [], timeout_ms / 1000)
+        except (OSError, ValueError):
+            return self._session.poll_event(timeout_ms)
+        waker.clear()
+        return self._session.poll_event(0)
+
+    def _poll_native_events(
+        self, timeout_ms: int, native_event: Any = None
+    ) -> int:
+        """Dispatch pending native events and return how many arrived.
+
+        The first poll waits up to ``timeout_ms`` unless ``native_event`` was
+        already read by the caller. A draining runtime then
+        keeps polling without waiting until the queue is empty or its
+        tick-interval budget is spent, coalesces the batch, and dispatches
+        what is left with queued ``call_soon`` callbacks in between, so a
+        burst of input never starves the next frame.
+        """
+        if native_event is None:
+            with self._trace("wait"):
+                native_event = self._next_native_event(timeout_ms)
+        if native_event is None:
+            return 0
+        with self._phase("events"):
+            return self._dispatch_native(native_event)
+
+    def _dispatch_native(self, native_event: Any) -> int:
+        if not self._drain_events:
+            self._batch_events += 1
+            self.dispatch(event_from_core(native_event))
+            return 1
+        deadline = time.monotonic() + self._tick_interval / 1000
+        events: list[Any] = []
+        while native_event is not None:
+            events.append(event_from_core(native_event))
+            if time.monotonic() >= deadline:
+                break
+            native_event = self._session.poll_event(0)
+        self._batch_events += len(events)
+        for event in self._coalesce_events(events):
+            self.dispatch(event)
+            if self._should_exit:
+                break
+            self._drain_call_soon()
+        return len(events)
+
+    def _coalesce_events(self, events: Sequence[Any]) -> list[Any]:
+        """Fold redundant pointer and resize events out of one batch.
+
+        Only the last resize survives, a run of hover moves keeps its final
+        position, and a run of same-direction wheel notches over one field
+        becomes a single event whose ``count`` carries the folded notches.
+        The folded run costs one hit test and one scroll-field move;
+        ``_dispatch`` still replays it to user hooks once per notch.
+        Everything else keeps its order, so hooks observe the same final
+        state with far fewer hit tests.
+        """
+        last_resize = max(
+            (
+                index
+                for index, event in enumerate(events)
+                if event.type == "resize"
+            ),
+            default=-1,
+        )
+        folded: list[Any] = []
+        run_key: Any = None
+        for index, event in enumerate(events):
+            if event.type == "resize" and index != last_resize:
+                continue
+            mouse = event.mouse_event
+            key = None
+            if mouse is not None and mouse.field is None:
+                if mouse.kind == "move":
+                    key = "move"
+                elif mouse.kind in ("scroll_up", "scroll_down"):
+                    hit = self._field_hit_at(mouse.x, mouse.y)
+                    key = (
+                        mouse.kind,
+                        None if hit is None else id(hit.grid),
+                        None if hit is None else hit.field_name,
+                    )
+            if key is not None and key == run_key:
+                count = mouse.count
+                if key != "move":
+                    count += folded[-1].mouse_event.count
+                folded[-1] = Event.from_data(
+                    dataclasses.replace(mouse, count=count)
+                )
+            else:
+                folded.append(event)
+            run_key = key
+        return folded
+
+    def _field_hit_at(self, x: int, y: int) -> Any:
+        """Return the topmost registered field hit under a cell, if any."""
+        from xnano.core.dispatch import hit_index
+
+        return hit_index(self).at(x, y)
+
     _WHEEL_STEP = 3
 
-    def _auto_scroll_wheel(self, hit: Any, field: Any, kind: str) -> None:
+    def _auto_scroll_wheel(
+        self, hit: Any, field: Any, kind: str, count: int = 1
+    ) -> None:
         """Move a scroll field's handle when the wheel turns over it.
 
         Wheel-to-scroll is free for any ``Field(scroll=...)``; user hooks can
-        still read/override the handle afterward.
+        still read/override the handle afterward. ``count`` is the number of
+        notches a coalesced wheel event folded in.
         """
         if not getattr(field, "scroll", None):
             return
@@ -618,7 +1251,7 @@ class Runtime(Generic[StateT]):
             return
         handle = hit.grid._grid_scroll_handle(hit.field_name)
         delta = -self._WHEEL_STEP if kind == "scroll_up" else self._WHEEL_STEP
-        handle.scroll(delta)
+        handle.scroll(delta * count)
         hit.grid.grid_mark_field_dirty(hit.field_name)
 
     def _click_to_focus(self, hit: Any, field: Any, kind: str) -> None:
@@ -654,6 +1287,23 @@ class Runtime(Generic[StateT]):
 
     def dispatch(self, event: Any) -> None:
         """Dispatch one event to the root grid or component."""
+        recorder = self._recorder
+        if recorder is not None:
+            with recorder.capture(event):
+                self._traced_dispatch(event)
+            return
+        self._traced_dispatch(event)
+
+    def _traced_dispatch(self, event: Any) -> None:
+        if self._tracer is None:
+            self._dispatch(event)
+            return
+        with self._tracer.span(
+            "dispatch", cat="events", args={"type": event.type}
+        ):
+            self._dispatch(event)
+
+    def _dispatch(self, event: Any) -> None:
         from xnano.core.dispatch import dispatch_event
         from xnano.utils.focus import (
             apply_text_keyboard,
@@ -664,32 +1314,33 @@ class Runtime(Generic[StateT]):
         )
 
         consumed = False
+        notches = 1
         mouse = getattr(event, "mouse_event", None)
         if mouse is not None and mouse.field is None:
-            from xnano.core.dispatch import iter_grids
-            from xnano.events import Event, MouseEventData
-
-            for grid in iter_grids(self._root):
-                for hit in reversed(getattr(grid, "_grid_field_hits", ())):
-                    if hit.area.contains((mouse.x, mouse.y)):
-                        field = hit.grid._grid_field_info(hit.field_name)
-                        self._auto_scroll_wheel(hit, field, mouse.kind)
-                        self._click_to_focus(hit, field, mouse.kind)
-                        component = getattr(hit.grid, hit.field_name, None)
-                        hover = getattr(component, "handle_hover", None)
-                        if callable(hover):
-                            hover(mouse.x, mouse.y)
-                        event = Event.from_data(
-                            MouseEventData(
-                                kind=mouse.kind,
-                                x=mouse.x,
-                                y=mouse.y,
-                                button=mouse.button,
-                                field=hit.field_name,
-                                group=field.group,
-                            )
-                        )
-                        break
+            from xnano.events import MouseEventData
+
+            hit = self._field_hit_at(mouse.x, mouse.y)
+            if hit is not None:
+                field = hit.grid._grid_field_info(hit.field_name)
+                self._auto_scroll_wheel(hit, field, mouse.kind, mouse.count)
+                self._click_to_focus(hit, field, mouse.kind)
+                component = getattr(hit.grid, hit.field_name, None)
+                hover = getattr(component, "handle_hover", None)
+                if callable(hover):
+                    hover(mouse.x, mouse.y)
+                event = Event.from_data(
+                    MouseEventData(
+                        kind=mouse.kind,
+                        x=mouse.x,
+                        y=mouse.y,
+                        button=mouse.button,
+                        field=hit.field_name,
+                        group=field.group,
+                    )
+                )
+            # The scroll field above moved by every folded notch at once;
+            # user hooks still see one wheel event per notch.
+            notches = mouse.count
         keyboard = getattr(event, "keyboard_event", None)
         if keyboard is not None:
             if keyboard.matches("ctrl+c"):
@@ -713,6 +1364,9 @@ class Runtime(Generic[StateT]):
         tick = getattr(event, "tick_event", None)
         if tick is not None:
             self._elapsed_ms += tick.elapsed_ms
+        else:
+            # Ticks request a frame only through the hooks they fire.
+            self._render_requested = True
         component = focused_component(self)
         if clipboard is not None and component is not None:
             paste_handler = getattr(component, "handle_paste", None)
@@ -720,11 +1374,12 @@ class Runtime(Generic[StateT]):
                 consumed = (
                     bool(paste_handler(clipboard.text or "")) or consumed
                 )
-        if self._root is not None and not consumed:
-            dispatch_event(self._root, self, event)
         root_dispatch = getattr(self._root, "dispatch_event", None)
-        if callable(root_dispatch):
-            root_dispatch(event, self)
+        for _ in range(notches):
+            if self._root is not None and not consumed:
+                dispatch_event(self._root, self, event)
+            if callable(root_dispatch):
+                root_dispatch(event, self)
 
     def play_effect(
         self,
@@ -8,6 +8,7 @@ Inspect keyboard, mouse, resize, focus, and clipboard events.
 from __future__ import annotations
 
 import dataclasses
+import functools
 from typing import Any, ClassVar, Literal, TypeAlias, cast
 
 from xnano_core.core import CoreEvent, CoreKeyBinding
@@ -62,6 +63,7 @@ _MODIFIER_KEY_NAMES: dict[str, tuple[str, ...]] = {
 """Physical key names a terminal may report for each bare modifier press."""
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_keyboard_binding(
     binding: str,
 ) -> tuple[frozenset[str], str]:
@@ -86,6 +88,68 @@ def normalize_keyboard_binding(
     )
 
 
+_NATIVE_MODIFIER_ALIASES = {"control": "ctrl", "shft": "shift"}
+_NATIVE_KEY_ALIASES = {
+    "esc": "escape",
+    "del": "delete",
+    "page_up": "pageup",
+    "page_down": "pagedown",
+    " ": "space",
+}
+_NATIVE_CODE_NAMES = {
+    "KeyCode.Enter": "enter",
+    "KeyCode.Esc": "escape",
+    "KeyCode.Backspace": "backspace",
+    "KeyCode.Tab": "tab",
+    "KeyCode.BackTab": "backtab",
+    "KeyCode.Up": "up",
+    "KeyCode.Down": "down",
+    "KeyCode.Left": "left",
+    "KeyCode.Right": "right",
+    "KeyCode.Home": "home",
+    "KeyCode.End": "end",
+    "KeyCode.PageUp": "pageup",
+    "KeyCode.PageDown": "pagedown",
+    "KeyCode.Insert": "insert",
+    "KeyCode.Delete": "delete",
+}
+"""Binding names of the native key codes a binding string can spell."""
+
+
+@functools.lru_cache(maxsize=1024)
+def binding_index_keys(
+    binding: str,
+) -> frozenset[tuple[frozenset[str], str]]:
+    """Return every normalized key a binding can match an event under.
+
+    Synthetic events compare :func:`normalize_keyboard_binding` tuples,
+    while native events follow the native parser's modifier and key
+    aliases (``"control+s"``, ``"page_up"``). Indexing a binding under
+    both keeps a hash lookup exact for either kind of event.
+
+    Args:
+        binding: Binding such as ``"ctrl+s"``.
+
+    Returns:
+        ``(modifiers, key)`` tuples to index the binding under.
+    """
+    parts = [part.strip().lower() for part in binding.split("+")]
+    key = parts[-1] if parts else ""
+    native = (
+        frozenset(
+            _NATIVE_MODIFIER_ALIASES.get(part, part) for part in parts[:-1]
+        ),
+        _NATIVE_KEY_ALIASES.get(key, key),
+    )
+    return frozenset((normalize_keyboard_binding(binding), native))
+
+
+@functools.lru_cache(maxsize=1024)
+def _core_key_binding(binding: str) -> CoreKeyBinding:
+    """Parse ``binding`` for native matching once per distinct string."""
+    return CoreKeyBinding.parse(binding)
+
+
 def parse_binding_tuple(
     binding: str,
 ) -> tuple[list[KeyboardModifier], str]:
@@ -223,6 +287,38 @@ class KeyboardEventData(AbstractEventData):
         key = self.key
         return key if isinstance(key, str) and len(key) == 1 else None
 
+    def _index_key(self) -> tuple[frozenset[str], str] | None:
+        """Return the key :func:`binding_index_keys` indexes this event by.
+
+        ``None`` when a native key has no binding name (function and media
+        keys), so callers must fall back to :meth:`matches` on every
+        candidate.
+        """
+        native: Any = self._native_event
+        if native is None:
+            return normalize_keyboard_binding(str(self.binding))
+        character = native.char()
+        if character:
+            key = _NATIVE_KEY_ALIASES.get(character, character.lower())
+        else:
+            name = _NATIVE_CODE_NAMES.get(str(native.code_name))
+            if name is None:
+                return None
+            key = name
+        modifiers = native.modifiers
+        return (
+            frozenset(
+                modifier
+                for modifier, held in (
+                    ("ctrl", modifiers.control()),
+                    ("alt", modifiers.alt()),
+                    ("shift", modifiers.shift()),
+                )
+                if held
+            ),
+            key,
+        )
+
     def _matches_bare_modifier(self, modifier: str) -> bool:
         """Return whether this event is a bare ``modifier`` key press.
 
@@ -262,9 +358,7 @@ class KeyboardEventData(AbstractEventData):
                 continue
             if native_event is not None:
                 try:
-                    if CoreKeyBinding.parse(str(binding)).matches(
-                        native_event
-                    ):
+                    if _core_key_binding(str(binding)).matches(native_event):
                         return True
                 except Exception:
                     continue
@@ -284,6 +378,9 @@ class MouseEventData(AbstractEventData):
         button: Button involved in the transition.
         field: Field under the pointer for synthetic or web input.
         group: Field group under the pointer.
+        count: Wheel notches folded into this event by input coalescing.
+            Internal to the runtime: hooks receive one event per notch,
+            each with ``count == 1``.
 
     Examples:
         ```python
@@ -305,6 +402,8 @@ class MouseEventData(AbstractEventData):
     """Field under the pointer."""
     group: str | None = None
     """Field group under the pointer."""
+    count: int = 1
+    """Wheel notches folded into this event."""
 
 
 @dataclasses.dataclass(slots=True, frozen=True)
@@ -602,6 +701,7 @@ __all__ = (
     "MouseEventKind",
     "ResizeEventData",
     "TickEventData",
+    "binding_index_keys",
     "event_from_core",
     "normalize_keyboard_binding",
     "parse_binding_tuple",
@@ -42,8 +42,10 @@ from xnano.area import (
     align_area,
 )
 from xnano.colors import ColorLike
+from xnano.core.dispatch import invalidate_grid_trees
 from xnano.core.interface import AbstractInterface
 from xnano.core.layout import LayoutConstraint
+from xnano.core.profiling import NO_PHASE
 from xnano.fields import (
     UNSET,
     ClassNameLike,
@@ -61,7 +63,10 @@ from xnano.types import (
     Side,
     SizingLike,
     frame_from_field,
+    is_component,
+    is_grid,
 )
+from xnano.utils.changes import publish_change
 from xnano.utils.deprecation import (
     resolve_color_alias,
     resolve_renamed_alias,
@@ -652,6 +657,21 @@ class _FactoryDefault:
 _FACTORY_DEFAULT = _FactoryDefault()
 
 
+def _is_tree_node(value: Any) -> bool:
+    """Return whether ``value`` shapes a grid tree or its focus targets."""
+    return is_grid(value) or is_component(value)
+
+
+def _invalidate_tree_swap(value: Any, previous: Any) -> None:
+    """Drop cached grid trees when a field swaps a grid or component.
+
+    Swapping a nested grid or component changes the cached grid tree and
+    its focus targets; every path that stores a field value checks here.
+    """
+    if _is_tree_node(value) or _is_tree_node(previous):
+        invalidate_grid_trees()
+
+
 def _build_grid_init(
     all_fields: dict[str, GridFieldInfo],
     defaults: dict[str, Any],
@@ -1049,6 +1069,7 @@ class BaseGrid(AbstractInterface, metaclass=_GridMeta):
     grid_settings: ClassVar[GridSettings] = {}
     """Class-level grid configuration, like Pydantic's ``model_config``."""
     _grid_strict: ClassVar[bool] = True
+    _publishes_changes: ClassVar[bool] = True
     _grid_fields: ClassVar[dict[str, GridFieldInfo]] = {}
     _grid_state_fields: ClassVar[dict[str, GridFieldInfo]] = {}
     _grid_field_handlers: ClassVar[dict[str, Any]] = {}
@@ -1169,6 +1190,8 @@ class BaseGrid(AbstractInterface, metaclass=_GridMeta):
             validated = self._grid_validate_field(name, value, field=field)
             if validated is not value:
                 object.__setattr__(self, name, validated)
+                publish_change(self, name)
+                _invalidate_tree_swap(validated, value)
 
     def __setattr__(self, name: str, value: Any) -> None:
         field = self._grid_state_fields.get(name)
@@ -1178,7 +1201,13 @@ class BaseGrid(AbstractInterface, metaclass=_GridMeta):
             value = _coerce_text_field(
                 value, self._grid_field_annotations.get(name)
             )
+        is_field = name in self._grid_fields
+        previous = self.__dict__.get(name) if is_field else None
         object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            publish_change(self, name)
+        if is_field:
+            _invalidate_tree_swap(value, previous)
         # Live FieldState dirty bit + host notification (skip private attrs
         # and fields not yet tracked during construction).
         if not name.startswith("_") and hasattr(self, "_grid_field_states"):
@@ -1221,18 +1250,21 @@ class BaseGrid(AbstractInterface, metaclass=_GridMeta):
         )
 
         runtime = get_active_runtime()
-        if runtime is None or (
-            get_function_extra_parameter_count(type(self).grid_render) == 0
-        ):
+        if runtime is None:
             self.grid_render()
             return
-        from xnano.context import Context
-        from xnano.core.dispatch import _CONTEXT_EVENT
+        arity = get_function_extra_parameter_count(type(self).grid_render)
+        with runtime._phase("grid_render"):
+            if arity == 0:
+                self.grid_render()
+                return
+            from xnano.context import Context
+            from xnano.core.dispatch import _CONTEXT_EVENT
 
-        context = Context(
-            event=_CONTEXT_EVENT, terminal=runtime, state=runtime.state
-        )
-        invoke_hook(self.grid_render, None, context)
+            context = Context(
+                event=_CONTEXT_EVENT, terminal=runtime, state=runtime.state
+            )
+            invoke_hook(self.grid_render, None, context)
 
     def grid_render(self) -> None:
         """Called each frame before layout.
@@ -1807,7 +1839,10 @@ class BaseGrid(AbstractInterface, metaclass=_GridMeta):
             field = self._grid_field_info(name)
             if self._grid_strict:
                 value = self._grid_validate_field(name, value, field=field)
+            previous = self.__dict__.get(name)
             object.__setattr__(self, name, value)
+            publish_change(self, name)
+            _invalidate_tree_swap(value, previous)
 
     def grid_update_field(
         self,
@@ -2066,12 +2101,19 @@ class BaseGrid(AbstractInterface, metaclass=_GridMeta):
         responsive = type(self)._grid_responsive_renders
         if responsive:
             self._grid_render_responsive(responsive, area)
-        self._grid_assemble(
-            area,
-            session,
-            suppress_frame_border=suppress_frame_border,
-            base_z=base_z,
+        tracer = getattr(getattr(session, "runtime", None), "_tracer", None)
+        span = (
+            NO_PHASE
+            if tracer is None
+            else tracer.span(f"assemble {type(self).__name__}", cat="layout")
         )
+        with span:
+            self._grid_assemble(
+                area,
+                session,
+                suppress_frame_border=suppress_frame_border,
+                base_z=base_z,
+            )
 
     def _grid_render_responsive(
         self, responsive: dict[str, str], area: Area
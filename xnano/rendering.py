@@ -81,15 +81,17 @@ def _plain_render_size(
         isinstance(value, (str, int, float, bool)) for value in renderables
     ):
         return None
-    groups = [str(value).splitlines() or [""] for value in renderables]
-    widths = [max(map(len, lines), default=0) for lines in groups]
-    heights = [len(lines) for lines in groups]
+    from xnano.utils.measure import text_size
+
+    sizes = [text_size(str(value)) for value in renderables]
+    widths = [width for width, _ in sizes]
+    heights = [height for _, height in sizes]
     if direction == "horizontal":
-        width = sum(widths) + max(0, len(groups) - 1) * gap
+        width = sum(widths) + max(0, len(sizes) - 1) * gap
         height = max(heights, default=1)
     else:
         width = max(widths, default=1)
-        height = sum(heights) + max(0, len(groups) - 1) * gap
+        height = sum(heights) + max(0, len(sizes) - 1) * gap
 
     from xnano.area import Padding
 
@@ -8,8 +8,9 @@ or models when you need a fixed schema).
 
 from __future__ import annotations
 
-from typing import Any, get_type_hints
+from typing import Any, ClassVar, get_type_hints
 
+from xnano.utils.changes import publish_change
 from xnano.utils.validation import validate_type
 
 
@@ -34,6 +35,7 @@ class State:
     """
 
     _state_annotations: dict[str, Any] = {}
+    _publishes_changes: ClassVar[bool] = True
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -79,6 +81,7 @@ class State:
             return
         validated = self._state_validate_value(name, value)
         object.__setattr__(self, name, validated)
+        publish_change(self, name)
 
     def __getattr__(self, name: str) -> Any:
         raise AttributeError(
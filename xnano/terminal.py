@@ -7,8 +7,9 @@ Run grids and components in live or offscreen terminal sessions.
 
 from __future__ import annotations
 
+import os
 import sys
-from typing import Any, Generic, Sequence, TypeVar
+from typing import Any, Callable, Generic, Sequence, TypeVar
 
 from xnano.area import Alignment, PaddingLike, VerticalAlignment
 from xnano.colors import ColorLike
@@ -39,6 +40,24 @@ class Terminal(Generic[StateT]):
     events — required for click-to-focus and ``@on_click``/``@on_mouse``
     hooks; it is off by default so a keyboard-only app pays nothing.
 
+    Pass ``render_on_demand=True`` to paint only when something changed —
+    a field assignment, dispatched input, a fired hook, a ``call_soon``
+    callback, a resize, or a running effect — so an idle app stops
+    rebuilding identical frames every tick. Pass ``drain_events=True`` to
+    dispatch every pending input event before the next frame, so a paste or
+    a held key costs one frame per batch rather than one per event.
+
+    Pass ``profile=True`` to record per-phase timings for recent frames in
+    ``terminal.runtime.stats`` and per-hook wall times in
+    ``terminal.runtime.hook_stats``; summaries are logged to
+    ``xnano.profile`` when the terminal closes. ``hook_budget_ms`` turns
+    on hook accounting alone and warns through ``xnano.hooks`` whenever a
+    hook runs longer than the budget. Pass ``trace="trace.json"`` to write a
+    Chrome / Perfetto trace of the session when the terminal closes, and
+    ``record="session.jsonl"`` to save its input stream for
+    :func:`xnano.core.recording.replay`; add ``record_frames=True`` to also
+    store a digest of every painted frame for the replay to check.
+
     Attributes:
         runtime: Runtime owned by the terminal.
         state: Application state shared with event hooks.
@@ -65,11 +84,25 @@ class Terminal(Generic[StateT]):
         title: str | None = None,
         tick_interval: int = 16,
         mouse_events: bool = False,
+        render_on_demand: bool = False,
+        drain_events: bool = False,
+        profile: bool = False,
+        hook_budget_ms: float | None = None,
+        trace: str | os.PathLike[str] | None = None,
+        record: str | os.PathLike[str] | None = None,
+        record_frames: bool = False,
     ) -> None:
         self._state = state
         self._title = title
         self._tick_interval = tick_interval
         self._mouse_events = mouse_events
+        self._render_on_demand = render_on_demand
+        self._drain_events = drain_events
+        self._profile = profile
+        self._hook_budget_ms = hook_budget_ms
+        self._trace = trace
+        self._record = record
+        self._record_frames = record_frames
         self._runtime: Runtime[StateT] | None = None
         self.surface = "terminal"
 
@@ -81,14 +114,35 @@ class Terminal(Generic[StateT]):
         rows: int = 12,
         state: StateT | None = None,
         title: str | None = None,
+        render_on_demand: bool = False,
+        profile: bool = False,
+        hook_budget_ms: float | None = None,
+        trace: str | os.PathLike[str] | None = None,
+        record: str | os.PathLike[str] | None = None,
+        record_frames: bool = False,
     ) -> "Terminal[StateT]":
         """Create a terminal backed by an in-memory cell buffer."""
-        terminal = cls(state=state, title=title)
+        terminal = cls(
+            state=state,
+            title=title,
+            render_on_demand=render_on_demand,
+            profile=profile,
+            hook_budget_ms=hook_budget_ms,
+            trace=trace,
+            record=record,
+            record_frames=record_frames,
+        )
         terminal._runtime = Runtime.offscreen(
             cols,
             rows,
             state=state,
             title=title,
+            render_on_demand=render_on_demand,
+            profile=profile,
+            hook_budget_ms=hook_budget_ms,
+            trace=trace,
+            record=record,
+            record_frames=record_frames,
         )
         terminal.surface = "offscreen"
         return terminal
@@ -112,11 +166,24 @@ class Terminal(Generic[StateT]):
                 title=self._title,
                 tick_interval=self._tick_interval,
                 mouse_events=self._mouse_events,
+                render_on_demand=self._render_on_demand,
+                drain_events=self._drain_events,
+                profile=self._profile,
+                hook_budget_ms=self._hook_budget_ms,
+                trace=self._trace,
+                record=self._record,
+                record_frames=self._record_frames,
             ).enter()
         else:
             self._runtime = Runtime.offscreen(
                 state=self._state,
                 title=self._title,
+                render_on_demand=self._render_on_demand,
+                profile=self._profile,
+                hook_budget_ms=self._hook_budget_ms,
+                trace=self._trace,
+                record=self._record,
+                record_frames=self._record_frames,
             )
             self.surface = "offscreen"
         return self._runtime
@@ -293,36 +360,106 @@ class Terminal(Generic[StateT]):
             new="horizontal_align",
             stacklevel=3,
         )
-        runtime = self._ensure_runtime(live=True)
-        if renderables:
-            runtime.set_root(renderables[0] if len(renderables) == 1 else None)
-        live = runtime.is_live
-        render_frame = runtime._render if live else runtime.render
+        runtime, paint = self._run_painter(
+            renderables,
+            foreground=foreground,
+            background=background,
+            modifiers=modifiers,
+            horizontal_align=horizontal_align,
+            vertical_align=vertical_align,
+            border=border,
+            border_sides=border_sides,
+            border_color=border_color,
+            title=title,
+            title_position=title_position,
+            padding=padding,
+            gap=gap,
+            direction=direction,
+        )
         try:
             while True:
-                render_frame(
-                    *renderables,
-                    foreground=foreground,
-                    background=background,
-                    modifiers=modifiers,
-                    horizontal_align=horizontal_align,
-                    vertical_align=vertical_align,
-                    border=border,
-                    border_sides=border_sides,
-                    border_color=border_color,
-                    title=title,
-                    title_position=title_position,
-                    padding=padding,
-                    gap=gap,
-                    direction=direction,
-                )
-                if live:
-                    runtime._frame_commands.clear()
+                paint()
                 if not runtime.pump():
                     break
         finally:
             self.close()
 
+    async def run_async(
+        self,
+        *renderables: Any,
+        foreground: ColorLike | None = None,
+        background: ColorLike | None = None,
+        modifiers: Sequence[CharacterModifier] | None = None,
+        horizontal_align: Alignment | None = None,
+        vertical_align: VerticalAlignment | None = None,
+        border: Border | None = None,
+        border_sides: Sequence[Side] | None = None,
+        border_color: ColorLike | None = None,
+        title: str | None = None,
+        title_position: FrameTitlePosition | None = None,
+        padding: PaddingLike | None = None,
+        gap: int = 0,
+        direction: Direction = "vertical",
+        color: ColorLike | None = None,
+        align: Alignment | None = None,
+    ) -> None:
+        """Run like :meth:`run` without blocking the running event loop.
+
+        Input waits go through :meth:`Runtime.pump_async`, so other
+        coroutines on the same loop keep running between frames. Accepts
+        the same arguments as :meth:`run`.
+        """
+        foreground = resolve_color_alias(foreground, color, stacklevel=3)
+        horizontal_align = resolve_renamed_alias(
+            horizontal_align,
+            align,
+            old="align",
+            new="horizontal_align",
+            stacklevel=3,
+        )
+        runtime, paint = self._run_painter(
+            renderables,
+            foreground=foreground,
+            background=background,
+            modifiers=modifiers,
+            horizontal_align=horizontal_align,
+            vertical_align=vertical_align,
+            border=border,
+            border_sides=border_sides,
+            border_color=border_color,
+            title=title,
+            title_position=title_position,
+            padding=padding,
+            gap=gap,
+            direction=direction,
+        )
+        try:
+            while True:
+                paint()
+                if not await runtime.pump_async():
+                    break
+        finally:
+            self.close()
+
+    def _run_painter(
+        self, renderables: Sequence[Any], **options: Any
+    ) -> tuple[Runtime[StateT], Callable[[], None]]:
+        """Bind the run-loop runtime and a callable that paints due frames."""
+        runtime = self._ensure_runtime(live=True)
+        if renderables:
+            runtime.set_root(renderables[0] if len(renderables) == 1 else None)
+        live = runtime.is_live
+        render_frame = runtime._render if live else runtime.render
+
+        def paint() -> None:
+            if not runtime._render_due():
+                return
+            render_frame(*renderables, **options)
+            if live:
+                runtime._frame_commands.clear()
+
+        return runtime, paint
+
     def request_exit(self) -> None:
         """Stop the active run loop."""
         if self._runtime is not None:
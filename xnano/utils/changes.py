@@ -0,0 +1,71 @@
+"""xnano.utils.changes
+
+---
+
+Change notifications pushed by ``State`` and ``BaseGrid`` setters.
+
+Every runtime owns one :class:`ChangeSet`. Assigning a public attribute
+on a publishing object (a class with a true ``_publishes_changes``
+attribute) adds ``(id(owner), name)`` to each live change set, so a
+bare-name ``@on_state``/``@on_field`` watcher only re-reads its value on
+frames where that attribute was actually assigned.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+_CHANGE_SETS: weakref.WeakSet[ChangeSet] = weakref.WeakSet()
+"""Change sets of every live runtime."""
+
+
+class ChangeSet:
+    """Attributes assigned on publishing objects since the last frame.
+
+    Example:
+        >>> changes = ChangeSet()
+        >>> owner = object()
+        >>> publish_change(owner, "count")
+        >>> changes.changed(owner, "count")
+        True
+        >>> _ = changes.take()
+        >>> changes.changed(owner, "count")
+        False
+    """
+
+    __slots__ = ("_pending", "__weakref__")
+
+    def __init__(self) -> None:
+        self._pending: set[tuple[int, str]] = set()
+        _CHANGE_SETS.add(self)
+
+    def changed(self, owner: Any, name: str) -> bool:
+        """Return whether ``owner.name`` was assigned since the last take."""
+        return (id(owner), name) in self._pending
+
+    def close(self) -> None:
+        """Stop collecting; the owning runtime has closed."""
+        _CHANGE_SETS.discard(self)
+        self._pending.clear()
+
+    def take(self) -> set[tuple[int, str]]:
+        """Return the pending changes and start collecting afresh."""
+        pending, self._pending = self._pending, set()
+        return pending
+
+
+def publish_change(owner: Any, name: str) -> None:
+    """Record that ``owner.name`` was assigned, for every live runtime.
+
+    Args:
+        owner: Object whose attribute changed.
+        name: Attribute name.
+    """
+    if _CHANGE_SETS:
+        key = (id(owner), name)
+        for change_set in _CHANGE_SETS:
+            change_set._pending.add(key)
+
+
+__all__ = ("ChangeSet", "publish_change")
@@ -7,15 +7,32 @@ Invoke synchronous and asynchronous hooks with supported signatures.
 
 from __future__ import annotations
 
+import collections
+import contextvars
 import inspect
 import logging
-from typing import TYPE_CHECKING, Any, Awaitable, Coroutine, cast
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    cast,
+)
 
 from xnano.core.exceptions import Exit
+from xnano.core.profiling import NO_PHASE
 from xnano.utils.introspection import get_function_extra_parameter_count
 
 if TYPE_CHECKING:
+    import asyncio
+    import concurrent.futures
+
     from xnano.context import Context
+    from xnano.core.profiling import HookStats, TraceRecorder
+    from xnano.core.runtime import Runtime
 
 
 _logger = logging.getLogger("xnano.hooks")
@@ -57,6 +74,343 @@ def run_awaitable(awaitable: Awaitable[Any]) -> Any:
     )
 
 
+class _Step:
+    """One coroutine step handed from the hook loop to its home thread."""
+
+    __slots__ = (
+        "action",
+        "args",
+        "context",
+        "done",
+        "error",
+        "inline",
+        "result",
+    )
+
+    def __init__(
+        self,
+        context: contextvars.Context,
+        action: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        self.context = context
+        self.action = action
+        self.args = args
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+        self.inline = False
+        self.result: Any = None
+
+    def run(self, loop: "asyncio.AbstractEventLoop") -> Any:
+        """Run the step with ``loop`` reported as the running loop."""
+        import asyncio
+
+        previous = asyncio._get_running_loop()
+        asyncio._set_running_loop(loop)
+        try:
+            return self.context.run(self.action, *self.args)
+        finally:
+            asyncio._set_running_loop(previous)
+
+
+class _SteppedCoroutine(Coroutine[Any, Any, Any]):
+    """Coroutine proxy whose body advances on the hook loop's home thread.
+
+    The loop's task drives the proxy as usual, so awaited futures, timers,
+    and sockets stay on the loop; each ``send`` or ``throw`` that resumes
+    the wrapped coroutine is handed to :meth:`HookLoop.run_steps` instead.
+    """
+
+    def __init__(
+        self,
+        hooks: "HookLoop",
+        coroutine: Coroutine[Any, Any, Any],
+        context: contextvars.Context,
+    ) -> None:
+        self._hooks = hooks
+        self._coroutine = coroutine
+        self._context = context
+
+    def send(self, value: Any) -> Any:
+        return self._hooks._step(self._context, self._coroutine.send, value)
+
+    def throw(self, error: Any, *args: Any) -> Any:
+        return self._hooks._step(
+            self._context, self._coroutine.throw, error, *args
+        )
+
+    def close(self) -> None:
+        self._coroutine.close()
+
+    def __await__(self) -> "_SteppedCoroutine":
+        return self
+
+    def __next__(self) -> Any:
+        return self.send(None)
+
+
+class HookLoop:
+    """Long-lived asyncio loop that awaits async hooks for the UI thread.
+
+    A runtime owns one ``HookLoop`` and submits every async ``@on_*``
+    result to it, so clients, pools, and tasks created by one hook call
+    stay usable in the next instead of dying with a per-call loop. The
+    loop runs on a worker thread that starts on first use, but hook bodies
+    do not: every resumption of a submitted coroutine is queued back for
+    :meth:`run_steps`, which the owner calls on its UI thread (``wake``
+    tells it when), so a hook's field writes never race a paint. Each
+    coroutine runs in a copy of the submitting thread's context, so
+    ``get_active_runtime`` still resolves.
+
+    Args:
+        wake: Called from the loop thread whenever a step is queued.
+    """
+
+    def __init__(self, wake: Callable[[], None] | None = None) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._closing = False
+        self._wake = wake
+        self._steps: collections.deque[_Step] = collections.deque()
+        self._ready = threading.Event()
+        self._stepping = threading.local()
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker thread has started and not been closed."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _ensure_loop(self) -> "asyncio.AbstractEventLoop":
+        import asyncio
+
+        with self._lock:
+            if self._closing:
+                raise RuntimeError("hook loop is closed")
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                thread = threading.Thread(
+                    target=self._serve,
+                    args=(loop, ready),
+                    name="xnano-hooks",
+                    daemon=True,
+                )
+                thread.start()
+                ready.wait()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    def _serve(
+        self, loop: "asyncio.AbstractEventLoop", ready: threading.Event
+    ) -> None:
+        import asyncio
+
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        while not self._closing:
+            try:
+                loop.run_forever()
+            except BaseException:
+                # KeyboardInterrupt / SystemExit raised by a hook escape its
+                # task; the task's future already carries them back to the
+                # submitter, so keep serving the remaining hooks.
+                continue
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(
+                asyncio.gather(*pending, return_exceptions=True)
+            )
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+    def _step(
+        self,
+        context: contextvars.Context,
+        action: Callable[..., Any],
+        *args: Any,
+    ) -> Any:
+        """Run one coroutine step on the home thread and wait for it.
+
+        Called by a task on the loop thread, which blocks until the step
+        is done, so the loop's own state is never touched from two
+        threads at once. Once the loop is closing, steps run inline so
+        cancellation can unwind without a home thread.
+        """
+        step = _Step(context, action, args)
+        with self._lock:
+            queued = not self._closing
+            if queued:
+                self._steps.append(step)
+        if queued:
+            self._ready.set()
+            if self._wake is not None:
+                self._wake()
+            step.done.wait()
+        if not queued or step.inline:
+            return context.run(action, *args)
+        if step.error is not None:
+            raise step.error
+        return step.result
+
+    def run_steps(self) -> None:
+        """Resume every coroutine step queued for the home thread."""
+        loop = self._loop
+        while loop is not None:
+            with self._lock:
+                if not self._steps:
+                    return
+                step = self._steps.popleft()
+            self._stepping.active = True
+            try:
+                step.result = step.run(loop)
+            except BaseException as error:
+                # The error is handed to the loop thread. Keep only the
+                # coroutine's own frames, or the traceback would pin the
+                # whole UI stack (and the runtime on it) to that thread.
+                trace = error.__traceback__
+                while trace is not None and trace.tb_frame.f_code in _STEPS:
+                    trace = trace.tb_next
+                step.error = error.with_traceback(trace)
+            finally:
+                self._stepping.active = False
+                step.done.set()
+
+    def submit(
+        self, awaitable: Awaitable[Any]
+    ) -> "concurrent.futures.Future[Any]":
+        """Schedule ``awaitable`` on the hook loop.
+
+        Args:
+            awaitable: A coroutine or other awaitable returned by a hook.
+
+        Returns:
+            A thread-safe future resolved with the awaitable's outcome.
+        """
+        import concurrent.futures
+
+        loop = self._ensure_loop()
+        future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+        context = contextvars.copy_context()
+
+        async def _drive() -> Any:
+            return await awaitable
+
+        coroutine = _SteppedCoroutine(
+            self,
+            awaitable if inspect.iscoroutine(awaitable) else _drive(),
+            context,
+        )
+
+        def _settle(task: "asyncio.Task[Any]") -> None:
+            if task.cancelled():
+                future.cancel()
+            elif task.exception() is not None:
+                future.set_exception(task.exception())
+            else:
+                future.set_result(task.result())
+            self._ready.set()
+
+        def _start() -> None:
+            task = loop.create_task(coroutine)
+            task.add_done_callback(_settle)
+
+        loop.call_soon_threadsafe(_start)
+        return future
+
+    def run(self, awaitable: Awaitable[Any]) -> Any:
+        """Run ``awaitable`` on the hook loop and block for its result.
+
+        The calling thread serves as the home thread while it waits, so
+        the coroutine's body runs here.
+
+        Raises:
+            RuntimeError: If called from the hook loop's own thread or from
+                inside a hook step, which would wait on itself forever.
+        """
+        if threading.current_thread() is self._thread or getattr(
+            self._stepping, "active", False
+        ):
+            raise RuntimeError(
+                "cannot block on the hook loop from one of its own hooks"
+            )
+        future = self.submit(awaitable)
+        while True:
+            self._ready.clear()
+            self.run_steps()
+            if future.done():
+                return future.result()
+            self._ready.wait()
+
+    def close(self) -> None:
+        """Cancel outstanding hooks and stop the worker thread."""
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            loop, thread = self._loop, self._thread
+            abandoned = list(self._steps)
+            self._steps.clear()
+        for step in abandoned:
+            step.inline = True
+            step.done.set()
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread() and not getattr(
+            self._stepping, "active", False
+        ):
+            thread.join()
+
+
+_STEPS = (HookLoop.run_steps.__code__, _Step.run.__code__)
+"""Home-thread frames that run a step, trimmed from its tracebacks."""
+
+
+def _finish_hook(future: "concurrent.futures.Future[Any]", name: str) -> None:
+    """Surface a scheduled async hook's failure on the UI thread."""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is None:
+        return
+    if isinstance(error, Exception):
+        _logger.error(
+            "Uncaught exception in hook %s",
+            name,
+            exc_info=(type(error), error, error.__traceback__),
+        )
+    raise error
+
+
+def _await_hook(awaitable: Awaitable[Any], name: str, *, wait: bool) -> Any:
+    """Hand an async hook result to the active runtime's hook loop.
+
+    Without an open runtime the awaitable is driven inline by
+    :func:`run_awaitable`. With one it is awaited on ``runtime.hook_loop``
+    while its body resumes on the UI thread. ``wait``, or an offscreen
+    runtime, blocks for the result; otherwise the future is returned and
+    its completion is applied on the UI thread through ``call_soon``.
+    """
+    from xnano.core.runtime import get_active_runtime
+
+    runtime: Runtime[Any] | None = get_active_runtime()
+    if runtime is None or runtime._closed:
+        return run_awaitable(awaitable)
+    if wait or not runtime.is_live:
+        # Offscreen runtimes (tests, replay, perform) stay deterministic:
+        # the hook has finished by the time its dispatch returns.
+        return runtime.hook_loop.run(awaitable)
+    future = runtime.hook_loop.submit(awaitable)
+    future.add_done_callback(
+        lambda done: runtime.call_soon(_finish_hook, done, name)
+    )
+    return future
+
+
 def _call_hook(handler: Any, bound_self: Any, ctx: "Context[Any]") -> Any:
     """Invoke ``handler`` with the right arity (sync call only).
 
@@ -81,19 +435,41 @@ def _call_hook(handler: Any, bound_self: Any, ctx: "Context[Any]") -> Any:
     return handler(ctx)
 
 
-def invoke_hook(handler: Any, bound_self: Any, ctx: "Context[Any]") -> Any:
+def invoke_hook(
+    handler: Any,
+    bound_self: Any,
+    ctx: "Context[Any]",
+    *,
+    wait: bool = True,
+) -> Any:
     """Invoke ``handler`` with the right arity, awaiting async results.
 
+    Async results run on the active runtime's persistent hook loop
+    (inline without one). With ``wait=False`` the call returns a
+    ``concurrent.futures.Future`` instead of blocking for the result.
+
     Uncaught exceptions (other than ``Exit`` / ``KeyboardInterrupt`` /
     ``SystemExit``) are logged at ERROR and re-raised so the run loop
-    can restore the host terminal on the way out.
+    can restore the host terminal on the way out. A scheduled hook's
+    exception is re-raised from the runtime's next ``call_soon`` drain.
+
+    When the context's runtime keeps ``hook_stats``, the time the call
+    holds the calling thread is recorded there — for a scheduled async
+    hook, only the dispatch, since its body runs on the hook loop. While
+    the runtime is tracing, the call is also recorded as a ``hook`` span.
     """
     name = getattr(handler, "__qualname__", repr(handler))
+    runtime = getattr(ctx, "terminal", None)
+    stats: HookStats | None = getattr(runtime, "_hook_stats", None)
+    tracer: TraceRecorder | None = getattr(runtime, "_tracer", None)
+    started = time.perf_counter() if stats is not None else 0.0
+    span = NO_PHASE if tracer is None else tracer.span(name, cat="hook")
     try:
-        result = _call_hook(handler, bound_self, ctx)
-        if inspect.isawaitable(result):
-            return run_awaitable(result)
-        return result
+        with span:
+            result = _call_hook(handler, bound_self, ctx)
+            if inspect.isawaitable(result):
+                return _await_hook(result, name, wait=wait)
+            return result
     except Exit:
         raise
     except (KeyboardInterrupt, SystemExit):
@@ -101,6 +477,21 @@ def invoke_hook(handler: Any, bound_self: Any, ctx: "Context[Any]") -> Any:
     except Exception:
         _logger.exception("Uncaught exception in hook %s", name)
         raise
+    finally:
+        if stats is not None:
+            stats.record(
+                _hook_key(handler, bound_self),
+                (time.perf_counter() - started) * 1000,
+            )
+
+
+def _hook_key(handler: Any, bound_self: Any) -> tuple[str, str]:
+    """Return the ``(grid class, hook name)`` a hook is accounted under."""
+    owner = getattr(handler, "__self__", None)
+    if owner is None:
+        owner = bound_self
+    owner_name = type(owner).__name__ if owner is not None else ""
+    return owner_name, getattr(handler, "__name__", repr(handler))
 
 
-__all__ = ("invoke_hook", "run_awaitable")
+__all__ = ("HookLoop", "invoke_hook", "run_awaitable")
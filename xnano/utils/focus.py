@@ -31,32 +31,47 @@ def field_group(grid: Any, field_name: str) -> str | None:
     return None if info is None else info.group
 
 
-def _walk_grids(root: Any):
-    """Yield a grid and its nested grid field values."""
-    if not is_grid(root):
-        return
-    yield root
-    for name in root._grid_fields:
-        child = getattr(root, name, None)
-        yield from _walk_grids(child)
-
-
 def collect_focusable_fields(terminal: Any) -> list[FieldFocus]:
-    """Collect focusable fields from the runtime's root grid."""
-    root = getattr(terminal, "_root", None)
-    targets: list[FieldFocus] = []
-    for grid in _walk_grids(root):
+    """Collect focusable fields from the runtime's root grid.
+
+    Which fields can take focus is cached on the runtime's grid tree, so
+    repeated focus operations between grid-field assignments reuse one walk.
+    A component's ``focusable`` flag can change in place, so it is read
+    fresh on every call.
+    """
+    from xnano.core.dispatch import grid_tree
+
+    tree = grid_tree(terminal)
+    if tree.focus_fields is None:
+        tree.focus_fields = tuple(_collect_focus_fields(tree.grids))
+    return [
+        target
+        for target, always in tree.focus_fields
+        if always
+        or get_focusable_component(target.grid, target.field_name) is not None
+    ]
+
+
+def _collect_focus_fields(grids: Any) -> list[tuple[FieldFocus, bool]]:
+    """Collect fields that can take focus from already-flattened grids."""
+    fields: list[tuple[FieldFocus, bool]] = []
+    for grid in grids:
+        if not is_grid(grid):
+            continue
         for name, info in grid._grid_fields.items():
-            component = get_focusable_component(grid, name)
-            if component is not None or info.autofocus or info.group:
-                targets.append(
-                    FieldFocus(
-                        grid=grid,
-                        field_name=name,
-                        group=info.group,
+            always = bool(info.autofocus or info.group)
+            if always or is_component(getattr(grid, name, None)):
+                fields.append(
+                    (
+                        FieldFocus(
+                            grid=grid,
+                            field_name=name,
+                            group=info.group,
+                        ),
+                        always,
                     )
                 )
-    return targets
+    return fields
 
 
 def collect_group_targets(terminal: Any) -> dict[str, FieldFocus]:
@@ -196,11 +211,19 @@ def spatial_focus_enabled(terminal: Any) -> bool:
     app uses ``Field(autofocus=True)`` somewhere, so apps that bind arrow keys
     themselves keep their behavior.
     """
-    for target in collect_focusable_fields(terminal):
-        info = target.grid._grid_field_info(target.field_name)
-        if getattr(info, "autofocus", False):
-            return True
-    return False
+    from xnano.core.dispatch import grid_tree
+
+    tree = grid_tree(terminal)
+    if tree.autofocus is None:
+        tree.autofocus = any(
+            getattr(
+                target.grid._grid_field_info(target.field_name),
+                "autofocus",
+                False,
+            )
+            for target in collect_focusable_fields(terminal)
+        )
+    return tree.autofocus
 
 
 def _target_area(target: FieldFocus) -> Any | None:
@@ -4,19 +4,21 @@
 
 Hook signature inspection and safe state-expression evaluation.
 
-State/field expressions (``@on_state("count > 0")``) are evaluated by
-walking a parsed AST with a small, fixed set of operators rather than
-calling ``eval``: names resolve only against the supplied namespace,
-calls are limited to a whitelist of pure builtins, and attribute access
-to dunder names is refused. There is no code execution path, so a
-crafted expression can read declared state but cannot reach the
-interpreter.
+State/field expressions (``@on_state("count > 0")``) are compiled once
+from their parsed AST into closures over a small, fixed set of operators
+rather than passed to ``eval``: names resolve only against the supplied
+namespace, calls are limited to a whitelist of pure builtins, and
+attribute access to dunder names is refused. There is no code execution
+path, so a crafted expression can read declared state but cannot reach
+the interpreter. Each compiled expression also records the names it
+reads, so a frame whose inputs are unchanged can skip evaluating it.
 """
 
 from __future__ import annotations
 
 import ast
 import collections.abc
+import dataclasses
 import inspect
 import operator
 from typing import Any, Callable, TypeVar
@@ -30,6 +32,8 @@ _PARSED_EXPRESSION_CACHE: dict[str, ast.Expression | None] = {}
 """Parsed ``eval``-mode AST trees for ``evaluate_state_expression``, keyed
 by expression source. ``None`` marks a source that failed to parse, so a
 persistently invalid expression is not re-parsed on every call."""
+_COMPILED_EXPRESSION_CACHE: dict[str, CompiledExpression | None] = {}
+"""Compiled closures keyed by expression source, ``None`` for bad source."""
 _STATE_SAFE_BUILTINS: dict[str, Any] = {
     "len": len,
     "str": str,
@@ -82,6 +86,9 @@ class _UnsupportedExpression(Exception):
     """Raised when an expression uses a construct outside the safe set."""
 
 
+_MISSING = object()
+
+
 def get_compiled_state_expression(expression: str) -> ast.Expression | None:
     """Return the cached parsed AST for ``expression``.
 
@@ -105,90 +112,301 @@ def get_compiled_state_expression(expression: str) -> ast.Expression | None:
     return tree
 
 
-def _evaluate_node(node: ast.AST, names: dict[str, Any]) -> Any:
-    """Evaluate one AST node against ``names`` within the safe subset."""
-    if isinstance(node, ast.Constant):
-        return node.value
-    if isinstance(node, ast.Name):
-        if node.id in names:
-            return names[node.id]
-        if node.id in _STATE_SAFE_BUILTINS:
-            return _STATE_SAFE_BUILTINS[node.id]
-        raise _UnsupportedExpression(f"unknown name {node.id!r}")
-    if isinstance(node, ast.BoolOp):
-        values = node.values
-        if isinstance(node.op, ast.And):
+_Evaluator = Callable[[Any, Any], Any]
+"""A compiled expression node, called with the namespace and the target."""
+
+
+def _refuse(message: str) -> _Evaluator:
+    """Compile a construct outside the safe set into one that raises.
+
+    Refusal waits for evaluation, as the tree walk did, so a refused branch
+    that short-circuiting never reaches does not fail the expression.
+    """
+
+    def refused(names: Any, target: Any) -> Any:
+        raise _UnsupportedExpression(message)
+
+    return refused
+
+
+def _compile_name(name: str) -> _Evaluator:
+    """Compile a bare name: the target, a state value, or a safe builtin."""
+    if name == "state":
+        return lambda names, target: target
+    builtin = _STATE_SAFE_BUILTINS.get(name, _MISSING)
+
+    def read(names: Any, target: Any) -> Any:
+        if name in names:
+            return names[name]
+        if builtin is not _MISSING:
+            return builtin
+        raise _UnsupportedExpression(f"unknown name {name!r}")
+
+    return read
+
+
+def _compile_bool(node: ast.BoolOp) -> _Evaluator:
+    """Compile ``and``/``or`` with Python's short-circuit result."""
+    parts = tuple(_compile_node(value) for value in node.values)
+    if isinstance(node.op, ast.And):
+
+        def evaluate_and(names: Any, target: Any) -> Any:
             result: Any = True
-            for value in values:
-                result = _evaluate_node(value, names)
+            for part in parts:
+                result = part(names, target)
                 if not result:
                     return result
             return result
-        result = False
-        for value in values:
-            result = _evaluate_node(value, names)
+
+        return evaluate_and
+
+    def evaluate_or(names: Any, target: Any) -> Any:
+        result: Any = False
+        for part in parts:
+            result = part(names, target)
             if result:
                 return result
         return result
-    if isinstance(node, ast.UnaryOp):
-        handler = _UNARY_OPERATORS.get(type(node.op))
-        if handler is None:
-            raise _UnsupportedExpression("unsupported unary operator")
-        return handler(_evaluate_node(node.operand, names))
-    if isinstance(node, ast.BinOp):
-        handler = _BINARY_OPERATORS.get(type(node.op))
-        if handler is None:
-            raise _UnsupportedExpression("unsupported binary operator")
-        return handler(
-            _evaluate_node(node.left, names),
-            _evaluate_node(node.right, names),
+
+    return evaluate_or
+
+
+def _compile_compare(node: ast.Compare) -> _Evaluator:
+    """Compile a (possibly chained) comparison to a ``bool``."""
+    first = _compile_node(node.left)
+    pairs = tuple(
+        (_COMPARE_OPERATORS.get(type(op)), _compile_node(comparator))
+        for op, comparator in zip(node.ops, node.comparators)
+    )
+    if len(pairs) == 1 and pairs[0][0] is not None:
+        handler, second = pairs[0]
+        return lambda names, target: bool(
+            handler(first(names, target), second(names, target))
         )
-    if isinstance(node, ast.Compare):
-        left = _evaluate_node(node.left, names)
-        for op, comparator in zip(node.ops, node.comparators):
-            handler = _COMPARE_OPERATORS.get(type(op))
+
+    def compare(names: Any, target: Any) -> bool:
+        left = first(names, target)
+        for handler, comparator in pairs:
             if handler is None:
                 raise _UnsupportedExpression("unsupported comparison")
-            right = _evaluate_node(comparator, names)
+            right = comparator(names, target)
             if not handler(left, right):
                 return False
             left = right
         return True
+
+    return compare
+
+
+def _compile_call(node: ast.Call) -> _Evaluator:
+    """Compile a call, which may only target a safe builtin."""
+    function = node.func
+    if not isinstance(function, ast.Name):
+        return _refuse("only builtin calls are allowed")
+    target_function = _STATE_SAFE_BUILTINS.get(function.id)
+    if target_function is None or node.keywords:
+        return _refuse(f"call to {function.id!r} refused")
+    arguments = tuple(_compile_node(arg) for arg in node.args)
+    return lambda names, target: target_function(
+        *(argument(names, target) for argument in arguments)
+    )
+
+
+def _compile_node(node: ast.AST) -> _Evaluator:
+    """Compile one AST node into a closure within the safe subset."""
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda names, target: value
+    if isinstance(node, ast.Name):
+        return _compile_name(node.id)
+    if isinstance(node, ast.BoolOp):
+        return _compile_bool(node)
+    if isinstance(node, ast.UnaryOp):
+        unary = _UNARY_OPERATORS.get(type(node.op))
+        if unary is None:
+            return _refuse("unsupported unary operator")
+        operand = _compile_node(node.operand)
+        return lambda names, target: unary(operand(names, target))
+    if isinstance(node, ast.BinOp):
+        binary = _BINARY_OPERATORS.get(type(node.op))
+        if binary is None:
+            return _refuse("unsupported binary operator")
+        left = _compile_node(node.left)
+        right = _compile_node(node.right)
+        return lambda names, target: binary(
+            left(names, target), right(names, target)
+        )
+    if isinstance(node, ast.Compare):
+        return _compile_compare(node)
     if isinstance(node, ast.Subscript):
-        return _evaluate_node(node.value, names)[
-            _evaluate_node(node.slice, names)
+        container = _compile_node(node.value)
+        index = _compile_node(node.slice)
+        return lambda names, target: container(names, target)[
+            index(names, target)
         ]
     if isinstance(node, ast.Attribute):
         if node.attr.startswith("_"):
-            raise _UnsupportedExpression("private attribute access refused")
-        return getattr(_evaluate_node(node.value, names), node.attr)
+            return _refuse("private attribute access refused")
+        owner = _compile_node(node.value)
+        attribute = node.attr
+        return lambda names, target: getattr(owner(names, target), attribute)
     if isinstance(node, ast.Call):
-        function = node.func
-        if not isinstance(function, ast.Name):
-            raise _UnsupportedExpression("only builtin calls are allowed")
-        target = _STATE_SAFE_BUILTINS.get(function.id)
-        if target is None or node.keywords:
-            raise _UnsupportedExpression(f"call to {function.id!r} refused")
-        return target(*(_evaluate_node(arg, names) for arg in node.args))
-    if isinstance(node, ast.List):
-        return [_evaluate_node(item, names) for item in node.elts]
-    if isinstance(node, ast.Tuple):
-        return tuple(_evaluate_node(item, names) for item in node.elts)
-    if isinstance(node, ast.Set):
-        return {_evaluate_node(item, names) for item in node.elts}
+        return _compile_call(node)
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        items = tuple(_compile_node(item) for item in node.elts)
+        build: Callable[[Any], Any] = {
+            ast.List: list,
+            ast.Tuple: tuple,
+            ast.Set: set,
+        }[type(node)]
+        return lambda names, target: build(
+            item(names, target) for item in items
+        )
     if isinstance(node, ast.Dict):
-        return {
-            _evaluate_node(key, names): _evaluate_node(value, names)
+        entries = tuple(
+            (_compile_node(key), _compile_node(value))
             for key, value in zip(node.keys, node.values)
             if key is not None
+        )
+        return lambda names, target: {
+            key(names, target): value(names, target) for key, value in entries
         }
     if isinstance(node, ast.IfExp):
-        if _evaluate_node(node.test, names):
-            return _evaluate_node(node.body, names)
-        return _evaluate_node(node.orelse, names)
-    raise _UnsupportedExpression(
-        f"unsupported expression: {type(node).__name__}"
+        test = _compile_node(node.test)
+        body = _compile_node(node.body)
+        orelse = _compile_node(node.orelse)
+        return lambda names, target: (
+            body(names, target)
+            if test(names, target)
+            else orelse(names, target)
+        )
+    return _refuse(f"unsupported expression: {type(node).__name__}")
+
+
+def _read_names(tree: ast.Expression) -> tuple[str, ...] | None:
+    """Return the target names ``tree`` reads, in first-use order.
+
+    Called builtins are not reads. ``None`` means the expression reads the
+    ``state`` object itself, so any attribute may feed it.
+    """
+    callees = {
+        id(node.func) for node in ast.walk(tree) if isinstance(node, ast.Call)
+    }
+    names: dict[str, None] = {}
+    reads = sorted(
+        (
+            node
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Name) and id(node) not in callees
+        ),
+        key=lambda node: node.col_offset,
+    )
+    for node in reads:
+        if node.id == "state":
+            return None
+        names[node.id] = None
+    return tuple(names)
+
+
+def _expression_namespace(target: Any) -> Any:
+    """Return the mapping an expression's bare names resolve against.
+
+    Object attributes and ``dict``-style state keys are both exposed as
+    bare names, so ``@on_state("value")`` reads either ``state.value`` or
+    ``state["value"]`` without the caller having to know which.
+    """
+    if isinstance(target, collections.abc.Mapping):
+        return target
+    namespace = getattr(target, "__dict__", None)
+    return _EMPTY_NAMESPACE if namespace is None else namespace
+
+
+_EMPTY_NAMESPACE: dict[str, Any] = {}
+_STABLE_TYPES = frozenset({bool, bytes, complex, float, int, str, type(None)})
+"""Value types that cannot change in place, so equal inputs mean equal
+results."""
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CompiledExpression:
+    """A state/field expression compiled once into nested closures.
+
+    Attributes:
+        source: Expression source.
+        reference: Whether the source is a bare reference (see
+            :func:`is_reference_expression`).
+        names: Names the expression reads from its target, or ``None`` when
+            it reads ``state`` itself.
+        watches: The name a bare-name reference (``"count"``, not
+            ``"user.name"``) watches, or ``None``.
+    """
+
+    source: str
+    """Expression source."""
+    reference: bool
+    """Whether the source is a bare reference."""
+    names: tuple[str, ...] | None
+    """Names the expression reads from its target, or ``None``."""
+    watches: str | None
+    """Name a bare-name reference watches, or ``None``."""
+    function: _Evaluator = dataclasses.field(repr=False, compare=False)
+    """Compiled root node."""
+
+    def evaluate(self, target: Any) -> Any:
+        """Evaluate against ``target``, raising on any error."""
+        return self.function(_expression_namespace(target), target)
+
+    def inputs(self, target: Any) -> tuple[Any, ...] | None:
+        """Return the values this expression reads from ``target``.
+
+        Returns:
+            One value per name in :attr:`names` (``_MISSING`` for an absent
+            name), or ``None`` when a value could change in place, such as
+            a list or a nested object, so equal inputs would not prove an
+            equal result.
+        """
+        if self.names is None:
+            return None
+        namespace = _expression_namespace(target)
+        values = []
+        for name in self.names:
+            value = namespace.get(name, _MISSING)
+            if value is not _MISSING and type(value) not in _STABLE_TYPES:
+                return None
+            values.append(value)
+        return tuple(values)
+
+
+def compile_state_expression(expression: str) -> CompiledExpression | None:
+    """Return ``expression`` compiled to closures, cached by source.
+
+    Args:
+        expression: The expression source to compile.
+
+    Returns:
+        The compiled expression, or ``None`` when ``expression`` does not
+            parse.
+    """
+    if expression in _COMPILED_EXPRESSION_CACHE:
+        return _COMPILED_EXPRESSION_CACHE[expression]
+    tree = get_compiled_state_expression(expression)
+    compiled = (
+        None
+        if tree is None
+        else CompiledExpression(
+            source=expression,
+            reference=_is_reference_node(tree.body),
+            names=_read_names(tree),
+            watches=(
+                tree.body.id
+                if isinstance(tree.body, ast.Name) and tree.body.id != "state"
+                else None
+            ),
+            function=_compile_node(tree.body),
+        )
     )
+    _COMPILED_EXPRESSION_CACHE[expression] = compiled
+    return compiled
 
 
 def evaluate_state_expression(
@@ -197,10 +415,10 @@ def evaluate_state_expression(
 ) -> bool:
     """Evaluate ``expression`` against ``state``'s attributes.
 
-    Safe by construction — the expression is walked node by node over a
-    fixed operator/builtin set, never executed. Returns ``False`` on any
-    error, including an unknown name, an unsupported construct, or an
-    ``AttributeError``. The parse is cached by source, since hooks
+    Safe by construction — the expression is compiled over a fixed
+    operator/builtin set, never executed. Returns ``False`` on any error,
+    including an unknown name, an unsupported construct, or an
+    ``AttributeError``. The compiled form is cached by source, since hooks
     re-evaluate the same expression on every tick/frame.
 
     Args:
@@ -212,35 +430,15 @@ def evaluate_state_expression(
     """
     if state is None:
         return False
-    tree = get_compiled_state_expression(expression)
-    if tree is None:
+    compiled = compile_state_expression(expression)
+    if compiled is None:
         return False
     try:
-        return bool(_evaluate_node(tree.body, _build_expression_names(state)))
+        return bool(compiled.evaluate(state))
     except Exception:
         return False
 
 
-def _build_expression_names(state: Any) -> dict[str, Any]:
-    """Return the safe namespace an expression is evaluated against.
-
-    Object attributes and ``dict``-style state keys are both exposed as
-    bare names, so ``@on_state("value")`` reads either ``state.value`` or
-    ``state["value"]`` without the caller having to know which.
-    """
-    names: dict[str, Any] = {}
-    if isinstance(state, collections.abc.Mapping):
-        names.update(
-            (key, value)
-            for key, value in state.items()
-            if isinstance(key, str)
-        )
-    elif hasattr(state, "__dict__"):
-        names.update(vars(state))
-    names["state"] = state
-    return names
-
-
 def _is_reference_node(node: ast.AST) -> bool:
     """Return whether ``node`` is a bare reference with no computation.
 
@@ -264,11 +462,8 @@ def is_reference_expression(expression: str) -> bool:
     Bare references drive mutation-triggered hooks: the watcher fires when
     the referenced value changes rather than each frame it is truthy.
     """
-    tree = get_compiled_state_expression(expression)
-    return tree is not None and _is_reference_node(tree.body)
-
-
-_MISSING = object()
+    compiled = compile_state_expression(expression)
+    return compiled is not None and compiled.reference
 
 
 def evaluate_reference_value(expression: str, state: Any) -> Any:
@@ -279,11 +474,11 @@ def evaluate_reference_value(expression: str, state: Any) -> Any:
     missing attribute) resolves to ``_MISSING`` so the watcher simply
     holds its previous value instead of firing.
     """
-    tree = get_compiled_state_expression(expression)
-    if tree is None:
+    compiled = compile_state_expression(expression)
+    if compiled is None:
         return _MISSING
     try:
-        return _evaluate_node(tree.body, _build_expression_names(state))
+        return compiled.evaluate(state)
     except Exception:
         return _MISSING
 
@@ -366,6 +561,8 @@ def get_function_extra_parameter_count(function: Callable) -> int:
 
 
 __all__ = (
+    "CompiledExpression",
+    "compile_state_expression",
     "evaluate_reference_value",
     "evaluate_state_expression",
     "get_compiled_state_expression",
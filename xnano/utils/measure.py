@@ -0,0 +1,270 @@
+"""xnano.utils.measure
+
+---
+
+Terminal display width of text, shared by every layout path.
+
+Widths come from the renderer itself (ratatui's ``unicode-width``), so East
+Asian wide characters, emoji, and zero-width joiner sequences measure exactly
+as they paint. ASCII text, the common case, is measured with ``len`` and
+never crosses into the native extension; everything else is cached per text,
+in caches bounded by the total size of the text they hold.
+"""
+
+from __future__ import annotations
+
+import collections
+import functools
+import math
+import textwrap
+import threading
+import unicodedata
+from typing import Any, Callable, TypeVar
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_CACHE_SIZE = 4096
+"""Entries kept by each measurement cache."""
+
+_CACHE_CHARACTERS = 1 << 20
+"""Characters of text each measurement cache holds, summed over its keys."""
+
+_ZERO_WIDTH_JOINER = "\u200d"
+
+
+def text_cache(
+    characters: int, maxsize: int = _CACHE_SIZE
+) -> Callable[[_F], _F]:
+    """Memoize a function of ``(text, *args)``, bounded by total text size.
+
+    An entry bound alone lets a growing log fill a cache with near-identical
+    copies of itself, so entries are also evicted, oldest first, once their
+    texts add up to more than ``characters``. The newest entry always stays:
+    one oversized text is still measured only once.
+
+    Example:
+        >>> @text_cache(8)
+        ... def shout(text: str) -> str:
+        ...     return text.upper()
+        >>> shout("abcdef"), shout("ghijkl"), shout.cache_len()
+        ('ABCDEF', 'GHIJKL', 1)
+    """
+
+    def decorate(function: _F) -> _F:
+        entries: collections.OrderedDict[tuple[Any, ...], Any] = (
+            collections.OrderedDict()
+        )
+        lock = threading.Lock()
+        held = 0
+
+        @functools.wraps(function)
+        def cached(text: str, *args: Any) -> Any:
+            nonlocal held
+            key = (text, *args)
+            with lock:
+                try:
+                    entries.move_to_end(key)
+                    return entries[key]
+                except KeyError:
+                    pass
+            result = function(text, *args)
+            with lock:
+                if key not in entries:
+                    entries[key] = result
+                    held += len(text)
+                    while len(entries) > 1 and (
+                        held > characters or len(entries) > maxsize
+                    ):
+                        evicted, _ = entries.popitem(last=False)
+                        held -= len(evicted[0])
+            return result
+
+        def cache_clear() -> None:
+            nonlocal held
+            with lock:
+                entries.clear()
+                held = 0
+
+        cached.cache_clear = cache_clear  # type: ignore[attr-defined]
+        cached.cache_len = entries.__len__  # type: ignore[attr-defined]
+        return cached  # type: ignore[return-value]
+
+    return decorate
+
+
+def cell_width(text: str) -> int:
+    """Return how many terminal cells one line of ``text`` occupies.
+
+    Example:
+        >>> cell_width("abc"), cell_width("日本"), cell_width("👍")
+        (3, 4, 2)
+    """
+    if text.isascii():
+        return len(text)
+    return _native_width(text)
+
+
+@text_cache(_CACHE_CHARACTERS)
+def _native_width(text: str) -> int:
+    """Return the renderer's width of non-ASCII ``text``."""
+    import xnano_core.rust.native as native
+
+    return native.Span.raw(text).width()
+
+
+def _extends_cluster(cluster: str, character: str) -> bool:
+    """Return whether ``character`` continues the grapheme ``cluster``."""
+    if cluster.endswith(_ZERO_WIDTH_JOINER):
+        return True
+    code = ord(character)
+    if (
+        character == _ZERO_WIDTH_JOINER
+        or 0xFE00 <= code <= 0xFE0F
+        or 0x1F3FB <= code <= 0x1F3FF
+        or 0xE0020 <= code <= 0xE007F
+        or 0xE0100 <= code <= 0xE01EF
+        or unicodedata.category(character) in ("Mn", "Me", "Mc")
+    ):
+        return True
+    if 0x1F1E6 <= code <= 0x1F1FF:
+        # Regional indicators pair into one flag.
+        return len(cluster) == 1 and 0x1F1E6 <= ord(cluster) <= 0x1F1FF
+    return False
+
+
+def graphemes(text: str) -> list[str]:
+    """Split ``text`` into the clusters a terminal paints as one glyph.
+
+    Combining marks, variation selectors, emoji modifiers and tags, zero
+    width joiner sequences, and regional-indicator flag pairs stay attached
+    to their base character.
+
+    Example:
+        >>> graphemes("👍🏽🇯🇵!")
+        ['👍🏽', '🇯🇵', '!']
+    """
+    if text.isascii():
+        return list(text)
+    clusters: list[str] = []
+    for character in text:
+        if clusters and _extends_cluster(clusters[-1], character):
+            clusters[-1] += character
+        else:
+            clusters.append(character)
+    return clusters
+
+
+@text_cache(_CACHE_CHARACTERS)
+def text_size(text: str) -> tuple[int, int]:
+    """Return ``(width, height)`` of unwrapped ``text`` in cells.
+
+    The width is the widest line; the height counts ``splitlines`` rows,
+    at least one.
+    """
+    lines = text.splitlines() or [""]
+    return max(map(cell_width, lines)), len(lines)
+
+
+def drop_cells(text: str, cells: int) -> str:
+    """Return one line of ``text`` without its leading ``cells`` columns.
+
+    A wide glyph cut in half becomes a space, so the rest of the line keeps
+    its columns.
+    """
+    if cells <= 0:
+        return text
+    if text.isascii():
+        return text[cells:]
+    clusters = graphemes(text)
+    skipped = 0
+    for index, cluster in enumerate(clusters):
+        if skipped >= cells:
+            return " " * (skipped - cells) + "".join(clusters[index:])
+        skipped += cell_width(cluster)
+    return " " * max(0, skipped - cells)
+
+
+@text_cache(_CACHE_CHARACTERS)
+def wrapped_line_count(text: str, width: int) -> int:
+    """Return how many rows ``text`` occupies when wrapped at ``width``.
+
+    ratatui wraps on word boundaries, so a raw ``splitlines()`` count is
+    short for any line longer than its slot. ASCII lines wrap through
+    ``textwrap``; other lines wrap greedily by display width, breaking
+    words longer than a row between grapheme clusters.
+
+    Example:
+        >>> wrapped_line_count("alpha beta gamma", 10)
+        2
+    """
+    lines = text.splitlines() or [""]
+    if width <= 0:
+        return len(lines)
+    total = 0
+    for line in lines:
+        if cell_width(line) <= width:
+            total += 1
+        elif line.isascii():
+            total += (
+                len(
+                    textwrap.wrap(
+                        line,
+                        width=width,
+                        break_long_words=True,
+                        break_on_hyphens=False,
+                    )
+                )
+                or 1
+            )
+        else:
+            total += _wrapped_rows(line, width)
+    return total
+
+
+def _wrapped_rows(line: str, width: int) -> int:
+    """Count greedy word-wrapped rows of one non-ASCII line."""
+    rows = 0
+    used = 0
+    for word in line.split():
+        size = cell_width(word)
+        if used and used + 1 + size <= width:
+            used += 1 + size
+            continue
+        if used:
+            rows += 1
+            used = 0
+        if size <= width:
+            used = size
+            continue
+        for cluster in graphemes(word):
+            cluster_width = cell_width(cluster)
+            if used + cluster_width > width and used:
+                rows += 1
+                used = 0
+            used += cluster_width
+    return max(1, rows + (1 if used else 0))
+
+
+def char_wrapped_row_count(text: str, width: int) -> int:
+    """Return rows ``text`` fills when every line breaks at ``width`` cells.
+
+    Matches editors that wrap anywhere rather than between words.
+    """
+    lines = text.split("\n")
+    if width <= 0:
+        return max(1, len(lines))
+    return max(
+        1,
+        sum(max(1, math.ceil(cell_width(line) / width)) for line in lines),
+    )
+
+
+__all__ = (
+    "cell_width",
+    "char_wrapped_row_count",
+    "drop_cells",
+    "graphemes",
+    "text_cache",
+    "text_size",
+    "wrapped_line_count",
+)